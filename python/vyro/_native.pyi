@@ -1,8 +1,59 @@
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterable, Mapping
+
+class PayloadTooLargeError(ValueError): ...
+
+class RequestBodyStream:
+    def __aiter__(self) -> AsyncIterator[bytes]: ...
+    async def __anext__(self) -> bytes: ...
+
+class NativeRequest:
+    @property
+    def headers(self) -> dict[str, str]: ...
+    @property
+    def query(self) -> dict[str, str]: ...
+    @property
+    def path_params(self) -> dict[str, str]: ...
+    @property
+    def body(self) -> bytes: ...
+    @property
+    def body_stream(self) -> RequestBodyStream | None: ...
+    @property
+    def trace_ids(self) -> tuple[str, str]: ...
+    def header(self, name: str) -> str | None: ...
+
+class HeaderSet:
+    def __init__(
+        self,
+        headers: HeaderSet | Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
+    ) -> None: ...
+    def merge(self, other: HeaderSet) -> HeaderSet: ...
+    def get(self, name: str) -> str | None: ...
+    def items(self) -> list[tuple[str, str]]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, name: str) -> bool: ...
+
+class Response:
+    def __init__(
+        self,
+        body: Any = None,
+        status: int = 200,
+        headers: HeaderSet | Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
+    ) -> None: ...
+    @property
+    def body(self) -> Any: ...
+    @property
+    def status(self) -> int: ...
+    @property
+    def headers(self) -> HeaderSet: ...
 
 def start_server(
     host: str,
     port: int,
     workers: int,
-    routes: list[tuple[str, str, Callable[[dict[str, Any]], Any]]],
+    routes: list[tuple[str, str, Callable[[NativeRequest], Any], dict[str, Any]]],
+    event_loops: int = 1,
+    response_cache_bytes: int = 0,
+    reuse_port: bool = False,
+    guards: dict[str, Any] | None = None,
+    metrics: dict[str, Any] | None = None,
 ) -> None: ...
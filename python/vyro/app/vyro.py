@@ -5,6 +5,7 @@ from typing import Any, Callable
 from vyro.middleware import Middleware
 from vyro.middleware.idempotency import IdempotencyKeyMiddleware
 from vyro.middleware.registry import MiddlewareRegistry
+from vyro.observability.metrics import MetricsRegistry
 from vyro.routing.registry import RouterRegistry
 from vyro.runtime.async_ops.cron import CronScheduler
 from vyro.runtime.async_ops.dead_letter import DeadLetterQueue, JobRetryExecutor
@@ -23,6 +24,7 @@ from vyro.runtime.edge.compression import ResponseCompressor
 from vyro.runtime.edge.etag import ETagManager
 from vyro.runtime.edge.grpc_gateway import GrpcGateway
 from vyro.runtime.edge.http_client import AsyncHttpClient
+from vyro.runtime.edge.outbound import OutboundPipeline
 from vyro.runtime.edge.http2 import Http2StreamManager
 from vyro.runtime.edge.multipart_parser import MultipartParser
 from vyro.runtime.edge.multipart_upload import MultipartUploadStream
@@ -108,6 +110,8 @@ class Vyro:
         self._schema_drift = components["schema_drift"]
         self._compression = components["compression"]
         self._cors = components["cors"]
+        self._native_guards: dict[str, Any] | None = None
+        self._native_metrics: dict[str, Any] | None = None
         self._csrf = components["csrf"]
         self._db_pools = components["db_pools"]
         self._dead_letter_queue = components["dead_letter_queue"]
@@ -117,6 +121,7 @@ class Vyro:
         self._feature_flags = components["feature_flags"]
         self._secrets = components["secrets"]
         self._response_cache = components["response_cache"]
+        self._response_cache.route_source = self._router.records
         self._saga = components["saga"]
         self._outbound_circuit_breaker = components["circuit_breaker"]
         self._outbound_bulkhead = components["bulkhead"]
@@ -134,6 +139,8 @@ class Vyro:
         version: str | None = None,
         deprecated: bool | str = False,
         tenant: str | None = None,
+        stream_body: bool = False,
+        max_body_bytes: int | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         routed_path, resolved_tenant = self._tenant_routing.apply(path, tenant)
         return self._router.add_route(
@@ -142,6 +149,8 @@ class Vyro:
             version=version,
             deprecated=deprecated,
             tenant=resolved_tenant,
+            stream_body=stream_body,
+            max_body_bytes=max_body_bytes,
         )
 
     def post(
@@ -151,6 +160,8 @@ class Vyro:
         version: str | None = None,
         deprecated: bool | str = False,
         tenant: str | None = None,
+        stream_body: bool = False,
+        max_body_bytes: int | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         routed_path, resolved_tenant = self._tenant_routing.apply(path, tenant)
         return self._router.add_route(
@@ -159,6 +170,8 @@ class Vyro:
             version=version,
             deprecated=deprecated,
             tenant=resolved_tenant,
+            stream_body=stream_body,
+            max_body_bytes=max_body_bytes,
         )
 
     def put(
@@ -168,6 +181,8 @@ class Vyro:
         version: str | None = None,
         deprecated: bool | str = False,
         tenant: str | None = None,
+        stream_body: bool = False,
+        max_body_bytes: int | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         routed_path, resolved_tenant = self._tenant_routing.apply(path, tenant)
         return self._router.add_route(
@@ -176,6 +191,8 @@ class Vyro:
             version=version,
             deprecated=deprecated,
             tenant=resolved_tenant,
+            stream_body=stream_body,
+            max_body_bytes=max_body_bytes,
         )
 
     def delete(
@@ -185,6 +202,8 @@ class Vyro:
         version: str | None = None,
         deprecated: bool | str = False,
         tenant: str | None = None,
+        stream_body: bool = False,
+        max_body_bytes: int | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         routed_path, resolved_tenant = self._tenant_routing.apply(path, tenant)
         return self._router.add_route(
@@ -193,6 +212,8 @@ class Vyro:
             version=version,
             deprecated=deprecated,
             tenant=resolved_tenant,
+            stream_body=stream_body,
+            max_body_bytes=max_body_bytes,
         )
 
     def websocket(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -354,6 +375,7 @@ class Vyro:
         self._secrets = manager
 
     def set_response_cache_service(self, service: ResponseCacheService) -> None:
+        service.route_source = self._router.records
         self._response_cache = service
 
     def set_saga_orchestrator(self, saga: SagaOrchestrator) -> None:
@@ -380,11 +402,92 @@ class Vyro:
     def set_transaction_scope(self, scope: TransactionScope) -> None:
         self._transaction = scope
 
+    def outbound_pipeline(self, *, hedge_after_sec: float | None = None) -> OutboundPipeline:
+        """Compose the configured client, discovery and resilience settings for outbound calls."""
+        return OutboundPipeline(
+            client=self._http_client,
+            discovery=self._discovery,
+            bulkhead=self._outbound_bulkhead,
+            retry=self._retry_policy,
+            breaker=self._outbound_circuit_breaker,
+            timeout_sec=self._timeout_budget.timeout_sec,
+            hedge_after_sec=hedge_after_sec,
+        )
+
+    def enable_native_guards(
+        self,
+        *,
+        cors: bool = False,
+        rate_limit_key: str | None = None,
+        backpressure: bool = False,
+    ) -> None:
+        """Enforce CORS preflight, rate limiting and backpressure natively.
+
+        The configured CORS profile, multi-key rate limiter and backpressure controller
+        are exported with the route plan and checked before Python is entered.
+        ``rate_limit_key`` is ``"client_ip"`` or ``"header:<name>"``.
+        """
+        spec: dict[str, Any] = {}
+        if cors:
+            spec["cors"] = self._cors.as_native()
+        if rate_limit_key is not None:
+            spec["rate_limit"] = self._multi_rate_limiter.as_native(rate_limit_key)
+        if backpressure:
+            spec["backpressure"] = self._backpressure.as_native()
+        self._native_guards = spec or None
+
+    def enable_native_metrics(
+        self,
+        *,
+        path: str = "/metrics",
+        registry: MetricsRegistry | None = None,
+        python_refresh_sec: float = 5.0,
+    ) -> None:
+        """Record per-route RED metrics natively and serve them at ``path``.
+
+        Request counts, 5xx errors, in-flight requests and latency histograms are kept
+        per (method, route template, status class) in the native server. When
+        ``registry`` is given its ``render_prometheus()`` output is appended to each
+        scrape, re-rendered at most every ``python_refresh_sec`` seconds.
+
+        ``path`` is answered before native guards, so keep it off the public listener
+        or behind a proxy. With ``run(processes=N)`` each worker keeps its own series and
+        labels them with its ``pid``; a scrape reaches one worker, so sum across ``pid``.
+        """
+        if not path.startswith("/"):
+            raise ValueError("metrics path must start with '/'")
+        if python_refresh_sec < 0:
+            raise ValueError("python_refresh_sec must be >= 0")
+        self._native_metrics = {
+            "path": path,
+            "render": registry.render_prometheus if registry is not None else None,
+            "python_refresh_sec": float(python_refresh_sec),
+        }
+
     def run(
         self,
         host: str = DEFAULT_HOST,
         port: int = DEFAULT_PORT,
         workers: int = DEFAULT_WORKERS,
+        processes: int = 1,
+        event_loops: int | None = None,
+        workload: str = "balanced",
     ) -> None:
-        compiled_plan = self._router.compile()
-        run_native_server(host, port, max(workers, 1), compiled_plan)
+        policy = self._response_cache.policy
+        compiled_plan = policy.apply_native(self._router.compile(self._middlewares))
+        execution = self._nogil_tuner.plan(
+            workers=workers,
+            event_loops=event_loops,
+            workload=workload,
+        )
+        run_native_server(
+            host,
+            port,
+            execution.tokio_worker_threads,
+            compiled_plan,
+            event_loops=execution.event_loops,
+            response_cache_bytes=policy.native_cache_bytes(),
+            processes=max(processes, 1),
+            guards=self._native_guards,
+            metrics=self._native_metrics,
+        )
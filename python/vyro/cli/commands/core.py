@@ -61,10 +61,21 @@ def run_server(
     host: str = typer.Option("127.0.0.1", "--host"),
     port: int = typer.Option(8000, "--port"),
     workers: int = typer.Option(1, "--workers"),
+    processes: int = typer.Option(
+        1,
+        "--processes",
+        help="Worker processes sharing the port via SO_REUSEPORT (POSIX only).",
+    ),
 ) -> None:
+    if processes < 1:
+        typer.echo("ERROR: --processes must be >= 1", err=True)
+        raise typer.Exit(code=2)
     vyro_app = load_vyro_app(app_target)
-    info(f"Starting Vyro app '{app_target}' on {host}:{port} with workers={workers}.")
-    vyro_app.run(host=host, port=port, workers=workers)
+    info(
+        f"Starting Vyro app '{app_target}' on {host}:{port} "
+        f"with workers={workers} processes={processes}."
+    )
+    vyro_app.run(host=host, port=port, workers=workers, processes=processes)
 
 
 @app.command("dev")
@@ -76,12 +87,12 @@ def dev_server(
     reload: bool = typer.Option(True, "--reload/--no-reload"),
 ) -> None:
     if not reload:
-        run_server(app_target=app_target, host=host, port=port, workers=workers)
+        run_server(app_target=app_target, host=host, port=port, workers=workers, processes=1)
         return
 
     if not require_module("watchfiles"):
         warn("watchfiles is not installed. Falling back to --no-reload mode.")
-        run_server(app_target=app_target, host=host, port=port, workers=workers)
+        run_server(app_target=app_target, host=host, port=port, workers=workers, processes=1)
         return
 
     from watchfiles import run_process
@@ -90,7 +101,13 @@ def dev_server(
     run_process(
         ".",
         target=run_server,
-        kwargs={"app_target": app_target, "host": host, "port": port, "workers": workers},
+        kwargs={
+            "app_target": app_target,
+            "host": host,
+            "port": port,
+            "workers": workers,
+            "processes": 1,
+        },
     )
 
 
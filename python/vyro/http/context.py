@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Any, Mapping
-from uuid import uuid4
+from typing import Any, AsyncIterator, Mapping
+
+from vyro.observability.ids import resolve_request_ids
 
 
 CORRELATION_ID_HEADER = "x-correlation-id"
@@ -13,35 +14,76 @@ TRACEPARENT_HEADER = "traceparent"
 
 @dataclass(slots=True)
 class Context:
-    headers: Mapping[str, str]
-    query: Mapping[str, str]
-    path_params: Mapping[str, str]
-    _body: bytes
-    _extensions: dict[str, Any]
+    _request: Any
+    _extensions: dict[str, Any] = field(default_factory=dict)
+    _headers: Mapping[str, str] | None = None
+    _query: Mapping[str, str] | None = None
+    _path_params: Mapping[str, str] | None = None
+    _ids: tuple[str, str] | None = None
+    # True when the request resolves ``trace_ids`` itself and its ``headers`` already
+    # carry them (the native request view and ``_PayloadRequest``).
+    _resolves_ids: bool = False
 
     @classmethod
-    def from_native(cls, payload: dict[str, Any]) -> "Context":
-        headers = {k.lower(): v for k, v in dict(payload.get("headers", {})).items()}
-        headers.setdefault(CORRELATION_ID_HEADER, uuid4().hex)
-        headers.setdefault(
-            TRACEPARENT_HEADER,
-            _build_traceparent(headers[CORRELATION_ID_HEADER]),
-        )
-        return cls(
-            headers=MappingProxyType(headers),
-            query=MappingProxyType(dict(payload.get("query", {}))),
-            path_params=MappingProxyType(dict(payload.get("path_params", {}))),
-            _body=payload.get("body", b""),
-            _extensions={},
-        )
+    def from_native(cls, payload: Any) -> "Context":
+        if isinstance(payload, dict):
+            return cls(_request=_PayloadRequest(payload), _resolves_ids=True)
+        return cls(_request=payload, _resolves_ids=hasattr(type(payload), "trace_ids"))
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        headers = self._headers
+        if headers is None:
+            if self._resolves_ids:
+                values = self._request.headers
+            else:
+                values = dict(self._request.headers)
+                values.setdefault(CORRELATION_ID_HEADER, self.correlation_id)
+                values.setdefault(TRACEPARENT_HEADER, self.traceparent)
+            headers = self._headers = MappingProxyType(values)
+        return headers
+
+    @property
+    def query(self) -> Mapping[str, str]:
+        query = self._query
+        if query is None:
+            query = self._query = MappingProxyType(self._request.query)
+        return query
+
+    @property
+    def path_params(self) -> Mapping[str, str]:
+        path_params = self._path_params
+        if path_params is None:
+            path_params = self._path_params = MappingProxyType(self._request.path_params)
+        return path_params
+
+    def header(self, name: str, default: str | None = None) -> str | None:
+        key = name.lower()
+        if self._headers is not None:
+            return self._headers.get(key, default)
+        if key == CORRELATION_ID_HEADER:
+            return self.correlation_id
+        if key == TRACEPARENT_HEADER:
+            return self.traceparent
+        value = self._request.header(key)
+        return default if value is None else value
 
     def body_bytes(self) -> bytes:
-        return self._body
+        if self._request.body_stream is not None:
+            raise RuntimeError("request body is streamed; iterate ctx.stream() instead")
+        return self._request.body
+
+    def stream(self) -> AsyncIterator[bytes]:
+        body_stream = self._request.body_stream
+        if body_stream is not None:
+            return body_stream
+        return _single_chunk(self._request.body)
 
     def json(self) -> Any:
-        if not self._body:
+        body = self.body_bytes()
+        if not body:
             return None
-        return json.loads(self._body.decode("utf-8"))
+        return json.loads(body.decode("utf-8"))
 
     def set_extension(self, key: str, value: Any) -> None:
         self._extensions[key] = value
@@ -55,14 +97,60 @@ class Context:
 
     @property
     def correlation_id(self) -> str:
-        return str(self.headers[CORRELATION_ID_HEADER])
+        return self._trace_ids()[0]
 
     @property
     def traceparent(self) -> str:
-        return str(self.headers[TRACEPARENT_HEADER])
+        return self._trace_ids()[1]
+
+    def _trace_ids(self) -> tuple[str, str]:
+        ids = self._ids
+        if ids is None:
+            request = self._request
+            if self._resolves_ids:
+                ids = request.trace_ids
+            else:
+                ids = resolve_request_ids(
+                    request.header(CORRELATION_ID_HEADER), request.header(TRACEPARENT_HEADER)
+                )
+            self._ids = ids
+        return ids
+
+
+class _PayloadRequest:
+    """Adapter exposing a plain context payload dict like the native request view."""
+
+    __slots__ = ("_headers", "_trace_ids", "query", "path_params", "body", "body_stream")
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._headers = {k.lower(): v for k, v in dict(payload.get("headers", {})).items()}
+        self._trace_ids: tuple[str, str] | None = None
+        self.query = dict(payload.get("query", {}))
+        self.path_params = dict(payload.get("path_params", {}))
+        self.body = payload.get("body", b"")
+        self.body_stream = payload.get("body_stream")
+
+    @property
+    def trace_ids(self) -> tuple[str, str]:
+        ids = self._trace_ids
+        if ids is None:
+            headers = self._headers
+            ids = self._trace_ids = resolve_request_ids(
+                headers.get(CORRELATION_ID_HEADER), headers.get(TRACEPARENT_HEADER)
+            )
+        return ids
+
+    @property
+    def headers(self) -> dict[str, str]:
+        correlation_id, traceparent = self.trace_ids
+        self._headers.setdefault(CORRELATION_ID_HEADER, correlation_id)
+        self._headers.setdefault(TRACEPARENT_HEADER, traceparent)
+        return self._headers
+
+    def header(self, name: str) -> str | None:
+        return self._headers.get(name.lower())
 
 
-def _build_traceparent(seed: str) -> str:
-    trace_id = (seed.replace("-", "") + uuid4().hex)[:32]
-    span_id = uuid4().hex[:16]
-    return f"00-{trace_id}-{span_id}-01"
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    if body:
+        yield body
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import importlib
 from dataclasses import dataclass, field
-from typing import Mapping
+from typing import Any, AsyncIterable, Mapping
 
 from .sse import SSEResponse
 
+# Native response descriptors, resolved on first access so importing vyro.http
+# does not require the compiled extension.
+_NATIVE_EXPORTS = frozenset({"HeaderSet", "Response"})
+
 
 @dataclass(slots=True)
 class ResponseView:
     status: int = 200
     headers: Mapping[str, str] = field(default_factory=dict)
-    body: bytes | str | dict | list | tuple | SSEResponse | None = b""
+    body: bytes | str | dict | list | tuple | SSEResponse | AsyncIterable[bytes] | None = b""
+
+
+def __getattr__(name: str) -> Any:
+    if name in _NATIVE_EXPORTS:
+        return getattr(importlib.import_module("vyro._native"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
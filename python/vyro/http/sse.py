@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
 
 
 @dataclass(slots=True)
@@ -35,6 +35,7 @@ class SSEResponse:
             "connection": "keep-alive",
         }
     )
+    source: AsyncIterable[SSEEvent | str] | None = None
 
     def send(
         self,
@@ -47,8 +48,21 @@ class SSEResponse:
         self.events.append(SSEEvent(data=data, event=event, id=id, retry_ms=retry_ms))
 
     def body_bytes(self) -> bytes:
+        if self.source is not None:
+            raise RuntimeError("streaming SSEResponse has no buffered body; iterate it instead")
         payload = "".join(event.encode() for event in self.events)
         return payload.encode("utf-8")
 
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for event in self.events:
+            yield event.encode().encode("utf-8")
+        if self.source is None:
+            return
+        async for item in self.source:
+            event = item if isinstance(item, SSEEvent) else SSEEvent(data=item)
+            yield event.encode().encode("utf-8")
+
     def as_tuple(self) -> tuple[Any, int, dict[str, str]]:
+        if self.source is not None:
+            return self.__aiter__(), self.status, self.headers
         return self.body_bytes(), self.status, self.headers
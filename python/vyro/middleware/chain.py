@@ -11,6 +11,10 @@ class MiddlewareChain:
         self._middlewares = list(middlewares or [])
         self._before_hooks, self._after_hooks = self._compile_hooks(self._middlewares)
 
+    @property
+    def is_empty(self) -> bool:
+        return not self._before_hooks and not self._after_hooks
+
     async def run_before(self, ctx: Any) -> None:
         for hook in self._before_hooks:
             await hook(ctx)
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 from .base import Middleware
 
+_PATH_MEMO_LIMIT = 4096
+
 
 class MiddlewareRegistry:
     def __init__(self) -> None:
         self._items: list[tuple[int, int, str | None, Middleware]] = []
+        self._ordered: list[tuple[int, int, str | None, Middleware]] | None = None
+        self._trie: _GroupTrie | None = None
+        self._by_path: dict[str, tuple[Middleware, ...]] = {}
         self._seq = 0
 
+    @property
+    def version(self) -> int:
+        """Bumped on every ``add``; lets compiled route plans detect stale chains."""
+        return self._seq
+
     def add(
         self,
         mw: Middleware,
@@ -17,18 +29,42 @@ class MiddlewareRegistry:
     ) -> None:
         value = _resolve_priority(mw, priority)
         self._items.append((value, self._seq, _normalize_group(group), mw))
+        self._ordered = None
+        self._trie = None
+        self._by_path.clear()
         self._seq += 1
 
     def items(self) -> list[Middleware]:
-        return [mw for _, _, _, mw in _ordered_items(self._items)]
+        return [mw for _, _, _, mw in self._ordered_items()]
 
     def items_for_path(self, path: str) -> list[Middleware]:
-        selected: list[Middleware] = []
-        for _, _, group, mw in _ordered_items(self._items):
-            if group is None or path.startswith(group):
-                selected.append(mw)
+        return list(self.ordered_for_path(path))
+
+    def ordered_for_path(self, path: str) -> tuple[Middleware, ...]:
+        """Ordered middlewares whose group prefixes ``path``, memoized per path.
+
+        A group matches its own path and everything below it on a segment boundary
+        (``/t1`` matches ``/t1/orders`` but not ``/t12``). Groups are indexed in a
+        segment trie, so selection is one walk over ``path`` regardless of how many
+        grouped middlewares are registered.
+        """
+        selected = self._by_path.get(path)
+        if selected is None:
+            trie = self._trie
+            if trie is None:
+                trie = self._trie = _GroupTrie.build(self._ordered_items())
+            selected = trie.select(path)
+            if len(self._by_path) >= _PATH_MEMO_LIMIT:
+                self._by_path.clear()
+            self._by_path[path] = selected
         return selected
 
+    def _ordered_items(self) -> list[tuple[int, int, str | None, Middleware]]:
+        ordered = self._ordered
+        if ordered is None:
+            ordered = self._ordered = _ordered_items(self._items)
+        return ordered
+
 
 def _resolve_priority(mw: Middleware, explicit: int | None) -> int:
     if explicit is not None:
@@ -51,3 +87,60 @@ def _ordered_items(
     items: list[tuple[int, int, str | None, Middleware]],
 ) -> list[tuple[int, int, str | None, Middleware]]:
     return sorted(items, key=lambda item: (item[0], item[1]))
+
+
+@dataclass(slots=True)
+class _GroupNode:
+    children: dict[str, _GroupNode] = field(default_factory=dict)
+    positions: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _GroupTrie:
+    """Path-segment trie over middleware groups.
+
+    Equivalent to ``path == group or path.startswith(group + "/")`` per group.
+    """
+
+    middlewares: tuple[Middleware, ...]
+    ungrouped: tuple[int, ...]
+    root: _GroupNode
+
+    @classmethod
+    def build(cls, ordered: list[tuple[int, int, str | None, Middleware]]) -> _GroupTrie:
+        root = _GroupNode()
+        ungrouped: list[int] = []
+        for position, (_, _, group, _) in enumerate(ordered):
+            if group is None:
+                ungrouped.append(position)
+                continue
+            node = root
+            for segment in _segments(group):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _GroupNode()
+                node = child
+            node.positions.append(position)
+        middlewares = tuple(mw for _, _, _, mw in ordered)
+        return cls(middlewares=middlewares, ungrouped=tuple(ungrouped), root=root)
+
+    def select(self, path: str) -> tuple[Middleware, ...]:
+        positions = list(self.ungrouped)
+        node = self.root
+        grouped = bool(node.positions)
+        positions.extend(node.positions)
+        for segment in _segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            if node.positions:
+                positions.extend(node.positions)
+                grouped = True
+        if grouped:
+            positions.sort()
+        return tuple(self.middlewares[position] for position in positions)
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
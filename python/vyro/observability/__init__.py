@@ -1,19 +1,62 @@
-from .latency import LatencyTracker
-from .logging import SamplingPolicy, emit_log, make_log_record, should_emit
-from .metrics import CounterMetric, MetricsRegistry, ThroughputTracker, create_default_registry
-from .tracing import Span, emit_span, export_span, start_span
+from .ids import new_span_id, new_trace_id, resolve_request_ids
+from .latency import LatencySnapshot, LatencyTracker, RouteLatencyTracker
+from .logging import (
+    LogPipeline,
+    SamplingPolicy,
+    configure_log_pipeline,
+    emit_log,
+    make_log_record,
+    should_emit,
+    shutdown_log_pipeline,
+)
+from .metrics import (
+    CounterMetric,
+    GaugeMetric,
+    HistogramMetric,
+    MetricFamily,
+    MetricsRegistry,
+    ThroughputTracker,
+    create_default_registry,
+)
+from .tracing import (
+    BatchSpanExporter,
+    CollectorSpanSink,
+    FileSpanSink,
+    Span,
+    StreamSpanSink,
+    Tracer,
+    emit_span,
+    export_span,
+    start_span,
+)
 
 __all__ = [
+    "BatchSpanExporter",
+    "CollectorSpanSink",
     "CounterMetric",
+    "FileSpanSink",
+    "GaugeMetric",
+    "HistogramMetric",
+    "LatencySnapshot",
     "LatencyTracker",
+    "LogPipeline",
+    "MetricFamily",
     "MetricsRegistry",
+    "RouteLatencyTracker",
     "SamplingPolicy",
     "ThroughputTracker",
+    "configure_log_pipeline",
     "create_default_registry",
     "emit_log",
     "make_log_record",
+    "new_span_id",
+    "new_trace_id",
+    "resolve_request_ids",
     "should_emit",
+    "shutdown_log_pipeline",
     "Span",
+    "StreamSpanSink",
+    "Tracer",
     "emit_span",
     "export_span",
     "start_span",
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import os
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+import weakref
+
+T = TypeVar("T")
+
+_live: weakref.WeakSet[BatchWriter[object]] = weakref.WeakSet()
+
+
+class BatchWriter(Generic[T]):
+    """Bounded queue drained in batches by a daemon writer thread.
+
+    ``write`` runs on the writer thread with up to ``batch_size`` items, once that
+    many are queued or ``flush_interval_sec`` has passed. The thread starts on the
+    first ``put``. A forked child gets a fresh lock, an empty queue and no thread
+    (the parent still writes what it had queued), and every live writer is drained
+    at interpreter exit.
+    """
+
+    __slots__ = (
+        "capacity",
+        "batch_size",
+        "flush_interval_sec",
+        "dropped",
+        "_write",
+        "_name",
+        "_queue",
+        "_cond",
+        "_thread",
+        "_writing",
+        "_closed",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        write: Callable[[list[T]], None],
+        *,
+        capacity: int,
+        batch_size: int,
+        flush_interval_sec: float,
+        name: str,
+    ) -> None:
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.dropped = 0
+        self._write = write
+        self._name = name
+        self._queue: deque[T] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._writing = False
+        self._closed = False
+        _live.add(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: T, *, block_timeout_sec: float = 0.0) -> bool:
+        """Queue ``item``; when full, wait up to ``block_timeout_sec`` then drop it."""
+        with self._cond:
+            if block_timeout_sec > 0 and len(self._queue) >= self.capacity:
+                deadline = time.monotonic() + block_timeout_sec
+                while len(self._queue) >= self.capacity and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            if self._closed or len(self._queue) >= self.capacity:
+                self.dropped += 1
+                return False
+            self._queue.append(item)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout_sec: float = 5.0) -> bool:
+        """Wait until every queued item is written; ``False`` on timeout."""
+        deadline = time.monotonic() + timeout_sec
+        with self._cond:
+            self._cond.notify_all()
+            while self._queue or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        """Write what is queued and stop the writer thread; later ``put`` calls drop."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout_sec)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if len(self._queue) < self.batch_size and not self._closed:
+                    self._cond.wait(self.flush_interval_sec)
+                if not self._queue:
+                    if self._closed:
+                        return
+                    continue
+                count = min(len(self._queue), self.batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._writing = True
+                # Blocked producers can refill the space just freed.
+                self._cond.notify_all()
+            try:
+                self._write(batch)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _after_fork_in_child(self) -> None:
+        # The writer thread does not survive fork and the lock may have been held.
+        self._cond = threading.Condition()
+        self._queue.clear()
+        self._thread = None
+        self._writing = False
+
+
+def _reset_after_fork() -> None:
+    for writer in list(_live):
+        writer._after_fork_in_child()  # noqa: SLF001
+
+
+def _close_all() -> None:
+    for writer in list(_live):
+        writer.close()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(_close_all)
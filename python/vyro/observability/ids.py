@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+from random import Random
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Trace and span ids only need to be unique, not unpredictable, so a process-local
+# Mersenne Twister seeded once from os.urandom replaces uuid4, which reads
+# os.urandom for every id. Forked workers reseed so they never share a stream.
+_rng = Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_rng.seed)
+
+
+def new_trace_id() -> str:
+    """Random non-zero 128-bit W3C trace id as 32 lowercase hex characters."""
+    return f"{_rng.getrandbits(128) or 1:032x}"
+
+
+def new_span_id() -> str:
+    """Random non-zero 64-bit W3C span id as 16 lowercase hex characters."""
+    return f"{_rng.getrandbits(64) or 1:016x}"
+
+
+def build_traceparent(trace_id: str, span_id: str, *, sampled: bool = True) -> str:
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+def resolve_request_ids(correlation_id: str | None, traceparent: str | None) -> tuple[str, str]:
+    """Return ``(correlation_id, traceparent)``, generating whichever is missing.
+
+    A generated correlation id doubles as the trace id. An incoming correlation id
+    seeds the trace id when it is already 32 hex digits (dashes ignored, so UUIDs
+    qualify); otherwise a fresh trace id is used so the header stays W3C-valid.
+    The native request view applies the same rules.
+    """
+    if correlation_id is None:
+        correlation_id = new_trace_id()
+        if traceparent is None:
+            traceparent = build_traceparent(correlation_id, new_span_id())
+    elif traceparent is None:
+        traceparent = build_traceparent(_trace_id_from(correlation_id), new_span_id())
+    return correlation_id, traceparent
+
+
+def _trace_id_from(seed: str) -> str:
+    candidate = seed.replace("-", "").lower()
+    if len(candidate) == 32 and _HEX_DIGITS.issuperset(candidate) and candidate.strip("0"):
+        return candidate
+    return new_trace_id()
@@ -1,40 +1,274 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from .metrics import format_value
+
+# Log-linear (HDR-style) bucketing over integer microseconds: values below
+# 2**_SUB_BUCKET_BITS are exact, larger ones keep 11 significant bits (<0.1% error).
+_SUB_BUCKET_BITS = 11
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT >> 1
+
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySnapshot:
+    """Immutable, mergeable copy of a tracker's histogram."""
+
+    counts: tuple[tuple[int, int], ...] = ()
+    count: int = 0
+    sum_ms: float = 0.0
+    min_us: int = 0
+    max_us: int = 0
+
+    def quantile(self, q: float) -> float:
+        return _quantile(self.counts, self.count, q, self.min_us, self.max_us)
+
+    def merge(self, other: LatencySnapshot) -> LatencySnapshot:
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        merged = dict(self.counts)
+        for index, value in other.counts:
+            merged[index] = merged.get(index, 0) + value
+        return LatencySnapshot(
+            counts=tuple(sorted(merged.items())),
+            count=self.count + other.count,
+            sum_ms=self.sum_ms + other.sum_ms,
+            min_us=min(self.min_us, other.min_us),
+            max_us=max(self.max_us, other.max_us),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe form for shipping snapshots between processes."""
+        return {
+            "counts": [list(pair) for pair in self.counts],
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> LatencySnapshot:
+        return cls(
+            counts=tuple((int(index), int(value)) for index, value in payload.get("counts", ())),
+            count=int(payload.get("count", 0)),
+            sum_ms=float(payload.get("sum_ms", 0.0)),
+            min_us=int(payload.get("min_us", 0)),
+            max_us=int(payload.get("max_us", 0)),
+        )
 
 
 @dataclass(slots=True)
 class LatencyTracker:
-    samples_ms: list[float] = field(default_factory=list)
+    """Fixed-memory latency histogram with O(1) recording.
+
+    Samples land in sparse log-linear buckets, so memory is bounded by the number of
+    distinct buckets (at most a few tens of thousands up to ``max_value_ms``) rather
+    than by traffic. Quantiles walk the occupied buckets instead of sorting samples.
+    """
+
+    max_value_ms: float = 3_600_000.0
+    _counts: dict[int, int] = field(default_factory=dict, repr=False)
+    _count: int = 0
+    _sum_ms: float = 0.0
+    _min_us: int = 0
+    _max_us: int = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
 
     def observe(self, value_ms: float) -> None:
         if value_ms < 0:
             return
-        self.samples_ms.append(value_ms)
+        value_ms = min(value_ms, self.max_value_ms)
+        micros = int(value_ms * 1000.0)
+        index = _bucket_index(micros)
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+        if not self._count or micros < self._min_us:
+            self._min_us = micros
+        if micros > self._max_us:
+            self._max_us = micros
+        self._count += 1
+        self._sum_ms += value_ms
 
     def quantile(self, q: float) -> float:
-        if not self.samples_ms:
-            return 0.0
-        if q <= 0:
-            return min(self.samples_ms)
-        if q >= 1:
-            return max(self.samples_ms)
-        ordered = sorted(self.samples_ms)
-        idx = int(round((len(ordered) - 1) * q))
-        return ordered[idx]
+        return _quantile(sorted(self._counts.items()), self._count, q, self._min_us, self._max_us)
 
     def summary(self) -> dict[str, float]:
+        ordered = sorted(self._counts.items())
         return {
-            "p50": self.quantile(0.50),
-            "p95": self.quantile(0.95),
-            "p99": self.quantile(0.99),
+            name: _quantile(ordered, self._count, q, self._min_us, self._max_us)
+            for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
         }
 
-    def render_prometheus(self, metric_prefix: str = "vyro_request_latency_ms") -> str:
-        stats = self.summary()
-        lines = [f"# HELP {metric_prefix} Request latency quantiles in milliseconds"]
-        lines.append(f"# TYPE {metric_prefix} gauge")
-        lines.append(f'{metric_prefix}{{quantile="0.50"}} {stats["p50"]}')
-        lines.append(f'{metric_prefix}{{quantile="0.95"}} {stats["p95"]}')
-        lines.append(f'{metric_prefix}{{quantile="0.99"}} {stats["p99"]}')
+    def snapshot(self) -> LatencySnapshot:
+        return LatencySnapshot(
+            counts=tuple(sorted(self._counts.items())),
+            count=self._count,
+            sum_ms=self._sum_ms,
+            min_us=self._min_us,
+            max_us=self._max_us,
+        )
+
+    def merge(self, snapshot: LatencySnapshot) -> None:
+        if not snapshot.count:
+            return
+        counts = self._counts
+        for index, value in snapshot.counts:
+            counts[index] = counts.get(index, 0) + value
+        if not self._count or snapshot.min_us < self._min_us:
+            self._min_us = snapshot.min_us
+        self._max_us = max(self._max_us, snapshot.max_us)
+        self._count += snapshot.count
+        self._sum_ms += snapshot.sum_ms
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self._count = 0
+        self._sum_ms = 0.0
+        self._min_us = 0
+        self._max_us = 0
+
+    def render_prometheus(
+        self,
+        metric_prefix: str = "vyro_request_latency_ms",
+        *,
+        buckets_ms: Iterable[float] = DEFAULT_BUCKETS_MS,
+    ) -> str:
+        lines = [f"# HELP {metric_prefix} Request latency in milliseconds"]
+        lines.append(f"# TYPE {metric_prefix} histogram")
+        lines.extend(_histogram_lines(metric_prefix, "", self.snapshot(), buckets_ms))
         return "\n".join(lines) + "\n"
+
+
+@dataclass(slots=True)
+class RouteLatencyTracker:
+    """Per-route latency histograms keyed like ``ThroughputTracker``."""
+
+    max_value_ms: float = 3_600_000.0
+    _trackers: dict[tuple[str, str], LatencyTracker] = field(default_factory=dict)
+
+    def tracker(self, method: str, route: str) -> LatencyTracker:
+        key = (method.upper(), route)
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = LatencyTracker(max_value_ms=self.max_value_ms)
+        return tracker
+
+    def observe(self, method: str, route: str, value_ms: float) -> None:
+        self.tracker(method, route).observe(value_ms)
+
+    def snapshots(self) -> dict[tuple[str, str], LatencySnapshot]:
+        return {key: tracker.snapshot() for key, tracker in self._trackers.items()}
+
+    def merge(self, snapshots: dict[tuple[str, str], LatencySnapshot]) -> None:
+        for (method, route), snapshot in snapshots.items():
+            self.tracker(method, route).merge(snapshot)
+
+    def render_prometheus(
+        self,
+        metric_prefix: str = "vyro_route_latency_ms",
+        *,
+        buckets_ms: Iterable[float] = DEFAULT_BUCKETS_MS,
+    ) -> str:
+        bounds = tuple(buckets_ms)
+        lines = [f"# HELP {metric_prefix} Request latency per route in milliseconds"]
+        lines.append(f"# TYPE {metric_prefix} histogram")
+        for (method, route), tracker in sorted(self._trackers.items()):
+            labels = f'method="{method}",route="{route}"'
+            lines.extend(_histogram_lines(metric_prefix, labels, tracker.snapshot(), bounds))
+        return "\n".join(lines) + "\n"
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_BUCKET_COUNT:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS
+    return _SUB_BUCKET_COUNT + (shift - 1) * _HALF_SUB_BUCKET_COUNT + (
+        (micros >> shift) - _HALF_SUB_BUCKET_COUNT
+    )
+
+
+def _bucket_bounds_us(index: int) -> tuple[int, int]:
+    """Lowest value and width in microseconds of the bucket at ``index``."""
+    if index < _SUB_BUCKET_COUNT:
+        return index, 1
+    offset = index - _SUB_BUCKET_COUNT
+    shift = offset // _HALF_SUB_BUCKET_COUNT + 1
+    return (offset % _HALF_SUB_BUCKET_COUNT + _HALF_SUB_BUCKET_COUNT) << shift, 1 << shift
+
+
+def _bucket_midpoint_us(index: int) -> float:
+    lower, width = _bucket_bounds_us(index)
+    return float(lower) if width == 1 else lower + width / 2
+
+
+def _quantile(
+    counts: Iterable[tuple[int, int]],
+    total: int,
+    q: float,
+    min_us: int,
+    max_us: int,
+) -> float:
+    if not total:
+        return 0.0
+    if q <= 0:
+        return min_us / 1000.0
+    if q >= 1:
+        return max_us / 1000.0
+    rank = int(round((total - 1) * q)) + 1
+    seen = 0
+    for index, value in counts:
+        seen += value
+        if seen >= rank:
+            estimate = min(max(_bucket_midpoint_us(index), min_us), max_us)
+            return estimate / 1000.0
+    return max_us / 1000.0
+
+
+def _histogram_lines(
+    name: str,
+    labels: str,
+    snapshot: LatencySnapshot,
+    buckets_ms: Iterable[float],
+) -> list[str]:
+    prefix = f"{labels}," if labels else ""
+    suffix = f"{{{labels}}}" if labels else ""
+    lines: list[str] = []
+    ordered = snapshot.counts
+    position = 0
+    cumulative = 0
+    for bound in buckets_ms:
+        # ``le`` is inclusive: a bucket counts once its lowest value is within the bound.
+        limit_us = bound * 1000.0
+        while position < len(ordered) and _bucket_bounds_us(ordered[position][0])[0] <= limit_us:
+            cumulative += ordered[position][1]
+            position += 1
+        lines.append(f'{name}_bucket{{{prefix}le="{format_value(bound)}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {snapshot.count}')
+    lines.append(f"{name}_sum{suffix} {format_value(snapshot.sum_ms)}")
+    lines.append(f"{name}_count{suffix} {snapshot.count}")
+    return lines
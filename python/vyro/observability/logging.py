@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 import hashlib
 import json
 import os
-from typing import Any
+import sys
+from typing import Any, Iterable, Literal, TextIO
 
 import typer
 
+from .batching import BatchWriter
+
 
 DEFAULT_REDACT_KEYS = {
     "password",
@@ -20,6 +24,9 @@ DEFAULT_REDACT_KEYS = {
     "authorization",
     "api_key",
 }
+REDACTED = "***REDACTED***"
+
+OverflowPolicy = Literal["drop", "block"]
 
 
 @dataclass(slots=True, frozen=True)
@@ -40,15 +47,7 @@ class SamplingPolicy:
 
 
 def make_log_record(level: str, message: str, **fields: Any) -> dict[str, Any]:
-    record: dict[str, Any] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "level": level.upper(),
-        "message": message,
-    }
-    for key, value in fields.items():
-        if value is not None:
-            record[key] = _sanitize_field(key, value)
-    return record
+    return _build_record(level, message, fields, _env_redact_keys(os.getenv("VYRO_LOG_REDACT_KEYS", "")))
 
 
 def should_emit(level: str, sample_key: str, policy: SamplingPolicy) -> bool:
@@ -71,6 +70,21 @@ def emit_log(
     sample_key: str | None = None,
     **fields: Any,
 ) -> None:
+    """Emit one JSON log line, through the installed ``LogPipeline`` when there is one.
+
+    Without a pipeline (the CLI case) the line is written synchronously.
+    """
+    pipeline = _pipeline
+    if pipeline is not None:
+        pipeline.emit(
+            level,
+            message,
+            err=err,
+            sampling_policy=sampling_policy,
+            sample_key=sample_key,
+            **fields,
+        )
+        return
     policy = sampling_policy or SamplingPolicy()
     key = sample_key or message
     if not should_emit(level, key, policy):
@@ -78,15 +92,160 @@ def emit_log(
     typer.echo(json.dumps(make_log_record(level, message, **fields), ensure_ascii=False), err=err)
 
 
-def _sanitize_field(key: str, value: Any) -> Any:
-    redacted_keys = set(DEFAULT_REDACT_KEYS)
-    extra = os.getenv("VYRO_LOG_REDACT_KEYS", "")
+@dataclass(slots=True)
+class LogPipeline:
+    """Non-blocking structured log writer.
+
+    ``emit`` serializes the record on the caller and appends the line to a bounded
+    in-memory buffer; a daemon thread drains it in batches of up to ``batch_max_lines``
+    with one write per stream. When the buffer is full, ``overflow="drop"`` discards
+    the new line and counts it, while ``"block"`` waits up to ``block_timeout_sec`` for
+    space (then drops). The redaction set is compiled once at construction. The
+    writer is a ``BatchWriter``, so the pipeline keeps working in forked workers and
+    drains at interpreter exit.
+    """
+
+    capacity: int = 8192
+    batch_max_lines: int = 512
+    flush_interval_sec: float = 0.05
+    overflow: OverflowPolicy = "drop"
+    block_timeout_sec: float = 1.0
+    redact_keys: Iterable[str] = ()
+    stream: TextIO | None = None
+    err_stream: TextIO | None = None
+    sampling_policy: SamplingPolicy = field(default_factory=SamplingPolicy)
+    dropped_by_level: dict[str, int] = field(default_factory=dict, init=False)
+    written: int = field(default=0, init=False)
+    batches: int = field(default=0, init=False)
+    write_errors: int = field(default=0, init=False)
+    _redact: frozenset[str] = field(default=frozenset(), init=False, repr=False)
+    _writer: BatchWriter[tuple[bool, str]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if self.batch_max_lines < 1:
+            raise ValueError("batch_max_lines must be >= 1")
+        if self.flush_interval_sec <= 0:
+            raise ValueError("flush_interval_sec must be > 0")
+        if self.overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'")
+        self._redact = _env_redact_keys(os.getenv("VYRO_LOG_REDACT_KEYS", "")) | {
+            key.strip().lower() for key in self.redact_keys if key.strip()
+        }
+        self._writer = BatchWriter(
+            self._write,
+            capacity=self.capacity,
+            batch_size=self.batch_max_lines,
+            flush_interval_sec=self.flush_interval_sec,
+            name="vyro-log-writer",
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._writer.pending
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    def emit(
+        self,
+        level: str,
+        message: str,
+        *,
+        err: bool = False,
+        sampling_policy: SamplingPolicy | None = None,
+        sample_key: str | None = None,
+        **fields: Any,
+    ) -> bool:
+        """Queue one record; returns ``False`` when it was sampled out or dropped."""
+        if not should_emit(level, sample_key or message, sampling_policy or self.sampling_policy):
+            return False
+        record = _build_record(level, message, fields, self._redact)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        block_timeout_sec = self.block_timeout_sec if self.overflow == "block" else 0.0
+        if self._writer.put((err, line), block_timeout_sec=block_timeout_sec):
+            return True
+        level_name = record["level"]
+        self.dropped_by_level[level_name] = self.dropped_by_level.get(level_name, 0) + 1
+        return False
+
+    def flush(self, timeout_sec: float = 5.0) -> bool:
+        """Wait until every queued line is written; ``False`` on timeout."""
+        return self._writer.flush(timeout_sec)
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        """Drain the buffer and stop the writer thread."""
+        self._writer.close(timeout_sec)
+
+    def _write(self, batch: list[tuple[bool, str]]) -> None:
+        out = [line for err, line in batch if not err]
+        errs = [line for err, line in batch if err]
+        for lines, stream in ((out, self.stream or sys.stdout), (errs, self.err_stream or sys.stderr)):
+            if not lines:
+                continue
+            try:
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+            except (OSError, ValueError):
+                self.write_errors += 1
+                continue
+            self.written += len(lines)
+            self.batches += 1
+
+
+_pipeline: LogPipeline | None = None
+
+
+def configure_log_pipeline(pipeline: LogPipeline | None = None) -> LogPipeline:
+    """Install ``pipeline`` (or a default one) behind ``emit_log``; it drains at exit."""
+    global _pipeline
+    previous = _pipeline
+    _pipeline = pipeline or LogPipeline()
+    if previous is not None and previous is not _pipeline:
+        previous.close()
+    return _pipeline
+
+
+def shutdown_log_pipeline() -> None:
+    """Drain and uninstall the active pipeline; ``emit_log`` writes synchronously again."""
+    global _pipeline
+    pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.close()
+
+
+def _build_record(
+    level: str,
+    message: str,
+    fields: dict[str, Any],
+    redact: frozenset[str],
+) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "level": level.upper(),
+        "message": message,
+    }
+    for key, value in fields.items():
+        if value is not None:
+            record[key] = _sanitize_field(key, value, redact)
+    return record
+
+
+@lru_cache(maxsize=8)
+def _env_redact_keys(extra: str) -> frozenset[str]:
+    keys = set(DEFAULT_REDACT_KEYS)
     for raw in extra.split(","):
         cleaned = raw.strip().lower()
         if cleaned:
-            redacted_keys.add(cleaned)
-    if key.lower() in redacted_keys:
-        return "***REDACTED***"
+            keys.add(cleaned)
+    return frozenset(keys)
+
+
+def _sanitize_field(key: str, value: Any, redact: frozenset[str]) -> Any:
+    if key.lower() in redact:
+        return REDACTED
     if isinstance(value, dict):
-        return {k: _sanitize_field(str(k), v) for k, v in value.items()}
+        return {k: _sanitize_field(str(k), v, redact) for k, v in value.items()}
     return value
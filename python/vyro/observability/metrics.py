@@ -1,7 +1,30 @@
 from __future__ import annotations
 
+import math
+import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterator, Literal, Union, cast
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+
+DEFAULT_HISTOGRAM_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+OVERFLOW_LABEL_VALUE = "__overflow__"
+
+_METRIC_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_NAME = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
 
 @dataclass(slots=True)
@@ -10,43 +33,290 @@ class CounterMetric:
     description: str
     value: int = 0
     labels: dict[str, str] = field(default_factory=dict)
+    _series: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._series = f"{self.name}{_label_block(self.labels)} "
 
     def inc(self, amount: int = 1) -> None:
         self.value += amount
 
+    def _encode(self) -> Iterator[str]:
+        yield f"{self._series}{self.value}\n"
+
+
+@dataclass(slots=True)
+class GaugeMetric:
+    name: str
+    description: str
+    value: float = 0.0
+    labels: dict[str, str] = field(default_factory=dict)
+    _series: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._series = f"{self.name}{_label_block(self.labels)} "
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def _encode(self) -> Iterator[str]:
+        yield f"{self._series}{format_value(self.value)}\n"
+
+
+@dataclass(slots=True)
+class HistogramMetric:
+    name: str
+    description: str
+    buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
+    labels: dict[str, str] = field(default_factory=dict)
+    count: int = 0
+    sum: float = 0.0
+    _counts: list[int] = field(default_factory=list, init=False, repr=False)
+    _bucket_series: tuple[str, ...] = field(default=(), init=False, repr=False)
+    _sum_series: str = field(default="", init=False, repr=False)
+    _count_series: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if list(self.buckets) != sorted(set(self.buckets)):
+            raise ValueError("histogram buckets must be strictly increasing")
+        self._counts = [0] * (len(self.buckets) + 1)
+        bounds = [format_value(bound) for bound in self.buckets] + ["+Inf"]
+        self._bucket_series = tuple(
+            f"{self.name}_bucket{_label_block({**self.labels, 'le': bound})} " for bound in bounds
+        )
+        block = _label_block(self.labels)
+        self._sum_series = f"{self.name}_sum{block} "
+        self._count_series = f"{self.name}_count{block} "
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def _encode(self) -> Iterator[str]:
+        cumulative = 0
+        for series, count in zip(self._bucket_series, self._counts):
+            cumulative += count
+            yield f"{series}{cumulative}\n"
+        yield f"{self._sum_series}{format_value(self.sum)}\n"
+        yield f"{self._count_series}{self.count}\n"
+
+
+Metric = Union[CounterMetric, GaugeMetric, HistogramMetric]
+
+
+@dataclass(slots=True)
+class MetricFamily:
+    """One metric name with a fixed set of label dimensions.
+
+    ``labels`` returns a child handle per label-value combination and caches it, so
+    hot paths bind the handle once and call ``inc``/``observe`` on it directly. Past
+    ``max_series`` children, new combinations share one overflow child whose labels
+    are all ``OVERFLOW_LABEL_VALUE`` instead of growing the family without bound.
+    """
+
+    name: str
+    description: str
+    kind: MetricKind
+    label_names: tuple[str, ...] = ()
+    max_series: int = 1000
+    buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
+    _children: dict[tuple[str, ...], Metric] = field(default_factory=dict, repr=False)
+    _overflow: Metric | None = field(default=None, repr=False)
+    _header: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not _METRIC_NAME.match(self.name):
+            raise ValueError(f"invalid metric name: {self.name}")
+        if self.kind not in ("counter", "gauge", "histogram"):
+            raise ValueError(f"unsupported metric kind: {self.kind}")
+        for label in self.label_names:
+            if not _LABEL_NAME.match(label) or label.startswith("__") or label == "le":
+                raise ValueError(f"invalid label name: {label}")
+        if len(set(self.label_names)) != len(self.label_names):
+            raise ValueError("label names must be unique")
+        if self.max_series < 1:
+            raise ValueError("max_series must be >= 1")
+        self._header = f"# HELP {self.name} {self.description}\n# TYPE {self.name} {self.kind}\n"
+
+    @property
+    def overflowed(self) -> bool:
+        return self._overflow is not None
+
+    def labels(self, *values: Any, **named: Any) -> Metric:
+        key = self._key(values, named)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        if len(self._children) >= self.max_series:
+            if self._overflow is None:
+                self._overflow = self._make((OVERFLOW_LABEL_VALUE,) * len(self.label_names))
+            return self._overflow
+        child = self._children[key] = self._make(key)
+        return child
+
+    def remove(self, *values: Any, **named: Any) -> None:
+        self._children.pop(self._key(values, named), None)
+
+    def clear(self) -> None:
+        self._children.clear()
+        self._overflow = None
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def encode(self) -> Iterator[str]:
+        """Yield exposition text for this family one series at a time."""
+        yield self._header
+        for child in list(self._children.values()):
+            yield from child._encode()  # noqa: SLF001
+        if self._overflow is not None:
+            yield from self._overflow._encode()  # noqa: SLF001
+
+    def _key(self, values: tuple[Any, ...], named: dict[str, Any]) -> tuple[str, ...]:
+        if named:
+            if values:
+                raise ValueError("pass label values positionally or by name, not both")
+            if set(named) != set(self.label_names):
+                raise ValueError(f"expected labels {self.label_names}, got {tuple(sorted(named))}")
+            values = tuple(named[label] for label in self.label_names)
+        if len(values) != len(self.label_names):
+            raise ValueError(f"expected {len(self.label_names)} label values, got {len(values)}")
+        return tuple(str(value) for value in values)
+
+    def _make(self, key: tuple[str, ...]) -> Metric:
+        labels = dict(zip(self.label_names, key))
+        if self.kind == "counter":
+            return CounterMetric(self.name, self.description, labels=labels)
+        if self.kind == "gauge":
+            return GaugeMetric(self.name, self.description, labels=labels)
+        return HistogramMetric(self.name, self.description, buckets=self.buckets, labels=labels)
+
 
 class MetricsRegistry:
     def __init__(self) -> None:
-        self._counters: dict[str, CounterMetric] = {}
+        self._families: dict[str, MetricFamily] = {}
 
-    def counter(
+    def family(
         self,
         name: str,
         description: str,
+        kind: MetricKind,
         *,
-        labels: dict[str, str] | None = None,
-    ) -> CounterMetric:
-        metric = self._counters.get(name)
-        if metric is None:
-            metric = CounterMetric(
+        label_names: tuple[str, ...] = (),
+        max_series: int = 1000,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+    ) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = MetricFamily(
                 name=name,
                 description=description,
-                labels=dict(labels or {}),
+                kind=kind,
+                label_names=tuple(label_names),
+                max_series=max_series,
+                buckets=tuple(buckets),
+            )
+            self._families[name] = family
+        elif family.kind != kind or family.label_names != tuple(label_names):
+            raise ValueError(
+                f"metric {name} already registered as {family.kind} with labels {family.label_names}"
             )
-            self._counters[name] = metric
-        return metric
+        return family
+
+    def counter_family(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        *,
+        max_series: int = 1000,
+    ) -> MetricFamily:
+        return self.family(name, description, "counter", label_names=label_names, max_series=max_series)
+
+    def gauge_family(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        *,
+        max_series: int = 1000,
+    ) -> MetricFamily:
+        return self.family(name, description, "gauge", label_names=label_names, max_series=max_series)
+
+    def histogram_family(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        *,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+        max_series: int = 1000,
+    ) -> MetricFamily:
+        return self.family(
+            name,
+            description,
+            "histogram",
+            label_names=label_names,
+            max_series=max_series,
+            buckets=buckets,
+        )
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> CounterMetric:
+        return cast(CounterMetric, self._child(name, description, "counter", labels))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> GaugeMetric:
+        return cast(GaugeMetric, self._child(name, description, "gauge", labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        *,
+        labels: dict[str, str] | None = None,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+    ) -> HistogramMetric:
+        return cast(HistogramMetric, self._child(name, description, "histogram", labels, buckets))
+
+    def iter_prometheus(self) -> Iterator[str]:
+        """Yield the exposition family by family without building one large string."""
+        for family in list(self._families.values()):
+            yield from family.encode()
 
     def render_prometheus(self) -> str:
-        lines: list[str] = []
-        for metric in self._counters.values():
-            lines.append(f"# HELP {metric.name} {metric.description}")
-            lines.append(f"# TYPE {metric.name} counter")
-            if metric.labels:
-                label_text = ",".join(f'{k}="{v}"' for k, v in sorted(metric.labels.items()))
-                lines.append(f"{metric.name}{{{label_text}}} {metric.value}")
-            else:
-                lines.append(f"{metric.name} {metric.value}")
-        return "\n".join(lines) + ("\n" if lines else "")
+        return "".join(self.iter_prometheus())
+
+    def _child(
+        self,
+        name: str,
+        description: str,
+        kind: MetricKind,
+        labels: dict[str, str] | None,
+        buckets: tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS,
+    ) -> Metric:
+        labels = labels or {}
+        family = self.family(
+            name, description, kind, label_names=tuple(sorted(labels)), buckets=buckets
+        )
+        return family.labels(**labels)
 
 
 def create_default_registry() -> MetricsRegistry:
@@ -77,3 +347,29 @@ class ThroughputTracker:
                 f'{metric_name}{{method="{method}",route="{route}"}} {value}'
             )
         return "\n".join(lines) + "\n"
+
+
+def format_value(value: float) -> str:
+    """Exposition text for a sample value or bucket bound, without losing precision.
+
+    Integral values print without a fraction (``1``, ``3221225472``); others use the
+    shortest round-tripping repr, since ``:g`` keeps only six significant digits.
+    """
+    number = float(value)
+    if number != number:
+        return "NaN"
+    if number in (math.inf, -math.inf):
+        return "+Inf" if number > 0 else "-Inf"
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    return repr(number)
+
+
+def _label_block(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
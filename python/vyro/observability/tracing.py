@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
-from typing import Any
-from uuid import uuid4
+import socket
+import sys
+import threading
+import time
+from typing import Any, Callable, Protocol, TextIO
 
 import typer
 
+from .batching import BatchWriter
+from .ids import new_span_id, new_trace_id
+
+# Spans are timed with the monotonic clock; wall-clock timestamps are derived from
+# this anchor only when a span is exported.
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
 
 @dataclass(slots=True)
 class Span:
@@ -15,33 +25,333 @@ class Span:
     trace_id: str
     span_id: str
     parent_span_id: str | None
-    started_at: datetime
-    ended_at: datetime | None = None
+    start_ns: int
+    end_ns: int | None = None
     status: str = "ok"
     attributes: dict[str, Any] | None = None
+    sampled: bool = True
+    _tracer: Tracer | None = field(default=None, repr=False)
+    _root: bool = field(default=True, repr=False)
+
+    @property
+    def started_at(self) -> datetime:
+        return _wall_time(self.start_ns)
+
+    @property
+    def ended_at(self) -> datetime | None:
+        return None if self.end_ns is None else _wall_time(self.end_ns)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.monotonic_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header that continues this trace downstream."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
 
     def finish(self, *, status: str = "ok") -> None:
         self.status = status
-        self.ended_at = datetime.now(timezone.utc)
+        if self.end_ns is not None:
+            return
+        tracer = self._tracer
+        if tracer is None:
+            self.end_ns = time.monotonic_ns()
+            return
+        self.end_ns = tracer._clock_ns()  # noqa: SLF001
+        tracer._on_end(self)  # noqa: SLF001
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc is not None:
+            self.set_attribute("error.type", exc_type.__name__)
+        self.finish(status="ok" if exc is None else "error")
 
 
 def start_span(name: str, *, traceparent: str | None = None, attributes: dict[str, Any] | None = None) -> Span:
-    trace_id, parent_span_id = _extract_trace_context(traceparent)
+    trace_id, parent_span_id, sampled = _extract_trace_context(traceparent)
     return Span(
         name=name,
         trace_id=trace_id,
-        span_id=uuid4().hex[:16],
+        span_id=new_span_id(),
         parent_span_id=parent_span_id,
-        started_at=datetime.now(timezone.utc),
+        start_ns=time.monotonic_ns(),
         attributes=attributes or {},
+        sampled=True if sampled is None else sampled,
     )
 
 
 def export_span(span: Span) -> str:
-    if span.ended_at is None:
+    if span.end_ns is None:
         span.finish()
-    payload = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    return json.dumps(_span_payload(span), ensure_ascii=False, default=str)
+
+
+def emit_span(span: Span) -> None:
+    typer.echo(export_span(span))
+
+
+class SpanSink(Protocol):
+    def write(self, lines: list[str]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(slots=True)
+class StreamSpanSink:
+    stream: TextIO | None = None
+
+    def write(self, lines: list[str]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+    def close(self) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class FileSpanSink:
+    """Appends newline-delimited JSON spans to ``path``."""
+
+    path: str
+    _handle: TextIO | None = field(default=None, init=False, repr=False)
+
+    def write(self, lines: list[str]) -> None:
+        if self._handle is None:
+            self._handle = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._handle.write("\n".join(lines) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+@dataclass(slots=True)
+class CollectorSpanSink:
+    """Streams newline-delimited JSON spans to a local collector over TCP."""
+
+    port: int
+    host: str = "127.0.0.1"
+    timeout_sec: float = 1.0
+    _sock: socket.socket | None = field(default=None, init=False, repr=False)
+
+    def write(self, lines: list[str]) -> None:
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        if self._sock is None:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout_sec)
+        try:
+            self._sock.sendall(payload)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+@dataclass(slots=True)
+class BatchSpanExporter:
+    """Queues finished spans and writes them to ``sink`` from a background thread.
+
+    A batch is written once ``batch_size`` spans are queued or ``flush_interval_sec``
+    has passed; spans are serialized on the writer thread, off the request path.
+    When ``max_queue`` spans are waiting, new ones are dropped and counted. The queue
+    is a ``BatchWriter``, so exporting survives fork and queued spans drain at exit.
+    """
+
+    sink: SpanSink = field(default_factory=StreamSpanSink)
+    max_queue: int = 4096
+    batch_size: int = 256
+    flush_interval_sec: float = 1.0
+    exported: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+    _writer: BatchWriter[Span] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if self.flush_interval_sec <= 0:
+            raise ValueError("flush_interval_sec must be > 0")
+        self._writer = BatchWriter(
+            self._write,
+            capacity=self.max_queue,
+            batch_size=self.batch_size,
+            flush_interval_sec=self.flush_interval_sec,
+            name="vyro-span-exporter",
+        )
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    def export(self, span: Span) -> bool:
+        return self._writer.put(span)
+
+    def flush(self, timeout_sec: float = 5.0) -> bool:
+        return self._writer.flush(timeout_sec)
+
+    def shutdown(self, timeout_sec: float = 5.0) -> None:
+        if self._writer.closed:
+            return
+        self._writer.close(timeout_sec)
+        self.sink.close()
+
+    def _write(self, batch: list[Span]) -> None:
+        try:
+            lines = [json.dumps(_span_payload(span), ensure_ascii=False, default=str) for span in batch]
+            self.sink.write(lines)
+            self.exported += len(batch)
+        except (OSError, ValueError):
+            self.failed += len(batch)
+
+
+@dataclass(slots=True)
+class _PendingTrace:
+    spans: list[Span] = field(default_factory=list)
+    keep: bool = False
+
+
+@dataclass(slots=True)
+class Tracer:
+    """Span factory with head sampling, tail sampling and an export budget.
+
+    Root spans follow the sampled flag of an incoming ``traceparent`` (when
+    ``respect_parent`` is set) or ``sample_rate``, decided deterministically from the
+    trace id; children inherit their parent's decision. Unsampled traces are buffered
+    until their local root span ends and exported anyway when any span failed
+    (``keep_errors``) or the root took at least ``slow_threshold_ms``. At most
+    ``max_spans_per_sec`` spans reach the exporter. Spans may start and end on any
+    thread; the pending buffer and the budget are guarded by one lock.
+    """
+
+    exporter: BatchSpanExporter = field(default_factory=BatchSpanExporter)
+    sample_rate: float = 1.0
+    respect_parent: bool = True
+    slow_threshold_ms: float | None = None
+    keep_errors: bool = True
+    max_spans_per_sec: float | None = None
+    max_pending_traces: int = 10_000
+    sampled_out: int = field(default=0, init=False)
+    tail_kept: int = field(default=0, init=False)
+    budget_dropped: int = field(default=0, init=False)
+    _clock_ns: Callable[[], int] = field(default=time.monotonic_ns, repr=False)
+    _pending: dict[str, _PendingTrace] = field(default_factory=dict, init=False, repr=False)
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _refilled_ns: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if self.max_spans_per_sec is not None and self.max_spans_per_sec <= 0:
+            raise ValueError("max_spans_per_sec must be > 0")
+        self._tokens = self.max_spans_per_sec or 0.0
+        self._refilled_ns = self._clock_ns()
+
+    @property
+    def tail_sampling(self) -> bool:
+        return self.keep_errors or self.slow_threshold_ms is not None
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Span | None = None,
+        traceparent: str | None = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> Span:
+        if parent is not None:
+            return Span(
+                name=name,
+                trace_id=parent.trace_id,
+                span_id=new_span_id(),
+                parent_span_id=parent.span_id,
+                start_ns=self._clock_ns(),
+                attributes=attributes,
+                sampled=parent.sampled,
+                _tracer=self,
+                _root=False,
+            )
+        trace_id, parent_span_id, flagged = _extract_trace_context(traceparent)
+        if flagged is not None and self.respect_parent:
+            sampled = flagged
+        else:
+            sampled = _trace_ratio(trace_id) < self.sample_rate
+        if not sampled and self.tail_sampling:
+            with self._lock:
+                if len(self._pending) >= self.max_pending_traces:
+                    # Roots that never finished would otherwise pin the buffer; evict the oldest.
+                    self._pending.pop(next(iter(self._pending)), None)
+                self._pending.setdefault(trace_id, _PendingTrace())
+        return Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=new_span_id(),
+            parent_span_id=parent_span_id,
+            start_ns=self._clock_ns(),
+            attributes=attributes,
+            sampled=sampled,
+            _tracer=self,
+        )
+
+    def _on_end(self, span: Span) -> None:
+        if span.sampled:
+            self._export(span)
+            return
+        with self._lock:
+            pending = self._pending.get(span.trace_id)
+            if pending is None:
+                if span._root:  # noqa: SLF001
+                    self.sampled_out += 1
+                return
+            pending.spans.append(span)
+            if self.keep_errors and span.status != "ok":
+                pending.keep = True
+            if not span._root:  # noqa: SLF001
+                return
+            self._pending.pop(span.trace_id, None)
+            slow = self.slow_threshold_ms is not None and span.duration_ms >= self.slow_threshold_ms
+            if not (pending.keep or slow):
+                self.sampled_out += 1
+                return
+            self.tail_kept += 1
+        for buffered in pending.spans:
+            self._export(buffered)
+
+    def _export(self, span: Span) -> None:
+        rate = self.max_spans_per_sec
+        if rate is not None:
+            with self._lock:
+                now = self._clock_ns()
+                elapsed = (now - self._refilled_ns) / 1_000_000_000
+                self._refilled_ns = now
+                self._tokens = min(rate, self._tokens + elapsed * rate)
+                if self._tokens < 1.0:
+                    self.budget_dropped += 1
+                    return
+                self._tokens -= 1.0
+        self.exporter.export(span)
+
+
+def _span_payload(span: Span) -> dict[str, Any]:
+    ended_at = span.ended_at
+    return {
+        "timestamp": (ended_at or span.started_at).isoformat(),
         "type": "trace",
         "name": span.name,
         "trace_id": span.trace_id,
@@ -49,23 +359,36 @@ def export_span(span: Span) -> str:
         "parent_span_id": span.parent_span_id,
         "status": span.status,
         "started_at": span.started_at.isoformat(),
-        "ended_at": span.ended_at.isoformat() if span.ended_at else None,
+        "ended_at": ended_at.isoformat() if ended_at else None,
+        "duration_ms": span.duration_ms,
         "attributes": span.attributes or {},
     }
-    return json.dumps(payload, ensure_ascii=False)
 
 
-def emit_span(span: Span) -> None:
-    typer.echo(export_span(span))
+def _wall_time(monotonic_ns: int) -> datetime:
+    return datetime.fromtimestamp((monotonic_ns + _WALL_OFFSET_NS) / 1_000_000_000, tz=timezone.utc)
+
+
+def _trace_ratio(trace_id: str) -> float:
+    return int(trace_id[-16:], 16) / float(2**64)
 
 
-def _extract_trace_context(traceparent: str | None) -> tuple[str, str | None]:
+def _extract_trace_context(traceparent: str | None) -> tuple[str, str | None, bool | None]:
     if not traceparent:
-        return uuid4().hex, None
+        return new_trace_id(), None, None
     parts = traceparent.strip().split("-")
     if len(parts) != 4:
-        return uuid4().hex, None
-    _, trace_id, parent_span_id, _ = parts
+        return new_trace_id(), None, None
+    _, trace_id, parent_span_id, flags = parts
     if len(trace_id) != 32 or len(parent_span_id) != 16:
-        return uuid4().hex, None
-    return trace_id, parent_span_id
+        return new_trace_id(), None, None
+    try:
+        int(trace_id, 16)
+        int(parent_span_id, 16)
+    except ValueError:
+        return new_trace_id(), None, None
+    try:
+        sampled = bool(int(flags, 16) & 1)
+    except ValueError:
+        sampled = None
+    return trace_id, parent_span_id, sampled
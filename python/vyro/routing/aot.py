@@ -12,5 +12,7 @@ def compile_routes(routes: list[RouteRecord]) -> list[NativeRoute]:
         if key in seen:
             raise ValueError(f"Duplicate route declaration detected for {route.method} {route.original_path}")
         seen.add(key)
-        compiled.append((route.method, route.normalized_path, route.dispatch))
+        compiled.append(
+            (route.method, route.normalized_path, route.dispatch, route.options.as_native())
+        )
     return compiled
@@ -4,22 +4,52 @@ import inspect
 from typing import Any, Callable
 
 from vyro.http.context import Context
-from vyro.routing.signature import bind_request_kwargs
+from vyro.http.sse import SSEResponse
+from vyro.middleware.chain import MiddlewareChain
+from vyro.routing.signature import compile_binder
 
 
 def build_dispatch(
     fn: Callable[..., Any],
     params: list[inspect.Parameter],
-) -> Callable[[dict[str, Any]], Any]:
-    async def dispatch(native_ctx: dict[str, Any]) -> Any:
-        ctx = Context.from_native(native_ctx)
-        kwargs = bind_request_kwargs(
-            fn.__name__,
-            params,
-            dict(ctx.path_params),
-            dict(ctx.query),
-            dict(ctx.headers),
-        )
-        return await fn(ctx, **kwargs)
+    path: str,
+    chain: MiddlewareChain | None = None,
+) -> Callable[[Any], Any]:
+    binder = compile_binder(fn.__name__, params, path)
+    from_native = Context.from_native
+
+    if chain is not None and not chain.is_empty:
+        bind = binder.bind
+        run_before = chain.run_before
+        run_after = chain.run_after
+
+        async def dispatch_with_middleware(native_ctx: Any) -> Any:
+            ctx = from_native(native_ctx)
+            await run_before(ctx)
+            result = await run_after(ctx, await fn(ctx, **bind(ctx)))
+            if isinstance(result, SSEResponse):
+                return result.as_tuple()
+            return result
+
+        return dispatch_with_middleware
+
+    if not binder.entries:
+
+        async def dispatch(native_ctx: Any) -> Any:
+            result = await fn(from_native(native_ctx))
+            if isinstance(result, SSEResponse):
+                return result.as_tuple()
+            return result
+
+        return dispatch
+
+    bind = binder.bind
+
+    async def dispatch(native_ctx: Any) -> Any:
+        ctx = from_native(native_ctx)
+        result = await fn(ctx, **bind(ctx))
+        if isinstance(result, SSEResponse):
+            return result.as_tuple()
+        return result
 
     return dispatch
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any, Callable
 
+from vyro.middleware.chain import MiddlewareChain
+from vyro.middleware.registry import MiddlewareRegistry
 from vyro.routing.aot import compile_routes
 from vyro.routing.dispatch import build_dispatch
 from vyro.routing.normalize import normalize_path
 from vyro.routing.validate import validate_handler
-from vyro.typing import NativeRoute, RouteRecord
+from vyro.typing import NativeRoute, RouteOptions, RouteRecord
 
 
 class RouterRegistry:
     def __init__(self) -> None:
         self._routes: list[RouteRecord] = []
         self._compiled: list[NativeRoute] | None = None
+        self._compiled_for: tuple[int, int] | None = None
 
     def add_route(
         self,
@@ -22,15 +26,18 @@ class RouterRegistry:
         version: str | None = None,
         deprecated: bool | str = False,
         tenant: str | None = None,
+        stream_body: bool = False,
+        max_body_bytes: int | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         normalized_path = normalize_path(path)
+        options = RouteOptions(stream_body=stream_body, max_body_bytes=max_body_bytes)
         version_prefix = _normalize_version(version) if version is not None else None
         routed_path = f"{version_prefix}{normalized_path}" if version_prefix else normalized_path
         upper_method = method.upper()
 
         def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
             params = validate_handler(fn)
-            dispatch = build_dispatch(fn, params)
+            dispatch = build_dispatch(fn, params, routed_path)
             self._routes.append(
                 RouteRecord(
                     method=upper_method,
@@ -41,6 +48,7 @@ class RouterRegistry:
                     version=version_prefix,
                     deprecated=_normalize_deprecation(deprecated),
                     tenant=tenant,
+                    options=options,
                 )
             )
             self._compiled = None
@@ -48,9 +56,19 @@ class RouterRegistry:
 
         return decorator
 
-    def compile(self) -> list[NativeRoute]:
-        if self._compiled is None:
-            self._compiled = compile_routes(self._routes)
+    def compile(self, middlewares: MiddlewareRegistry | None = None) -> list[NativeRoute]:
+        """Compile the native route plan, baking each route's middleware chain in.
+
+        Chains are resolved once per route from group prefixes and priorities; routes
+        without applicable middleware keep their plain dispatch closure.
+        """
+        key = (id(middlewares), middlewares.version) if middlewares is not None else None
+        if self._compiled is None or self._compiled_for != key:
+            routes = self._routes
+            if middlewares is not None and middlewares.items():
+                routes = [_with_middleware(route, middlewares) for route in routes]
+            self._compiled = compile_routes(routes)
+            self._compiled_for = key
         return list(self._compiled)
 
     def records(self) -> list[RouteRecord]:
@@ -60,6 +78,15 @@ class RouterRegistry:
         return self.compile()
 
 
+def _with_middleware(route: RouteRecord, middlewares: MiddlewareRegistry) -> RouteRecord:
+    chain = MiddlewareChain(list(middlewares.ordered_for_path(route.normalized_path)))
+    if chain.is_empty:
+        return route
+    params = validate_handler(route.handler)
+    dispatch = build_dispatch(route.handler, params, route.normalized_path, chain)
+    return replace(route, dispatch=dispatch)
+
+
 def _normalize_version(version: str) -> str:
     value = version.strip().lower()
     if not value:
@@ -1,46 +1,125 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 import inspect
-from typing import Any, get_args, get_origin
+import re
+from typing import Any, Callable, get_args, get_origin
 from uuid import UUID
 
 from vyro.errors import HandlerSignatureError
 
 
-def convert_request_value(value: str, annotation: Any) -> Any:
+_PATH_PARAM = re.compile(r"\{\*?([^}]+)\}")
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+Converter = Callable[[str], Any]
+
+
+def _parse_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Cannot parse bool from '{value}'")
+
+
+_CONVERTERS: dict[Any, Converter] = {
+    int: int,
+    float: float,
+    bool: _parse_bool,
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+def resolve_converter(annotation: Any) -> Converter | None:
+    """Return the str -> value converter for an annotation, or None to pass through."""
     if annotation is Any:
-        return value
+        return None
 
     origin = get_origin(annotation)
     if origin is not None:
         args = [arg for arg in get_args(annotation) if arg is not type(None)]  # noqa: E721
         if len(args) == 1:
-            return convert_request_value(value, args[0])
+            return resolve_converter(args[0])
+        return None
+
+    try:
+        return _CONVERTERS.get(annotation)
+    except TypeError:
+        return None
 
-    if annotation is inspect._empty or annotation is str:
+
+def convert_request_value(value: str, annotation: Any) -> Any:
+    converter = resolve_converter(annotation)
+    if converter is None:
         return value
-    if annotation is int:
-        return int(value)
-    if annotation is float:
-        return float(value)
-    if annotation is bool:
-        normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "off"}:
-            return False
-        raise ValueError(f"Cannot parse bool from '{value}'")
-    if annotation is UUID:
-        return UUID(value)
-    if annotation is datetime:
-        return datetime.fromisoformat(value)
-    if annotation is date:
-        return date.fromisoformat(value)
-    if annotation is Decimal:
-        return Decimal(value)
-    return value
+    return converter(value)
+
+
+def path_param_names(path: str) -> frozenset[str]:
+    return frozenset(_PATH_PARAM.findall(path))
+
+
+@dataclass(frozen=True, slots=True)
+class RequestBinder:
+    """Per-route argument binder compiled once at registration.
+
+    Each entry is ``(name, from_path, header_key, converter, required)``; sources and
+    converters are resolved up front so binding is a single pass over the entries.
+    """
+
+    handler_name: str
+    entries: tuple[tuple[str, bool, str, Converter | None, bool], ...]
+
+    def bind(self, ctx: Any) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {}
+        path_params = ctx.path_params
+        query = None
+        for name, from_path, header_key, converter, required in self.entries:
+            if from_path:
+                raw_value = path_params.get(name)
+            else:
+                if query is None:
+                    query = ctx.query
+                raw_value = query.get(name)
+                if raw_value is None:
+                    raw_value = ctx.header(header_key)
+
+            if raw_value is None:
+                if required:
+                    raise HandlerSignatureError(
+                        f"Missing request parameter '{name}' for handler '{self.handler_name}'"
+                    )
+                continue
+
+            kwargs[name] = raw_value if converter is None else converter(raw_value)
+        return kwargs
+
+
+def compile_binder(
+    handler_name: str,
+    params: list[inspect.Parameter],
+    path: str,
+) -> RequestBinder:
+    path_names = path_param_names(path)
+    entries = tuple(
+        (
+            param.name,
+            param.name in path_names,
+            param.name.replace("_", "-").lower(),
+            resolve_converter(param.annotation),
+            param.default is inspect._empty,
+        )
+        for param in params[1:]
+    )
+    return RequestBinder(handler_name=handler_name, entries=entries)
 
 
 def bind_request_kwargs(
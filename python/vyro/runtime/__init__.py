@@ -16,15 +16,32 @@ from .edge.compression import CompressionProfile, ResponseCompressor
 from .edge.etag import ETagEvaluation, ETagManager
 from .edge.grpc_gateway import GrpcGateway, GrpcRoute
 from .edge.http2 import Http2Stream, Http2StreamManager
-from .edge.http_client import AsyncHttpClient, HttpResponse
+from .edge.http_client import AsyncHttpClient, HttpPoolLimits, HttpResponse, HttpStreamResponse
+from .edge.outbound import BulkheadFullError, CircuitOpenError, OutboundPipeline, OutboundRejectedError
 from .edge.multipart_parser import MultipartParser, MultipartSection
 from .edge.multipart_upload import MultipartUploadStream
 from .edge.negotiation import ContentNegotiator, NegotiationResult
 from .edge.static_files import StaticFileService
 from .edge.websocket import WebSocketRouteRegistry
 from .platform.blue_green import BlueGreenRolloutHelper, BlueGreenState
-from .platform.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
-from .platform.cache_invalidation import CacheInvalidationHooks, InvalidationHook
+from .platform.cache import (
+    AsyncCacheAdapter,
+    AsyncCacheBackend,
+    BoundedMemoryCacheBackend,
+    CacheBackend,
+    CacheStats,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from .platform.redis_cache import AsyncRedisCacheBackend, RedisInvalidationBus, RespError
+from .platform.cache_invalidation import (
+    CacheInvalidationHooks,
+    CacheTagIndex,
+    InvalidationHook,
+    MemoryTagStore,
+    RedisTagStore,
+    TagStore,
+)
 from .platform.canary import CanaryRoutingControls, CanaryRule
 from .platform.discovery import (
     DiscoveryAdapter,
@@ -37,9 +54,10 @@ from .platform.feature_flags import FeatureFlagEngine, FeatureFlagRule
 from .platform.hot_reload import RuntimeConfigReloadError, RuntimeConfigSnapshot, SafeRuntimeConfigReloader
 from .platform.kubernetes import KubernetesAppConfig, KubernetesManifestGenerator
 from .platform.marketplace import ExtensionManifest, ExtensionMarketplaceManifest, ManifestError
-from .platform.nogil import NoGILTuningProfile, NoGILWorkerTuner
+from .platform.nogil import ExecutionPlan, NoGILTuningProfile, NoGILWorkerTuner, is_free_threaded
 from .platform.plugins import ABI_VERSION, ABIStablePluginSystem, PluginError, PluginIncompatibleError, RegisteredPlugin
 from .platform.response_cache import ResponseCachePolicy, ResponseCacheService
+from .platform.tiered_cache import TieredCacheService
 from .resilience.backpressure import BackpressureController
 from .resilience.bulkhead import OutboundBulkhead
 from .resilience.circuit_breaker import OutboundCircuitBreaker
@@ -69,6 +87,18 @@ __all__ = [
     "SecurityAuditLogger",
     "CacheBackend",
     "MemoryCacheBackend",
+    "BoundedMemoryCacheBackend",
+    "AsyncCacheAdapter",
+    "AsyncCacheBackend",
+    "AsyncRedisCacheBackend",
+    "RedisInvalidationBus",
+    "RespError",
+    "TieredCacheService",
+    "CacheTagIndex",
+    "MemoryTagStore",
+    "RedisTagStore",
+    "TagStore",
+    "CacheStats",
     "RedisCacheBackend",
     "CacheInvalidationHooks",
     "InvalidationHook",
@@ -78,6 +108,8 @@ __all__ = [
     "CanaryRule",
     "MultiKeyRateLimiter",
     "AsyncHttpClient",
+    "BulkheadFullError",
+    "CircuitOpenError",
     "ETagEvaluation",
     "ETagManager",
     "CompressionProfile",
@@ -113,7 +145,11 @@ __all__ = [
     "JobRuntime",
     "KubernetesAppConfig",
     "KubernetesManifestGenerator",
+    "HttpPoolLimits",
+    "OutboundPipeline",
+    "OutboundRejectedError",
     "HttpResponse",
+    "HttpStreamResponse",
     "Http2Stream",
     "Http2StreamManager",
     "MultipartUploadStream",
@@ -128,6 +164,8 @@ __all__ = [
     "NegotiationResult",
     "NoGILTuningProfile",
     "NoGILWorkerTuner",
+    "ExecutionPlan",
+    "is_free_threaded",
     "OAuth2Config",
     "OIDCClaims",
     "OAuth2OIDCHelper",
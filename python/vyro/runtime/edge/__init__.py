@@ -8,3 +8,4 @@ from .static_files import *  # noqa: F401,F403
 from .etag import *  # noqa: F401,F403
 from .compression import *  # noqa: F401,F403
 from .negotiation import *  # noqa: F401,F403
+from .outbound import *  # noqa: F401,F403
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
+import re
+import ssl
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
-from urllib.request import Request, urlopen
+from http import HTTPStatus
+from http.client import HTTPMessage
+from typing import Any, AsyncIterator, Awaitable, TypeVar
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from weakref import WeakKeyDictionary
 
 from ..resilience.timeout_budget import TimeoutBudget
 
+_T = TypeVar("_T")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+_BODYLESS_STATUSES = frozenset({204, 304})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_CREDENTIAL_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+_BODY_HEADERS = frozenset({"content-length", "content-type"})
+_READ_CHUNK = 64 * 1024
+# RFC 7230 ``token``: header names and methods; rules out CR/LF, ``:`` and whitespace.
+_TOKEN = re.compile(r"[!#$%&'*+\-.^_`|~0-9A-Za-z]+")
+
 
 @dataclass(slots=True)
 class HttpResponse:
@@ -22,7 +44,88 @@ class HttpResponse:
         return json.loads(self.body.decode("utf-8"))
 
 
+@dataclass(slots=True)
+class HttpPoolLimits:
+    max_connections_per_host: int = 10
+    max_idle_per_host: int = 10
+    idle_timeout_sec: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be >= 1")
+        if self.max_idle_per_host < 0:
+            raise ValueError("max_idle_per_host must be >= 0")
+        if self.idle_timeout_sec <= 0:
+            raise ValueError("idle_timeout_sec must be > 0")
+
+
+class HttpStreamResponse:
+    """Response whose body is read incrementally from the pooled connection."""
+
+    __slots__ = ("status", "headers", "_body")
+
+    def __init__(self, status: int, headers: dict[str, str], body: _BodyReader) -> None:
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_bytes()
+
+    async def iter_bytes(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self._body.next_chunk()
+            if not chunk:
+                return
+            yield chunk
+
+    async def read(self) -> bytes:
+        parts = [chunk async for chunk in self.iter_bytes()]
+        return b"".join(parts)
+
+
 class AsyncHttpClient:
+    """HTTP/1.1 client on asyncio streams with per-host keep-alive pools.
+
+    Each host keeps at most ``max_connections_per_host`` open connections and
+    parks finished ones for reuse. A connection carries one request at a time and
+    is only returned to the pool once its response body has been fully read, so
+    reuse never interleaves responses. Pools are kept per event loop because
+    stream transports are bound to the loop that opened them.
+
+    Like ``urlopen``, ``request`` follows redirects for GET/HEAD (and turns a POST
+    answered with 301/302/303 into a GET) and raises ``urllib.error.HTTPError`` for
+    4xx/5xx unless ``raise_for_status`` is off. ``stream`` does neither. Unlike
+    ``urlopen``, proxy environment variables are not honored, and response header
+    names are lowercased with repeated headers joined by ``", "``.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: HttpPoolLimits | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        raise_for_status: bool = True,
+        follow_redirects: bool = True,
+        max_redirects: int = 10,
+    ) -> None:
+        if max_redirects < 0:
+            raise ValueError("max_redirects must be >= 0")
+        self._limits = limits or HttpPoolLimits()
+        self._ssl_context = ssl_context
+        self.raise_for_status = raise_for_status
+        self.follow_redirects = follow_redirects
+        self.max_redirects = max_redirects
+        self._pools: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[str, str, int], _HostPool]
+        ] = WeakKeyDictionary()
+
+    async def __aenter__(self) -> AsyncHttpClient:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.aclose()
+
     async def request(
         self,
         method: str,
@@ -32,19 +135,82 @@ class AsyncHttpClient:
         body: bytes | None = None,
         timeout_sec: float | None = None,
         budget: TimeoutBudget | None = None,
+        raise_for_status: bool | None = None,
     ) -> HttpResponse:
-        effective_timeout = timeout_sec
-        if budget is not None:
-            budget_timeout = budget.remaining_sec
-            if effective_timeout is None:
-                effective_timeout = budget_timeout
-            else:
-                effective_timeout = min(effective_timeout, budget_timeout)
-        if effective_timeout is not None and effective_timeout <= 0:
-            raise TimeoutError("timeout budget expired")
+        """Send a request and read the whole body; redirects share one deadline.
 
-        request = Request(url=url, data=body, method=method.upper(), headers=headers or {})
-        return await asyncio.to_thread(self._send, request, effective_timeout)
+        ``raise_for_status`` overrides the client default for this call.
+        """
+        deadline = _Deadline.start(_effective_timeout(timeout_sec, budget))
+        method = method.upper()
+        headers = dict(headers or {})
+        redirects = 0
+        while True:
+            async with self._open(method, url, headers, body, deadline) as response:
+                content = await response.read()
+            result = HttpResponse(status=response.status, headers=response.headers, body=content)
+            location = result.headers.get("location")
+            if (
+                not self.follow_redirects
+                or location is None
+                or not _redirects(method, result.status)
+            ):
+                break
+            if redirects == self.max_redirects:
+                raise _http_error(url, result, "redirect limit exceeded")
+            redirects += 1
+            target = urljoin(url, location)
+            if method == "POST" and result.status in (301, 302, 303):
+                method, body = "GET", None
+                headers = _without(headers, _BODY_HEADERS)
+            if _Target.parse(target).key != _Target.parse(url).key:
+                headers = _without(headers, _CREDENTIAL_HEADERS)
+            url = target
+        should_raise = self.raise_for_status if raise_for_status is None else raise_for_status
+        if should_raise and result.status >= 400:
+            raise _http_error(url, result)
+        return result
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout_sec: float | None = None,
+        budget: TimeoutBudget | None = None,
+    ) -> AsyncIterator[HttpStreamResponse]:
+        """Send one request and expose the body as it arrives; no redirects or raising."""
+        deadline = _Deadline.start(_effective_timeout(timeout_sec, budget))
+        async with self._open(method.upper(), url, headers or {}, body, deadline) as response:
+            yield response
+
+    @asynccontextmanager
+    async def _open(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        deadline: _Deadline,
+    ) -> AsyncIterator[HttpStreamResponse]:
+        target = _Target.parse(url)
+        pool = self._pool_for(target)
+        head = _encode_head(method, target, headers, body)
+        conn, status, response_headers, keep_alive = await _exchange(
+            pool, method, head, body, deadline
+        )
+        try:
+            reader = _BodyReader.for_response(
+                conn.reader, deadline, method, status, response_headers
+            )
+            yield HttpStreamResponse(status, response_headers, reader)
+        except BaseException:
+            pool.release(conn, reusable=False)
+            raise
+        pool.release(conn, reusable=keep_alive and reader.complete and not reader.until_close)
 
     async def get(
         self,
@@ -53,6 +219,7 @@ class AsyncHttpClient:
         headers: dict[str, str] | None = None,
         timeout_sec: float | None = None,
         budget: TimeoutBudget | None = None,
+        raise_for_status: bool | None = None,
     ) -> HttpResponse:
         return await self.request(
             "GET",
@@ -60,6 +227,7 @@ class AsyncHttpClient:
             headers=headers,
             timeout_sec=timeout_sec,
             budget=budget,
+            raise_for_status=raise_for_status,
         )
 
     async def post(
@@ -70,6 +238,7 @@ class AsyncHttpClient:
         body: bytes | None = None,
         timeout_sec: float | None = None,
         budget: TimeoutBudget | None = None,
+        raise_for_status: bool | None = None,
     ) -> HttpResponse:
         return await self.request(
             "POST",
@@ -78,12 +247,361 @@ class AsyncHttpClient:
             body=body,
             timeout_sec=timeout_sec,
             budget=budget,
+            raise_for_status=raise_for_status,
         )
 
-    @staticmethod
-    def _send(request: Request, timeout_sec: float | None) -> HttpResponse:
-        with urlopen(request, timeout=timeout_sec) as raw:  # noqa: S310
-            status = getattr(raw, "status", 200)
-            headers = {k: v for k, v in raw.headers.items()}
-            body = raw.read()
-            return HttpResponse(status=status, headers=headers, body=body)
+    async def aclose(self) -> None:
+        """Close idle connections opened on the running event loop."""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            pool.close()
+
+    def idle_connections(self, url: str) -> int:
+        target = _Target.parse(url)
+        pools = self._pools.get(asyncio.get_running_loop(), {})
+        pool = pools.get(target.key)
+        return 0 if pool is None else pool.idle_count
+
+    def _pool_for(self, target: _Target) -> _HostPool:
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        pool = pools.get(target.key)
+        if pool is None:
+            context = None
+            if target.scheme == "https":
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                context = self._ssl_context
+            pool = pools[target.key] = _HostPool(target, self._limits, context)
+        return pool
+
+
+@dataclass(slots=True)
+class _Target:
+    scheme: str
+    host: str
+    port: int
+    path: str
+
+    @classmethod
+    def parse(cls, url: str) -> _Target:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS:
+            raise ValueError(f"unsupported url scheme: {parts.scheme or '<none>'}")
+        if not parts.hostname:
+            raise ValueError("url must include a host")
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return cls(
+            scheme=scheme,
+            host=parts.hostname,
+            port=parts.port or _DEFAULT_PORTS[scheme],
+            path=path,
+        )
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.scheme, self.host, self.port)
+
+    @property
+    def host_header(self) -> str:
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        if self.port == _DEFAULT_PORTS[self.scheme]:
+            return host
+        return f"{host}:{self.port}"
+
+
+@dataclass(slots=True)
+class _Deadline:
+    expires_at: float | None
+
+    @classmethod
+    def start(cls, timeout_sec: float | None) -> _Deadline:
+        if timeout_sec is None:
+            return cls(expires_at=None)
+        return cls(expires_at=time.monotonic() + timeout_sec)
+
+    async def run(self, awaitable: Awaitable[_T]) -> _T:
+        if self.expires_at is None:
+            return await awaitable
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise TimeoutError("timeout budget expired")
+        try:
+            return await asyncio.wait_for(awaitable, remaining)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError("timeout budget expired") from exc
+
+
+@dataclass(slots=True)
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    reused: bool = False
+    idle_since: float = 0.0
+
+    def is_stale(self, now: float, idle_timeout_sec: float) -> bool:
+        return (
+            self.reader.at_eof()
+            or self.writer.is_closing()
+            or now - self.idle_since > idle_timeout_sec
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HostPool:
+    __slots__ = ("_target", "_limits", "_ssl_context", "_slots", "_idle")
+
+    def __init__(
+        self,
+        target: _Target,
+        limits: HttpPoolLimits,
+        ssl_context: ssl.SSLContext | None,
+    ) -> None:
+        self._target = target
+        self._limits = limits
+        self._ssl_context = ssl_context
+        self._slots = asyncio.Semaphore(limits.max_connections_per_host)
+        self._idle: deque[_Connection] = deque()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def acquire(self, deadline: _Deadline) -> _Connection:
+        await deadline.run(self._slots.acquire())
+        try:
+            now = time.monotonic()
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.is_stale(now, self._limits.idle_timeout_sec):
+                    conn.close()
+                    continue
+                conn.reused = True
+                return conn
+            return await deadline.run(self._connect())
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn: _Connection, *, reusable: bool) -> None:
+        if reusable and len(self._idle) < self._limits.max_idle_per_host:
+            conn.idle_since = time.monotonic()
+            self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _connect(self) -> _Connection:
+        target = self._target
+        if self._ssl_context is None:
+            reader, writer = await asyncio.open_connection(target.host, target.port)
+        else:
+            reader, writer = await asyncio.open_connection(
+                target.host,
+                target.port,
+                ssl=self._ssl_context,
+                server_hostname=target.host,
+            )
+        return _Connection(reader=reader, writer=writer)
+
+
+class _BodyReader:
+    __slots__ = ("_reader", "_deadline", "_remaining", "_chunked", "until_close", "complete")
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        deadline: _Deadline,
+        *,
+        length: int = 0,
+        chunked: bool = False,
+        until_close: bool = False,
+    ) -> None:
+        self._reader = reader
+        self._deadline = deadline
+        self._remaining = length
+        self._chunked = chunked
+        self.until_close = until_close
+        self.complete = length == 0 and not chunked and not until_close
+
+    @classmethod
+    def for_response(
+        cls,
+        reader: asyncio.StreamReader,
+        deadline: _Deadline,
+        method: str,
+        status: int,
+        headers: dict[str, str],
+    ) -> _BodyReader:
+        if method == "HEAD" or status in _BODYLESS_STATUSES or status < 200:
+            return cls(reader, deadline)
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            return cls(reader, deadline, chunked=True)
+        length = headers.get("content-length")
+        if length is not None:
+            try:
+                size = int(length)
+            except ValueError:
+                raise ConnectionError(f"invalid content-length: {length!r}") from None
+            if size < 0:
+                raise ConnectionError(f"invalid content-length: {length!r}")
+            return cls(reader, deadline, length=size)
+        return cls(reader, deadline, until_close=True)
+
+    async def next_chunk(self) -> bytes:
+        if self.complete:
+            return b""
+        if self.until_close:
+            data = await self._deadline.run(self._reader.read(_READ_CHUNK))
+            self.complete = not data
+            return data
+        if self._chunked and self._remaining == 0 and not await self._next_chunk_size():
+            return b""
+        data = await self._deadline.run(self._reader.read(min(self._remaining, _READ_CHUNK)))
+        if not data:
+            raise ConnectionError("connection closed before response body completed")
+        self._remaining -= len(data)
+        if self._remaining == 0:
+            if self._chunked:
+                await self._deadline.run(self._reader.readexactly(2))
+            else:
+                self.complete = True
+        return data
+
+    async def _next_chunk_size(self) -> bool:
+        line = await self._deadline.run(self._reader.readline())
+        try:
+            size = int(line.split(b";", 1)[0].strip(), 16)
+        except ValueError:
+            raise ConnectionError(f"invalid chunk size line: {line!r}") from None
+        if size > 0:
+            self._remaining = size
+            return True
+        while (await self._deadline.run(self._reader.readline())) not in (b"\r\n", b"\n", b""):
+            continue
+        self.complete = True
+        return False
+
+
+def _effective_timeout(timeout_sec: float | None, budget: TimeoutBudget | None) -> float | None:
+    effective_timeout = timeout_sec
+    if budget is not None:
+        budget_timeout = budget.remaining_sec
+        if effective_timeout is None:
+            effective_timeout = budget_timeout
+        else:
+            effective_timeout = min(effective_timeout, budget_timeout)
+    if effective_timeout is not None and effective_timeout <= 0:
+        raise TimeoutError("timeout budget expired")
+    return effective_timeout
+
+
+def _redirects(method: str, status: int) -> bool:
+    if status not in _REDIRECT_STATUSES:
+        return False
+    # Same rule as urllib's HTTPRedirectHandler.
+    return method in ("GET", "HEAD") or (method == "POST" and status in (301, 302, 303))
+
+
+def _without(headers: dict[str, str], names: frozenset[str]) -> dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in names}
+
+
+def _http_error(url: str, response: HttpResponse, reason: str | None = None) -> HTTPError:
+    message = HTTPMessage()
+    for name, value in response.headers.items():
+        message[name] = value
+    if reason is None:
+        try:
+            reason = HTTPStatus(response.status).phrase
+        except ValueError:
+            reason = ""
+    return HTTPError(url, response.status, reason, message, io.BytesIO(response.body))
+
+
+def _encode_head(
+    method: str,
+    target: _Target,
+    headers: dict[str, str],
+    body: bytes | None,
+) -> bytes:
+    if not _TOKEN.fullmatch(method):
+        raise ValueError(f"invalid request method: {method!r}")
+    present = {name.lower() for name in headers}
+    lines = [f"{method} {target.path} HTTP/1.1"]
+    if "host" not in present:
+        lines.append(f"Host: {target.host_header}")
+    if "content-length" not in present and (body is not None or method in {"POST", "PUT", "PATCH"}):
+        lines.append(f"Content-Length: {len(body or b'')}")
+    for name, value in headers.items():
+        if not _TOKEN.fullmatch(name):
+            raise ValueError(f"invalid header name: {name!r}")
+        if "\r" in value or "\n" in value:
+            raise ValueError(f"invalid header value for {name}")
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _exchange(
+    pool: _HostPool,
+    method: str,
+    head: bytes,
+    body: bytes | None,
+    deadline: _Deadline,
+) -> tuple[_Connection, int, dict[str, str], bool]:
+    while True:
+        conn = await pool.acquire(deadline)
+        try:
+            conn.writer.write(head + body if body else head)
+            await deadline.run(conn.writer.drain())
+            status, headers, keep_alive = await _read_head(conn.reader, deadline)
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            pool.release(conn, reusable=False)
+            if conn.reused and method in _IDEMPOTENT_METHODS:
+                # The server closed an idle keep-alive connection; retry on a fresh one.
+                continue
+            raise ConnectionError(f"{method} request failed: {exc}") from exc
+        except BaseException:
+            pool.release(conn, reusable=False)
+            raise
+        return conn, status, headers, keep_alive
+
+
+async def _read_head(
+    reader: asyncio.StreamReader,
+    deadline: _Deadline,
+) -> tuple[int, dict[str, str], bool]:
+    while True:
+        raw = await deadline.run(reader.readuntil(b"\r\n\r\n"))
+        lines = raw.decode("latin-1").split("\r\n")
+        version, _, rest = lines[0].partition(" ")
+        try:
+            status = int(rest[:3])
+        except ValueError:
+            raise ConnectionError(f"invalid status line: {lines[0]!r}") from None
+        if 100 <= status < 200 and status != 101:
+            continue
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, _, value = line.partition(":")
+            key = name.strip().lower()
+            value = value.strip()
+            headers[key] = f"{headers[key]}, {value}" if key in headers else value
+        tokens = {token.strip() for token in headers.get("connection", "").lower().split(",")}
+        if version.upper() == "HTTP/1.1":
+            keep_alive = "close" not in tokens
+        else:
+            keep_alive = "keep-alive" in tokens
+        return status, headers, keep_alive
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import AsyncIterable
 
 
 @dataclass(slots=True)
@@ -17,6 +18,11 @@ class MultipartUploadStream:
         if len(self._buffer) > self.max_bytes:
             raise ValueError("multipart payload exceeds max_bytes")
 
+    async def consume(self, chunks: AsyncIterable[bytes]) -> None:
+        async for chunk in chunks:
+            self.feed(chunk)
+        self.close()
+
     def close(self) -> None:
         self._closed = True
 
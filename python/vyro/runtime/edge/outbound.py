@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from ..platform.discovery import ServiceDiscoveryRegistry, ServiceEndpoint
+from ..resilience.bulkhead import OutboundBulkhead
+from ..resilience.circuit_breaker import OutboundCircuitBreaker
+from ..resilience.retry import RetryPolicy
+from ..resilience.timeout_budget import TimeoutBudget
+from .http_client import AsyncHttpClient, HttpResponse
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+class OutboundRejectedError(RuntimeError):
+    pass
+
+
+class CircuitOpenError(OutboundRejectedError):
+    pass
+
+
+class BulkheadFullError(OutboundRejectedError):
+    pass
+
+
+@dataclass(slots=True)
+class OutboundPipeline:
+    """Resilient outbound calls to discovered dependencies.
+
+    Each call resolves the dependency through ``discovery``, takes one bulkhead slot
+    for its whole lifetime (retries and hedges included) and consults a per-dependency
+    circuit breaker before every attempt. Idempotent calls retry with jittered
+    backoff while the budget still covers the delay; GETs may be hedged to a second
+    endpoint after ``hedge_after_sec``.
+    """
+
+    client: AsyncHttpClient
+    discovery: ServiceDiscoveryRegistry
+    bulkhead: OutboundBulkhead = field(default_factory=OutboundBulkhead)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    breaker: OutboundCircuitBreaker = field(default_factory=OutboundCircuitBreaker)
+    timeout_sec: float = 10.0
+    hedge_after_sec: float | None = None
+    retry_statuses: frozenset[int] = frozenset({502, 503, 504})
+    _breakers: dict[str, OutboundCircuitBreaker] = field(default_factory=dict, repr=False)
+    _cursors: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.timeout_sec <= 0:
+            raise ValueError("timeout_sec must be > 0")
+        if self.hedge_after_sec is not None and self.hedge_after_sec <= 0:
+            raise ValueError("hedge_after_sec must be > 0")
+
+    def breaker_for(self, service: str) -> OutboundCircuitBreaker:
+        """Per-dependency breaker configured like ``breaker``."""
+        breaker = self._breakers.get(service)
+        if breaker is None:
+            template = self.breaker
+            breaker = self._breakers[service] = OutboundCircuitBreaker(
+                failure_threshold=template.failure_threshold,
+                recovery_timeout_sec=template.recovery_timeout_sec,
+                half_open_max_calls=template.half_open_max_calls,
+                _clock=template._clock,  # noqa: SLF001
+            )
+        return breaker
+
+    async def request(
+        self,
+        service: str,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        budget: TimeoutBudget | None = None,
+    ) -> HttpResponse:
+        method = method.upper()
+        call_budget = self._call_budget(budget)
+        breaker = self.breaker_for(service)
+        if not self.bulkhead.acquire(service):
+            raise BulkheadFullError(f"bulkhead full for dependency: {service}")
+        try:
+            attempt = 1
+            while True:
+                if not breaker.allow_request():
+                    raise CircuitOpenError(f"circuit open for dependency: {service}")
+                try:
+                    if method == "GET" and self.hedge_after_sec is not None:
+                        response = await self._hedged(
+                            service, path, headers, call_budget, self.hedge_after_sec
+                        )
+                    else:
+                        response = await self._send(
+                            service, method, path, headers, body, call_budget
+                        )
+                except (ConnectionError, TimeoutError):
+                    breaker.record_failure()
+                    if not await self._backoff(method, attempt, call_budget):
+                        raise
+                else:
+                    if response.status < 500:
+                        breaker.record_success()
+                        return response
+                    breaker.record_failure()
+                    if response.status not in self.retry_statuses or not await self._backoff(
+                        method, attempt, call_budget
+                    ):
+                        return response
+                attempt += 1
+        finally:
+            self.bulkhead.release(service)
+
+    async def get(
+        self,
+        service: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        budget: TimeoutBudget | None = None,
+    ) -> HttpResponse:
+        return await self.request(service, "GET", path, headers=headers, budget=budget)
+
+    async def post(
+        self,
+        service: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        budget: TimeoutBudget | None = None,
+    ) -> HttpResponse:
+        return await self.request(
+            service, "POST", path, headers=headers, body=body, budget=budget
+        )
+
+    def _call_budget(self, budget: TimeoutBudget | None) -> TimeoutBudget:
+        if budget is None:
+            return TimeoutBudget(timeout_sec=self.timeout_sec)
+        if budget.is_expired():
+            raise TimeoutError("timeout budget expired")
+        return budget.child(self.timeout_sec)
+
+    async def _backoff(self, method: str, attempt: int, budget: TimeoutBudget) -> bool:
+        if method not in _IDEMPOTENT_METHODS or not self.retry.should_retry(attempt):
+            return False
+        delay = self.retry.next_delay(attempt)
+        if delay >= budget.remaining_sec:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def _send(
+        self,
+        service: str,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None,
+        body: bytes | None,
+        budget: TimeoutBudget,
+    ) -> HttpResponse:
+        endpoint = self._next_endpoint(service)
+        return await self.client.request(
+            method,
+            _join_url(endpoint, path),
+            headers=headers,
+            body=body,
+            budget=budget,
+            raise_for_status=False,
+        )
+
+    async def _hedged(
+        self,
+        service: str,
+        path: str,
+        headers: dict[str, str] | None,
+        budget: TimeoutBudget,
+        hedge_after_sec: float,
+    ) -> HttpResponse:
+        tasks = {asyncio.ensure_future(self._send(service, "GET", path, headers, None, budget))}
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=hedge_after_sec)
+            if not done and budget.remaining_sec > 0:
+                hedge = asyncio.ensure_future(self._send(service, "GET", path, headers, None, budget))
+                tasks.add(hedge)
+                pending = set(tasks)
+            while True:
+                for task in done:
+                    if task.exception() is None or not pending:
+                        return task.result()
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _next_endpoint(self, service: str) -> ServiceEndpoint:
+        endpoints = self.discovery.resolve(service)
+        if not endpoints:
+            raise LookupError(f"no endpoints discovered for dependency: {service}")
+        cursor = self._cursors.get(service, 0)
+        self._cursors[service] = cursor + 1
+        return endpoints[cursor % len(endpoints)]
+
+
+def _join_url(endpoint: ServiceEndpoint, path: str) -> str:
+    if not path.startswith("/"):
+        path = f"/{path}"
+    return f"{endpoint.url}{path}"
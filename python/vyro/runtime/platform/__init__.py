@@ -10,3 +10,5 @@ from .plugins import *  # noqa: F401,F403
 from .cache import *  # noqa: F401,F403
 from .cache_invalidation import *  # noqa: F401,F403
 from .response_cache import *  # noqa: F401,F403
+from .redis_cache import *  # noqa: F401,F403
+from .tiered_cache import *  # noqa: F401,F403
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import Any, Callable, Literal, Mapping, Protocol, Sequence
+
+CacheAdmission = Literal["tinylfu", "lru"]
+
+_SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+_MASK_64 = (1 << 64) - 1
+_SKETCH_MAX_COUNT = 15
+_PROTECTED_RATIO = 0.8
 
 
 class CacheBackend(Protocol):
@@ -16,6 +31,50 @@ class CacheBackend(Protocol):
         ...
 
 
+class AsyncCacheBackend(Protocol):
+    async def aget(self, key: str) -> Any | None:
+        ...
+
+    async def aset(self, key: str, value: Any, *, ttl_sec: float | None = None) -> None:
+        ...
+
+    async def amget(self, keys: Sequence[str]) -> list[Any | None]:
+        ...
+
+    async def amset(self, items: Mapping[str, Any], *, ttl_sec: float | None = None) -> None:
+        ...
+
+    async def adelete_many(self, keys: Sequence[str]) -> None:
+        ...
+
+
+@dataclass(slots=True)
+class AsyncCacheAdapter:
+    """Expose an in-process ``CacheBackend`` through the async cache protocol.
+
+    Calls run inline, so only wrap backends that never block (the memory backends).
+    """
+
+    backend: CacheBackend
+
+    async def aget(self, key: str) -> Any | None:
+        return self.backend.get(key)
+
+    async def aset(self, key: str, value: Any, *, ttl_sec: float | None = None) -> None:
+        self.backend.set(key, value, ttl_sec=ttl_sec)
+
+    async def amget(self, keys: Sequence[str]) -> list[Any | None]:
+        return [self.backend.get(key) for key in keys]
+
+    async def amset(self, items: Mapping[str, Any], *, ttl_sec: float | None = None) -> None:
+        for key, value in items.items():
+            self.backend.set(key, value, ttl_sec=ttl_sec)
+
+    async def adelete_many(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self.backend.delete(key)
+
+
 @dataclass(slots=True)
 class MemoryCacheBackend:
     _values: dict[str, tuple[Any, float | None]] = field(default_factory=dict)
@@ -37,6 +96,351 @@ class MemoryCacheBackend:
         self._values.pop(key, None)
 
 
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    rejections: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(slots=True)
+class BoundedMemoryCacheBackend:
+    """Size-bounded, sharded in-memory cache.
+
+    Keys hash to one of ``shards`` independently locked segments, so concurrent
+    threads only contend when they touch the same shard. ``shards`` is halved until
+    each shard holds at least one entry, and the shard caps sum to ``max_entries``.
+    Each shard is a segmented LRU (probation + protected); with
+    ``admission="tinylfu"`` a new key only displaces the probation victim when a
+    frequency sketch has seen it more often.
+    Expired entries are dropped on read and by ``sweep_expired``, which
+    ``start_sweeper`` runs on a background thread.
+    """
+
+    max_entries: int = 100_000
+    max_bytes: int | None = None
+    shards: int = 16
+    admission: CacheAdmission = "tinylfu"
+    sizer: Callable[[str, Any], int] | None = None
+    _clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _shards: tuple[_CacheShard, ...] = field(init=False, repr=False)
+    _sweeper: threading.Thread | None = field(default=None, init=False, repr=False)
+    _sweeper_stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if self.max_bytes is not None and self.max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if self.shards < 1 or self.shards & (self.shards - 1):
+            raise ValueError("shards must be a power of two")
+        if self.admission not in ("tinylfu", "lru"):
+            raise ValueError("admission must be 'tinylfu' or 'lru'")
+        if self.sizer is None and self.max_bytes is not None:
+            self.sizer = _estimate_size
+        # Every shard needs room for at least one entry (and byte), and the per-shard
+        # limits must add up to the configured caps rather than round past them.
+        smallest_cap = min(self.max_entries, self.max_bytes or self.max_entries)
+        while self.shards > smallest_cap:
+            self.shards //= 2
+        self._shards = tuple(
+            _CacheShard(
+                _split(self.max_entries, self.shards, index),
+                None if self.max_bytes is None else _split(self.max_bytes, self.shards, index),
+                self.admission == "tinylfu",
+            )
+            for index in range(self.shards)
+        )
+
+    def get(self, key: str) -> Any | None:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.get(key, self._clock)
+
+    def set(self, key: str, value: Any, *, ttl_sec: float | None = None) -> None:
+        expires_at = None if ttl_sec is None else self._clock() + ttl_sec
+        size = 0 if self.sizer is None else self.sizer(key, value)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.set(key, value, expires_at, size)
+
+    def delete(self, key: str) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.discard(key)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def stats(self) -> CacheStats:
+        totals = [0] * 7
+        for shard in self._shards:
+            with shard.lock:
+                counters = shard.counters()
+            totals = [total + value for total, value in zip(totals, counters)]
+        return CacheStats(*totals)
+
+    def sweep_expired(self) -> int:
+        """Drop expired entries from every shard; returns how many were removed."""
+        removed = 0
+        for shard in self._shards:
+            now = self._clock()
+            with shard.lock:
+                removed += shard.sweep(now)
+        return removed
+
+    def start_sweeper(self, interval_sec: float = 1.0) -> None:
+        if interval_sec <= 0:
+            raise ValueError("interval_sec must be > 0")
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._sweeper_stop.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_forever,
+            args=(interval_sec,),
+            name="vyro-cache-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        sweeper = self._sweeper
+        if sweeper is None:
+            return
+        self._sweeper_stop.set()
+        sweeper.join()
+        self._sweeper = None
+
+    def _sweep_forever(self, interval_sec: float) -> None:
+        while not self._sweeper_stop.wait(interval_sec):
+            self.sweep_expired()
+
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) & (self.shards - 1)]
+
+
+def _split(total: int, parts: int, index: int) -> int:
+    return total // parts + (1 if index < total % parts else 0)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float | None, size: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class _FrequencySketch:
+    """Count-min sketch with 4-bit saturating counters and periodic halving."""
+
+    __slots__ = ("_counters", "_shift", "_additions", "_sample_size")
+
+    def __init__(self, capacity: int) -> None:
+        bits = max(capacity * 4, 64).bit_length()
+        width = 1 << bits
+        self._counters = [bytearray(width) for _ in _SKETCH_SEEDS]
+        self._shift = 64 - bits
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def increment(self, key: str) -> None:
+        for row, slot in zip(self._counters, self._slots(key)):
+            if row[slot] < _SKETCH_MAX_COUNT:
+                row[slot] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        return min(row[slot] for row, slot in zip(self._counters, self._slots(key)))
+
+    def _slots(self, key: str) -> tuple[int, ...]:
+        # Multiply-shift with a distinct odd constant per row keeps the rows independent.
+        value = hash(key) & _MASK_64
+        return tuple(((value * seed) & _MASK_64) >> self._shift for seed in _SKETCH_SEEDS)
+
+    def _age(self) -> None:
+        for row in self._counters:
+            for slot, count in enumerate(row):
+                if count:
+                    row[slot] = count >> 1
+        self._additions //= 2
+
+
+class _CacheShard:
+    __slots__ = (
+        "lock",
+        "probation",
+        "protected",
+        "max_entries",
+        "max_bytes",
+        "protected_cap",
+        "sketch",
+        "bytes",
+        "hits",
+        "misses",
+        "evictions",
+        "rejections",
+        "expirations",
+    )
+
+    def __init__(self, max_entries: int, max_bytes: int | None, tinylfu: bool) -> None:
+        self.lock = threading.Lock()
+        self.probation: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.protected: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.protected_cap = max(1, int(max_entries * _PROTECTED_RATIO))
+        self.sketch = _FrequencySketch(max_entries) if tinylfu else None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.probation) + len(self.protected)
+
+    def get(self, key: str, clock: Callable[[], float]) -> Any | None:
+        if self.sketch is not None:
+            self.sketch.increment(key)
+        entry = self.protected.get(key)
+        segment = self.protected
+        if entry is None:
+            entry = self.probation.get(key)
+            segment = self.probation
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at is not None and clock() >= entry.expires_at:
+            self._remove(key, segment)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        if segment is self.protected:
+            segment.move_to_end(key)
+        else:
+            del self.probation[key]
+            self.protected[key] = entry
+            if len(self.protected) > self.protected_cap:
+                demoted, demoted_entry = self.protected.popitem(last=False)
+                self.probation[demoted] = demoted_entry
+        return entry.value
+
+    def set(self, key: str, value: Any, expires_at: float | None, size: int) -> None:
+        if self.sketch is not None:
+            self.sketch.increment(key)
+        for segment in (self.protected, self.probation):
+            entry = segment.get(key)
+            if entry is not None:
+                self.bytes += size - entry.size
+                entry.value, entry.expires_at, entry.size = value, expires_at, size
+                segment.move_to_end(key)
+                self._evict_overflow(keep=key)
+                return
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.rejections += 1
+            return
+        while self._over_capacity(len(self) + 1, self.bytes + size):
+            victim_key, segment = self._victim()
+            if self.sketch is not None and self.sketch.frequency(key) <= self.sketch.frequency(
+                victim_key
+            ):
+                self.rejections += 1
+                return
+            self._remove(victim_key, segment)
+            self.evictions += 1
+        self.probation[key] = _CacheEntry(value, expires_at, size)
+        self.bytes += size
+
+    def discard(self, key: str) -> None:
+        if key in self.protected:
+            self._remove(key, self.protected)
+        elif key in self.probation:
+            self._remove(key, self.probation)
+
+    def clear(self) -> None:
+        self.probation.clear()
+        self.protected.clear()
+        self.bytes = 0
+
+    def sweep(self, now: float) -> int:
+        removed = 0
+        for segment in (self.probation, self.protected):
+            expired = [
+                key
+                for key, entry in segment.items()
+                if entry.expires_at is not None and now >= entry.expires_at
+            ]
+            for key in expired:
+                self._remove(key, segment)
+            removed += len(expired)
+        self.expirations += removed
+        return removed
+
+    def counters(self) -> tuple[int, ...]:
+        return (
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.rejections,
+            self.expirations,
+            len(self),
+            self.bytes,
+        )
+
+    def _over_capacity(self, entries: int, size: int) -> bool:
+        if entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and size > self.max_bytes
+
+    def _victim(self) -> tuple[str, OrderedDict[str, _CacheEntry]]:
+        segment = self.probation if self.probation else self.protected
+        return next(iter(segment)), segment
+
+    def _evict_overflow(self, *, keep: str) -> None:
+        while self._over_capacity(len(self), self.bytes):
+            victim = next(
+                (
+                    (key, segment)
+                    for segment in (self.probation, self.protected)
+                    for key in segment
+                    if key != keep
+                ),
+                None,
+            )
+            if victim is None:
+                return
+            self._remove(*victim)
+            self.evictions += 1
+
+    def _remove(self, key: str, segment: OrderedDict[str, _CacheEntry]) -> None:
+        entry = segment.pop(key)
+        self.bytes -= entry.size
+
+
+def _estimate_size(key: str, value: Any) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
 @dataclass(slots=True)
 class RedisCacheBackend:
     client: Any
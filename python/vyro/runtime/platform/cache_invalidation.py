@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Protocol
 
 from .cache import CacheBackend
 
 
 InvalidationHook = Callable[[str], None]
 
+_PRUNE_EVERY = 1024
+
+# KEYS[1] is the key's reverse set, KEYS[2..] the tag sets; ARGV is the TTL in whole
+# seconds (0 for none), the key, then its tags. A set lives as long as its
+# longest-lived member: TTL -2 is a missing set, -1 a persistent one.
+_REDIS_ADD_SCRIPT = """
+local seconds = tonumber(ARGV[1])
+for i, name in ipairs(KEYS) do
+  local remaining = redis.call('TTL', name)
+  if i == 1 then
+    redis.call('SADD', name, unpack(ARGV, 3))
+  else
+    redis.call('SADD', name, ARGV[2])
+  end
+  if seconds == 0 then
+    if remaining >= 0 then
+      redis.call('PERSIST', name)
+    end
+  elseif remaining == -2 or (remaining >= 0 and remaining < seconds) then
+    redis.call('EXPIRE', name, seconds)
+  end
+end
+return 0
+"""
+
 
 @dataclass(slots=True)
 class CacheInvalidationHooks:
@@ -34,5 +60,204 @@ class CacheInvalidationHooks:
 
     def delete(self, backend: CacheBackend, key: str) -> None:
         backend.delete(key)
+        self.emit_delete(key)
+
+    def emit_delete(self, key: str) -> None:
+        """Notify delete hooks for a key removed outside ``delete`` (e.g. a shared tier)."""
         for hook in self._on_delete:
             hook(key)
+
+
+class TagStore(Protocol):
+    def add(self, key: str, tags: Iterable[str], *, ttl_sec: float | None = None) -> None:
+        ...
+
+    def pop_tag(self, tag: str) -> set[str]:
+        ...
+
+    def discard(self, key: str) -> None:
+        ...
+
+    def pop_all(self) -> set[str]:
+        ...
+
+
+@dataclass(slots=True)
+class MemoryTagStore:
+    """Process-local tag -> keys index; entries lapse with the TTL of their key."""
+
+    _keys_by_tag: dict[str, set[str]] = field(default_factory=dict)
+    _tags_by_key: dict[str, tuple[frozenset[str], float | None]] = field(default_factory=dict)
+    _writes: int = 0
+    _clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    def add(self, key: str, tags: Iterable[str], *, ttl_sec: float | None = None) -> None:
+        now = self._clock()
+        previous, _ = self._tags_by_key.get(key, (frozenset(), None))
+        merged = previous | frozenset(tags)
+        expires_at = None if ttl_sec is None else now + ttl_sec
+        self._tags_by_key[key] = (merged, expires_at)
+        for tag in merged - previous:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        self._writes += 1
+        if self._writes % _PRUNE_EVERY == 0:
+            self._prune(now)
+
+    def pop_tag(self, tag: str) -> set[str]:
+        keys = self._keys_by_tag.pop(tag, set())
+        for key in keys:
+            self.discard(key)
+        return keys
+
+    def pop_all(self) -> set[str]:
+        self._prune(self._clock())
+        keys = set(self._tags_by_key)
+        self._tags_by_key.clear()
+        self._keys_by_tag.clear()
+        return keys
+
+    def discard(self, key: str) -> None:
+        tags, _ = self._tags_by_key.pop(key, (frozenset(), None))
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key
+            for key, (_, expires_at) in self._tags_by_key.items()
+            if expires_at is not None and now >= expires_at
+        ]
+        for key in expired:
+            self.discard(key)
+
+
+@dataclass(slots=True)
+class RedisTagStore:
+    """Tag index kept in Redis sets so every worker sees the same groups.
+
+    ``add`` updates the key's sets and their TTLs in one atomic script call, so
+    workers tagging concurrently cannot shorten a set's lifetime. The sets for one
+    key span several hash slots, which Redis Cluster does not allow in one script.
+    """
+
+    client: Any
+    prefix: str = "vyro:tag:"
+
+    def add(self, key: str, tags: Iterable[str], *, ttl_sec: float | None = None) -> None:
+        tags = list(tags)
+        if not tags:
+            return
+        seconds = 0 if ttl_sec is None else max(1, int(ttl_sec) + 1)
+        names = [self._reverse(key), *(self._tag(tag) for tag in tags)]
+        self.client.eval(_REDIS_ADD_SCRIPT, len(names), *names, seconds, key, *tags)
+
+    def pop_tag(self, tag: str) -> set[str]:
+        name = self._tag(tag)
+        keys = {_text(member) for member in self.client.smembers(name)}
+        self.client.delete(name)
+        for key in keys:
+            self.discard(key)
+        return keys
+
+    def pop_all(self) -> set[str]:
+        reverse_prefix = self._reverse("")
+        keys: set[str] = set()
+        for name in list(self.client.scan_iter(match=f"{_glob_escape(self.prefix)}*")):
+            name = _text(name)
+            if name.startswith(reverse_prefix):
+                keys.add(name[len(reverse_prefix) :])
+            self.client.delete(name)
+        return keys
+
+    def discard(self, key: str) -> None:
+        reverse = self._reverse(key)
+        for tag in self.client.smembers(reverse):
+            self.client.srem(self._tag(_text(tag)), key)
+        self.client.delete(reverse)
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}{tag}"
+
+    def _reverse(self, key: str) -> str:
+        return f"{self.prefix}key:{key}"
+
+
+@dataclass(slots=True)
+class CacheTagIndex:
+    """Secondary index mapping tags (tenant, route template, entity, path prefix) to keys.
+
+    ``invalidate`` deletes every key carrying a tag from the given backend and emits
+    delete hooks per key, so tiered caches drop their local copies too.
+    """
+
+    store: TagStore = field(default_factory=MemoryTagStore)
+    hooks: CacheInvalidationHooks | None = None
+
+    def tag(
+        self,
+        key: str,
+        tags: Iterable[str] = (),
+        *,
+        path: str | None = None,
+        ttl_sec: float | None = None,
+    ) -> None:
+        all_tags = list(tags)
+        if path is not None:
+            all_tags.extend(path_prefix_tags(path))
+        if all_tags:
+            self.store.add(key, all_tags, ttl_sec=ttl_sec)
+
+    def invalidate(self, backend: CacheBackend, tag: str) -> int:
+        return self._drop(backend, self.store.pop_tag(tag))
+
+    def invalidate_prefix(self, backend: CacheBackend, prefix: str) -> int:
+        """Drop keys under ``prefix``; the root prefix drops every indexed key."""
+        prefix = _normalize_prefix(prefix)
+        if prefix == "/":
+            return self._drop(backend, self.store.pop_all())
+        return self.invalidate(backend, _prefix_tag(prefix))
+
+    def _drop(self, backend: CacheBackend, keys: set[str]) -> int:
+        for key in keys:
+            backend.delete(key)
+            if self.hooks is not None:
+                self.hooks.emit_delete(key)
+        return len(keys)
+
+
+def path_prefix_tags(path: str) -> list[str]:
+    """Tags for every segment boundary of ``path``: ``/v1/orders/7`` -> ``/v1``, ``/v1/orders``, ...
+
+    There is no root tag: it would collect every key in one ever-growing set.
+    """
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    tags: list[str] = []
+    current = ""
+    for segment in segments:
+        current = f"{current}/{segment}"
+        tags.append(_prefix_tag(current))
+    return tags
+
+
+def _normalize_prefix(prefix: str) -> str:
+    value = prefix.strip().rstrip("*").rstrip("/")
+    if not value.startswith("/"):
+        value = f"/{value}"
+    return value
+
+
+def _prefix_tag(prefix: str) -> str:
+    return f"prefix:{prefix}"
+
+
+def _glob_escape(value: str) -> str:
+    return "".join(f"\\{char}" if char in "*?[]\\" else char for char in value)
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
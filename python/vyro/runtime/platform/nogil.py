@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import os
+import sys
+import sysconfig
 from dataclasses import dataclass
 
 
+def is_free_threaded() -> bool:
+    """True when running on a free-threaded (no-GIL) CPython build with the GIL disabled."""
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return False
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or not is_gil_enabled()
+
+
 @dataclass(frozen=True, slots=True)
 class NoGILTuningProfile:
     mode: str
@@ -21,6 +32,13 @@ class NoGILTuningProfile:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    tokio_worker_threads: int
+    event_loops: int
+    free_threaded: bool
+
+
 @dataclass(slots=True)
 class NoGILWorkerTuner:
     def recommend(self, *, cpu_count: int, workload: str = "balanced") -> NoGILTuningProfile:
@@ -48,3 +66,32 @@ class NoGILWorkerTuner:
             tokio_worker_threads=tokio_threads,
             python_threads=python_threads,
         )
+
+    def plan(
+        self,
+        *,
+        workers: int,
+        event_loops: int | None = None,
+        workload: str = "balanced",
+        cpu_count: int | None = None,
+        free_threaded: bool | None = None,
+    ) -> ExecutionPlan:
+        """Size the native runtime; on free-threaded builds apply the tuning profile.
+
+        Each Python thread is an event loop thread, so ``python_threads`` becomes the
+        event loop count. Explicit ``event_loops`` always wins. With the GIL enabled,
+        extra loops only contend for the lock, so one loop is used by default.
+        """
+        nogil = is_free_threaded() if free_threaded is None else free_threaded
+        if not nogil:
+            return ExecutionPlan(
+                tokio_worker_threads=max(1, workers),
+                event_loops=max(1, event_loops or 1),
+                free_threaded=False,
+            )
+        profile = self.recommend(cpu_count=cpu_count or os.cpu_count() or 1, workload=workload)
+        return ExecutionPlan(
+            tokio_worker_threads=max(workers, profile.tokio_worker_threads),
+            event_loops=max(1, event_loops or profile.python_threads),
+            free_threaded=True,
+        )
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import os
+from typing import Any, Mapping, Sequence
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+
+from .cache_invalidation import CacheInvalidationHooks
+
+
+class RespError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
+class AsyncRedisCacheBackend:
+    """Asyncio Redis-protocol cache backend with automatic pipelining.
+
+    Each event loop gets ``pool_size`` multiplexed connections. Commands issued in the
+    same loop iteration are written to a connection as one batch, and replies are
+    matched back in order, so concurrent ``aget`` calls share round trips instead of
+    paying one each.
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 6379
+    prefix: str = "vyro:"
+    pool_size: int = 4
+    db: int = 0
+    password: str | None = None
+    connect_timeout_sec: float = 5.0
+    command_timeout_sec: float | None = None
+    decode_responses: bool = True
+    _pools: WeakKeyDictionary[asyncio.AbstractEventLoop, _RespPool] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        if self.connect_timeout_sec <= 0:
+            raise ValueError("connect_timeout_sec must be > 0")
+
+    async def aget(self, key: str) -> Any | None:
+        return self._decode(await self.execute("GET", self._k(key)))
+
+    async def aset(self, key: str, value: Any, *, ttl_sec: float | None = None) -> None:
+        await self.execute(*_set_command(self._k(key), value, ttl_sec))
+
+    async def amget(self, keys: Sequence[str]) -> list[Any | None]:
+        if not keys:
+            return []
+        values = await self.execute("MGET", *(self._k(key) for key in keys))
+        return [self._decode(value) for value in values]
+
+    async def amset(self, items: Mapping[str, Any], *, ttl_sec: float | None = None) -> None:
+        if not items:
+            return
+        if ttl_sec is None:
+            args: list[Any] = ["MSET"]
+            for key, value in items.items():
+                args.extend((self._k(key), value))
+            await self.execute(*args)
+            return
+        await asyncio.gather(
+            *(
+                self.execute(*_set_command(self._k(key), value, ttl_sec))
+                for key, value in items.items()
+            )
+        )
+
+    async def adelete_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self.execute("DEL", *(self._k(key) for key in keys))
+
+    async def execute(self, *args: Any) -> Any:
+        """Send one raw command through the pipelined pool and return its reply."""
+        pool = self._pool()
+        reply = pool.connection().send(_encode_command(args))
+        if self.command_timeout_sec is None:
+            return await reply
+        try:
+            return await asyncio.wait_for(reply, self.command_timeout_sec)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(f"redis command timed out: {args[0]}") from exc
+
+    async def aclose(self) -> None:
+        """Close the connections opened on the running event loop."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.close()
+
+    def _pool(self) -> _RespPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            setup: list[bytes] = []
+            if self.password is not None:
+                setup.append(_encode_command(("AUTH", self.password)))
+            if self.db:
+                setup.append(_encode_command(("SELECT", self.db)))
+            pool = self._pools[loop] = _RespPool(
+                [
+                    _RespConnection(self.host, self.port, setup, self.connect_timeout_sec)
+                    for _ in range(self.pool_size)
+                ]
+            )
+        return pool
+
+    def _decode(self, value: Any) -> Any:
+        if self.decode_responses and isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    def _k(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+
+@dataclass(slots=True)
+class RedisInvalidationBus:
+    """Fans cache invalidations out to every worker process over Redis pub/sub.
+
+    ``attach`` publishes each key deleted through ``hooks`` on ``channel`` and, from a
+    dedicated subscriber connection, re-emits keys published by other processes on the
+    same hooks, so ``TieredCacheService.drop_local`` runs in every worker. Messages
+    carry a per-process origin id; a process ignores its own. Publishes need a running
+    event loop; deletes emitted outside one are only applied locally.
+    """
+
+    backend: AsyncRedisCacheBackend
+    channel: str = "vyro:cache:invalidate"
+    reconnect_delay_sec: float = 1.0
+    received: int = field(default=0, init=False)
+    _origin: str = field(default_factory=lambda: f"{os.getpid()}-{uuid4().hex}", init=False, repr=False)
+    _hooks: CacheInvalidationHooks | None = field(default=None, init=False, repr=False)
+    _relaying: bool = field(default=False, init=False, repr=False)
+    _task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    _ready: asyncio.Event | None = field(default=None, init=False, repr=False)
+
+    def attach(self, hooks: CacheInvalidationHooks) -> None:
+        self._hooks = hooks
+        hooks.on_delete(self._publish)
+
+    async def start(self) -> bool:
+        """Start the subscriber on the running loop and wait until it is subscribed.
+
+        Returns ``False`` when that takes longer than ``connect_timeout_sec``; the
+        subscriber keeps reconnecting in the background.
+        """
+        ready = self._ready
+        if self._task is None or ready is None:
+            ready = self._ready = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+        try:
+            await asyncio.wait_for(ready.wait(), self.backend.connect_timeout_sec)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _publish(self, key: str) -> None:
+        if self._relaying:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.backend.execute("PUBLISH", self.channel, f"{self._origin}\n{key}"))
+        task.add_done_callback(_consume_failure)
+
+    def _deliver(self, payload: bytes) -> None:
+        origin, _, key = payload.decode("utf-8").partition("\n")
+        if origin == self._origin or self._hooks is None:
+            return
+        self.received += 1
+        self._relaying = True
+        try:
+            self._hooks.emit_delete(key)
+        finally:
+            self._relaying = False
+
+    async def _listen(self) -> None:
+        backend = self.backend
+        while True:
+            writer: asyncio.StreamWriter | None = None
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(backend.host, backend.port), backend.connect_timeout_sec
+                )
+                setup = [("AUTH", backend.password)] if backend.password is not None else []
+                for command in (*setup, ("SUBSCRIBE", self.channel)):
+                    writer.write(_encode_command(command))
+                for _ in setup:
+                    reply = await _read_reply(reader)
+                    if isinstance(reply, RespError):
+                        raise ConnectionError(f"redis auth failed: {reply}")
+                while True:
+                    reply = await _read_reply(reader)
+                    if not isinstance(reply, list) or len(reply) < 3:
+                        continue
+                    if reply[0] == b"subscribe" and self._ready is not None:
+                        self._ready.set()
+                    elif reply[0] == b"message":
+                        self._deliver(reply[2])
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                # Invalidations published while disconnected are lost; L1 copies still
+                # lapse after ``l1_ttl_sec``.
+                await asyncio.sleep(self.reconnect_delay_sec)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+
+def _consume_failure(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class _RespPool:
+    __slots__ = ("_connections", "_next")
+
+    def __init__(self, connections: list[_RespConnection]) -> None:
+        self._connections = connections
+        self._next = 0
+
+    def connection(self) -> _RespConnection:
+        count = len(self._connections)
+        start = self._next
+        self._next = (start + 1) % count
+        return min(
+            (self._connections[(start + offset) % count] for offset in range(count)),
+            key=lambda conn: conn.pending,
+        )
+
+    async def close(self) -> None:
+        for conn in self._connections:
+            await conn.close()
+
+
+class _RespConnection:
+    """One Redis connection carrying many in-flight commands in order.
+
+    Payloads queued in the same loop iteration are flushed with a single write. A
+    ``None`` slot in ``_waiters`` marks a setup reply (AUTH/SELECT) to discard.
+    """
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_setup",
+        "_timeout_sec",
+        "_writer",
+        "_connecting",
+        "_reader_task",
+        "_outbox",
+        "_waiters",
+        "_flush_scheduled",
+    )
+
+    def __init__(self, host: str, port: int, setup: list[bytes], timeout_sec: float) -> None:
+        self._host = host
+        self._port = port
+        self._setup = setup
+        self._timeout_sec = timeout_sec
+        self._writer: asyncio.StreamWriter | None = None
+        self._connecting: asyncio.Task[None] | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._outbox: list[bytes] = []
+        self._waiters: deque[asyncio.Future[Any] | None] = deque()
+        self._flush_scheduled = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._waiters)
+
+    def send(self, payload: bytes) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[Any] = loop.create_future()
+        self._waiters.append(waiter)
+        self._outbox.append(payload)
+        if self._writer is None:
+            if self._connecting is None:
+                self._connecting = loop.create_task(self._connect())
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return waiter
+
+    async def close(self) -> None:
+        for task in (self._connecting, self._reader_task):
+            if task is not None:
+                task.cancel()
+        self._connecting = self._reader_task = None
+        writer = self._writer
+        self._reset(ConnectionError("redis connection closed"))
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _connect(self) -> None:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), self._timeout_sec
+            )
+        except (OSError, asyncio.TimeoutError) as exc:
+            self._connecting = None
+            self._reset(ConnectionError(f"redis connect failed: {exc}"))
+            return
+        self._connecting = None
+        self._writer = writer
+        self._waiters.extendleft(None for _ in self._setup)
+        self._outbox[:0] = self._setup
+        self._flush()
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_replies(reader))
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if self._writer is None or not self._outbox:
+            return
+        self._writer.write(b"".join(self._outbox))
+        self._outbox.clear()
+
+    async def _read_replies(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                reply = await _read_reply(reader)
+                waiter = self._waiters.popleft()
+                if waiter is None or waiter.done():
+                    continue
+                if isinstance(reply, RespError):
+                    waiter.set_exception(reply)
+                else:
+                    waiter.set_result(reply)
+        except (ConnectionError, asyncio.IncompleteReadError, IndexError) as exc:
+            writer = self._writer
+            self._reader_task = None
+            self._reset(ConnectionError(f"redis connection lost: {exc}"))
+            if writer is not None:
+                writer.close()
+
+    def _reset(self, error: ConnectionError) -> None:
+        self._writer = None
+        self._outbox.clear()
+        self._flush_scheduled = False
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(error)
+
+
+def _set_command(key: str, value: Any, ttl_sec: float | None) -> tuple[Any, ...]:
+    if ttl_sec is None:
+        return ("SET", key, value)
+    return ("SET", key, value, "PX", max(1, int(ttl_sec * 1000)))
+
+
+def _encode_command(args: Sequence[Any]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = _to_bytes(arg)
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _to_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value).encode("ascii")
+    raise TypeError(f"unsupported redis argument type: {type(value).__name__}")
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("connection closed by server")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode("utf-8")
+    if kind == b"-":
+        return RespError(body.decode("utf-8"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        size = int(body)
+        if size < 0:
+            return None
+        data = await reader.readexactly(size + 2)
+        return data[:-2]
+    if kind == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(count)]
+    raise ConnectionError(f"unexpected redis reply: {line!r}")
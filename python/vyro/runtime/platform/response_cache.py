@@ -1,27 +1,83 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Iterable
+import warnings
+
+from vyro.typing import NativeRoute, RouteRecord
 
 from .cache import CacheBackend, MemoryCacheBackend
+from .cache_invalidation import CacheTagIndex
+
+
+NATIVE_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
 
 
 @dataclass(slots=True)
 class ResponseCachePolicy:
     default_ttl_sec: float = 30.0
+    native_max_bytes: int = 64 * 1024 * 1024
     _route_ttl: dict[tuple[str, str], float] = field(default_factory=dict)
+    _route_vary: dict[tuple[str, str], tuple[str, ...]] = field(default_factory=dict)
 
-    def set_ttl(self, *, method: str, route: str, ttl_sec: float) -> None:
-        self._route_ttl[(method.upper(), route)] = ttl_sec
+    def set_ttl(
+        self,
+        *,
+        method: str,
+        route: str,
+        ttl_sec: float,
+        vary: tuple[str, ...] = (),
+    ) -> None:
+        key = (method.upper(), route)
+        self._route_ttl[key] = ttl_sec
+        self._route_vary[key] = tuple(name.lower() for name in vary)
 
     def ttl_for(self, *, method: str, route: str) -> float:
         return self._route_ttl.get((method.upper(), route), self.default_ttl_sec)
 
+    def native_options(self, *, method: str, route: str) -> dict[str, Any]:
+        """Native cache options for a route template with an explicit TTL, else ``{}``."""
+        key = (method.upper(), route)
+        ttl = self._route_ttl.get(key)
+        if ttl is None or ttl <= 0 or key[0] not in NATIVE_CACHEABLE_METHODS:
+            return {}
+        return {"cache_ttl_sec": float(ttl), "cache_vary": list(self._route_vary.get(key, ()))}
+
+    def apply_native(self, routes: list[NativeRoute]) -> list[NativeRoute]:
+        applied: list[NativeRoute] = []
+        for method, path, dispatch, options in routes:
+            cache_options = self.native_options(method=method, route=path)
+            if cache_options:
+                options = {**options, **cache_options}
+            applied.append((method, path, dispatch, options))
+        return applied
+
+    def native_routes(self) -> list[tuple[str, str]]:
+        """``(method, route)`` pairs served from the native per-process cache."""
+        return [key for key in self._route_ttl if self.native_options(method=key[0], route=key[1])]
+
+    def native_cache_bytes(self) -> int:
+        if not any(method in NATIVE_CACHEABLE_METHODS for method, _ in self._route_ttl):
+            return 0
+        return self.native_max_bytes
+
 
 @dataclass(slots=True)
 class ResponseCacheService:
+    """Python-side response cache with tag, tenant and prefix invalidation.
+
+    ``route_source`` (wired to the app router) lets ``set`` derive the route template
+    and tenant of a concrete path. Routes with an explicit GET/HEAD TTL are served from
+    the native cache inside each worker process; ``invalidate_*`` cannot reach those
+    entries, which stay until their TTL lapses, and a ``RuntimeWarning`` says so.
+    """
+
     backend: CacheBackend = field(default_factory=MemoryCacheBackend)
     policy: ResponseCachePolicy = field(default_factory=ResponseCachePolicy)
+    tags: CacheTagIndex = field(default_factory=CacheTagIndex)
+    route_source: Callable[[], list[RouteRecord]] | None = None
+    _matchers: list[_RouteMatcher] = field(default_factory=list)
+    _matched_count: int = -1
 
     def make_key(self, *, method: str, path: str, query: str = "") -> str:
         suffix = f"?{query}" if query else ""
@@ -37,7 +93,122 @@ class ResponseCacheService:
         path: str,
         response: Any,
         query: str = "",
+        route: str | None = None,
+        tenant: str | None = None,
+        tags: Iterable[str] = (),
     ) -> None:
+        """Store a response tagged with its route template, tenant and path prefixes.
+
+        ``route`` and ``tenant`` default to those of the registered route matching
+        ``method`` and ``path``; without a match the concrete path is the route tag.
+        """
+        if route is None or tenant is None:
+            matched = self.resolve_route(method=method, path=path)
+            if matched is not None:
+                route = route or matched.normalized_path
+                tenant = tenant if tenant is not None else matched.tenant
         key = self.make_key(method=method, path=path, query=query)
-        ttl = self.policy.ttl_for(method=method, route=path)
+        template = route or path
+        ttl = self.policy.ttl_for(method=method, route=template)
         self.backend.set(key, response, ttl_sec=ttl)
+        entry_tags = [route_tag(template), *tags]
+        if tenant is not None:
+            entry_tags.append(tenant_tag(tenant))
+        self.tags.tag(key, entry_tags, path=path, ttl_sec=ttl)
+
+    def resolve_route(self, *, method: str, path: str) -> RouteRecord | None:
+        """Registered route serving ``method`` and ``path``; static segments win."""
+        method = method.upper()
+        segments = _segments(path)
+        best: _RouteMatcher | None = None
+        for matcher in self._route_matchers():
+            if matcher.record.method.upper() != method or not matcher.matches(segments):
+                continue
+            if best is None or matcher.rank < best.rank:
+                best = matcher
+        return best.record if best is not None else None
+
+    def invalidate_tag(self, tag: str) -> int:
+        return self.tags.invalidate(self.backend, tag)
+
+    def invalidate_route(self, route: str) -> int:
+        self._warn_native([template for _, template in self.policy.native_routes() if template == route])
+        return self.invalidate_tag(route_tag(route))
+
+    def invalidate_tenant(self, tenant: str) -> int:
+        self._warn_native(self._native_templates(lambda record: record.tenant == tenant))
+        return self.invalidate_tag(tenant_tag(tenant))
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        head = _segments(prefix)
+        self._warn_native(
+            self._native_templates(lambda record: _segments(record.normalized_path)[: len(head)] == head)
+        )
+        return self.tags.invalidate_prefix(self.backend, prefix)
+
+    def _native_templates(self, select: Callable[[RouteRecord], bool]) -> list[str]:
+        native = set(self.policy.native_routes())
+        if not native:
+            return []
+        if self.route_source is None:
+            # Without the route table there is no telling which native routes match.
+            return sorted({template for _, template in native})
+        return [
+            record.normalized_path
+            for record in self.route_source()
+            if (record.method.upper(), record.normalized_path) in native and select(record)
+        ]
+
+    def _warn_native(self, templates: list[str]) -> None:
+        if templates:
+            warnings.warn(
+                "response cache invalidation does not reach natively cached routes "
+                f"{sorted(set(templates))}; their entries stay until the route TTL lapses",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def _route_matchers(self) -> list[_RouteMatcher]:
+        if self.route_source is None:
+            return []
+        records = self.route_source()
+        if len(records) != self._matched_count:
+            self._matchers = [_RouteMatcher.compile(record) for record in records]
+            self._matched_count = len(records)
+        return self._matchers
+
+
+@dataclass(frozen=True, slots=True)
+class _RouteMatcher:
+    record: RouteRecord
+    segments: tuple[str, ...]
+    wildcard: bool
+    rank: tuple[int, int, int]
+
+    @classmethod
+    def compile(cls, record: RouteRecord) -> _RouteMatcher:
+        segments = tuple(_segments(record.normalized_path))
+        wildcard = bool(segments) and segments[-1].startswith("{*")
+        params = sum(1 for segment in segments if segment.startswith("{"))
+        # Fewer parameters first, then no wildcard, then the longer template.
+        return cls(record, segments, wildcard, (params, int(wildcard), -len(segments)))
+
+    def matches(self, path: list[str]) -> bool:
+        fixed = self.segments[:-1] if self.wildcard else self.segments
+        if len(path) < len(fixed) or (not self.wildcard and len(path) != len(fixed)):
+            return False
+        return all(
+            expected.startswith("{") or expected == actual for expected, actual in zip(fixed, path)
+        )
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def route_tag(route: str) -> str:
+    return f"route:{route}"
+
+
+def tenant_tag(tenant: str) -> str:
+    return f"tenant:{tenant}"
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from random import random
+from typing import Any, Awaitable, Callable
+from weakref import WeakKeyDictionary
+
+from .cache import AsyncCacheBackend, BoundedMemoryCacheBackend, CacheBackend
+from .cache_invalidation import CacheInvalidationHooks
+
+CacheLoader = Callable[[], Awaitable[Any]]
+EnvelopeCodec = Callable[[Any], Any]
+
+
+def _json_encode(record: Any) -> str:
+    """Default L2 codec: compact JSON, which Redis-protocol backends store as-is."""
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_decode(data: Any) -> Any:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+@dataclass(slots=True)
+class TieredCacheService:
+    """Process-local L1 in front of a shared async L2, with stampede protection.
+
+    ``get_or_load`` coalesces concurrent misses for a key into one loader call,
+    serves stale values for ``stale_ttl_sec`` past expiry while one background
+    refresh runs, and refreshes hot keys probabilistically before they expire
+    (XFetch, scaled by how long the loader took). L1 copies live at most
+    ``l1_ttl_sec``; ``invalidate`` drops them locally and emits through ``hooks``.
+    Hooks are process-local; attach a ``RedisInvalidationBus`` to them to reach
+    other worker processes. L2 records are JSON by default, so cached values must be
+    JSON-serializable (pass ``encode``/``decode`` for anything else).
+    """
+
+    l2: AsyncCacheBackend
+    l1: CacheBackend = field(default_factory=lambda: BoundedMemoryCacheBackend(max_entries=10_000))
+    l1_ttl_sec: float = 5.0
+    stale_ttl_sec: float = 30.0
+    early_expiry_beta: float = 1.0
+    hooks: CacheInvalidationHooks | None = None
+    encode: EnvelopeCodec = _json_encode
+    decode: EnvelopeCodec = _json_decode
+    _clock: Callable[[], float] = field(default=time.time, repr=False)
+    _rand: Callable[[], float] = field(default=random, repr=False)
+    _inflight: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Task[Any]]] = field(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.l1_ttl_sec <= 0:
+            raise ValueError("l1_ttl_sec must be > 0")
+        if self.stale_ttl_sec < 0:
+            raise ValueError("stale_ttl_sec must be >= 0")
+        if self.hooks is not None:
+            self.hooks.on_set(self.drop_local)
+            self.hooks.on_delete(self.drop_local)
+
+    async def get_or_load(self, key: str, loader: CacheLoader, *, ttl_sec: float) -> Any:
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be > 0")
+        envelope = await self._lookup(key)
+        if envelope is None:
+            return await self._load(key, loader, ttl_sec)
+        now = self._clock()
+        if now >= envelope.fresh_until or self._expire_early(envelope, now):
+            self._refresh(key, loader, ttl_sec)
+        return envelope.value
+
+    async def set(self, key: str, value: Any, *, ttl_sec: float, compute_sec: float = 0.0) -> None:
+        now = self._clock()
+        envelope = _Envelope(
+            value=value,
+            fresh_until=now + ttl_sec,
+            stale_until=now + ttl_sec + self.stale_ttl_sec,
+            compute_sec=compute_sec,
+        )
+        self._store_local(key, envelope, now)
+        await self.l2.aset(key, self.encode(envelope.as_record()), ttl_sec=ttl_sec + self.stale_ttl_sec)
+
+    async def invalidate(self, key: str) -> None:
+        self.l1.delete(key)
+        await self.l2.adelete_many([key])
+        if self.hooks is not None:
+            self.hooks.emit_delete(key)
+
+    def drop_local(self, key: str) -> None:
+        """Forget the L1 copy of ``key``; call this when another worker invalidates it."""
+        self.l1.delete(key)
+
+    async def _lookup(self, key: str) -> _Envelope | None:
+        now = self._clock()
+        envelope = self.l1.get(key)
+        if envelope is None:
+            record = await self.l2.aget(key)
+            if record is None:
+                return None
+            envelope = _Envelope.from_record(self.decode(record))
+            self._store_local(key, envelope, now)
+        if now >= envelope.stale_until:
+            return None
+        return envelope
+
+    def _expire_early(self, envelope: _Envelope, now: float) -> bool:
+        if envelope.compute_sec <= 0 or self.early_expiry_beta <= 0:
+            return False
+        gap = envelope.compute_sec * self.early_expiry_beta * -math.log(max(self._rand(), 1e-12))
+        return now + gap >= envelope.fresh_until
+
+    async def _load(self, key: str, loader: CacheLoader, ttl_sec: float) -> Any:
+        return await asyncio.shield(self._refresh(key, loader, ttl_sec))
+
+    def _refresh(self, key: str, loader: CacheLoader, ttl_sec: float) -> asyncio.Task[Any]:
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        task = inflight.get(key)
+        if task is None:
+            task = inflight[key] = loop.create_task(self._compute(key, loader, ttl_sec))
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+            task.add_done_callback(_consume_failure)
+        return task
+
+    async def _compute(self, key: str, loader: CacheLoader, ttl_sec: float) -> Any:
+        started = time.monotonic()
+        value = await loader()
+        await self.set(key, value, ttl_sec=ttl_sec, compute_sec=time.monotonic() - started)
+        return value
+
+    def _store_local(self, key: str, envelope: _Envelope, now: float) -> None:
+        ttl = min(self.l1_ttl_sec, envelope.stale_until - now)
+        if ttl > 0:
+            self.l1.set(key, envelope, ttl_sec=ttl)
+
+
+@dataclass(frozen=True, slots=True)
+class _Envelope:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    compute_sec: float = 0.0
+
+    def as_record(self) -> dict[str, Any]:
+        return {"v": self.value, "f": self.fresh_until, "s": self.stale_until, "c": self.compute_sec}
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> _Envelope:
+        return cls(
+            value=record["v"],
+            fresh_until=float(record["f"]),
+            stale_until=float(record["s"]),
+            compute_sec=float(record.get("c", 0.0)),
+        )
+
+
+def _consume_failure(task: asyncio.Task[Any]) -> None:
+    # A failed background refresh keeps the stale value served; mark the error as
+    # retrieved so asyncio does not report it when no caller awaited the task.
+    if not task.cancelled():
+        task.exception()
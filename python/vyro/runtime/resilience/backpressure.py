@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(slots=True)
@@ -21,6 +22,9 @@ class BackpressureController:
         if self._inflight > 0:
             self._inflight -= 1
 
+    def as_native(self) -> dict[str, Any]:
+        return {"max_inflight": max(1, self.max_inflight)}
+
     @property
     def inflight(self) -> int:
         return self._inflight
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from time import monotonic
-from typing import Hashable
+from typing import Any, Hashable
+
+NATIVE_CLIENT_IP_KEY = "client_ip"
 
 
 @dataclass(slots=True)
@@ -52,6 +54,18 @@ class MultiKeyRateLimiter:
         bucket = self._bucket_for(keys)
         return bucket.tokens
 
+    def as_native(self, key: str = NATIVE_CLIENT_IP_KEY) -> dict[str, Any]:
+        """Export for native enforcement keyed on ``client_ip`` or ``header:<name>``."""
+        if key != NATIVE_CLIENT_IP_KEY and not (
+            key.startswith("header:") and key.removeprefix("header:").strip()
+        ):
+            raise ValueError("rate limit key must be 'client_ip' or 'header:<name>'")
+        return {
+            "rate_per_sec": float(self.rate_per_sec),
+            "burst": max(1, int(self.burst)),
+            "key": key,
+        }
+
     def _bucket_for(self, keys: tuple[Hashable, ...]) -> TokenBucketRateLimiter:
         bucket = self._buckets.get(keys)
         if bucket is None:
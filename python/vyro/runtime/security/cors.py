@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 CORSProfileName = Literal["strict", "standard", "permissive"]
 
@@ -73,5 +73,14 @@ class CORSProfile:
 
         return headers
 
+    def as_native(self) -> dict[str, Any]:
+        return {
+            "allow_origins": list(self.allow_origins),
+            "allow_methods": [method.upper() for method in self.allow_methods],
+            "allow_headers": list(self.allow_headers),
+            "allow_credentials": self.allow_credentials,
+            "max_age": max(0, int(self.max_age)),
+        }
+
     def _origin_allowed(self, origin: str) -> bool:
         return "*" in self.allow_origins or origin in self.allow_origins
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import importlib
-from typing import Any, Callable
+from functools import partial
+from typing import Any
+
+from vyro.runtime.supervisor import WorkerSupervisor
+from vyro.typing import NativeRoute
 
 
 def run_native_server(
     host: str,
     port: int,
     workers: int,
-    routes: list[tuple[str, str, Callable[..., Any]]],
+    routes: list[NativeRoute],
+    *,
+    event_loops: int = 1,
+    response_cache_bytes: int = 0,
+    processes: int = 1,
+    guards: dict[str, Any] | None = None,
+    metrics: dict[str, Any] | None = None,
 ) -> None:
     native = importlib.import_module("vyro._native")
-    native.start_server(host, port, max(workers, 1), routes)
+    start = partial(
+        native.start_server,
+        host,
+        port,
+        max(workers, 1),
+        routes,
+        max(event_loops, 1),
+        max(response_cache_bytes, 0),
+        guards=guards,
+        metrics=metrics,
+    )
+    if processes <= 1:
+        start()
+        return
+    supervisor = WorkerSupervisor(target=partial(start, reuse_port=True), processes=processes)
+    if supervisor.run() != 0:
+        raise RuntimeError("worker processes exceeded the restart limit")
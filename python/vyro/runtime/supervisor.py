@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+_FORWARDED_SIGNALS = ("SIGTERM", "SIGINT", "SIGHUP")
+
+
+@dataclass(slots=True)
+class WorkerSupervisor:
+    """Pre-fork supervisor that keeps ``processes`` copies of ``target`` running.
+
+    Children inherit the compiled route plan and each binds its own listener with
+    SO_REUSEPORT. Crashed children are restarted within a restart budget;
+    SIGTERM/SIGINT stop the group and SIGHUP recycles every worker.
+    """
+
+    target: Callable[[], None]
+    processes: int
+    max_restarts: int = 10
+    restart_window_sec: float = 60.0
+    shutdown_timeout_sec: float = 30.0
+    poll_interval_sec: float = 0.1
+    _children: dict[int, int] = field(default_factory=dict)
+    _restarts: deque[float] = field(default_factory=deque)
+    _recycling: set[int] = field(default_factory=set)
+    _stopping: bool = False
+    _stop_started: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.processes < 1:
+            raise ValueError("processes must be >= 1")
+        if not hasattr(os, "fork"):
+            raise RuntimeError("multi-process mode requires a POSIX platform with fork()")
+
+    @property
+    def children(self) -> dict[int, int]:
+        return dict(self._children)
+
+    def run(self) -> int:
+        previous = self._install_signal_handlers()
+        try:
+            for slot in range(self.processes):
+                self._spawn(slot)
+            return self._supervise()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def stop(self, signum: int = signal.SIGTERM) -> None:
+        if not self._stopping:
+            self._stopping = True
+            self._stop_started = time.monotonic()
+        self._signal_children(signum)
+
+    def _supervise(self) -> int:
+        exit_code = 0
+        while self._children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                self._escalate_if_overdue()
+                time.sleep(self.poll_interval_sec)
+                continue
+            slot = self._children.pop(pid, None)
+            if slot is None or self._stopping:
+                continue
+            if pid in self._recycling:
+                self._recycling.discard(pid)
+                self._spawn(slot)
+                continue
+            if os.waitstatus_to_exitcode(status) == 0:
+                continue
+            if not self._allow_restart():
+                exit_code = 1
+                self.stop()
+                continue
+            self._spawn(slot)
+        return exit_code
+
+    def _spawn(self, slot: int) -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self._run_child()
+        self._children[pid] = slot
+
+    def _run_child(self) -> None:
+        code = 0
+        try:
+            for name in _FORWARDED_SIGNALS:
+                signum = getattr(signal, name, None)
+                if signum is not None:
+                    signal.signal(signum, signal.SIG_DFL)
+            self.target()
+        except BaseException:  # noqa: BLE001 - a child must never return into the parent's stack
+            import traceback
+
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _allow_restart(self) -> bool:
+        now = time.monotonic()
+        while self._restarts and now - self._restarts[0] > self.restart_window_sec:
+            self._restarts.popleft()
+        if len(self._restarts) >= self.max_restarts:
+            return False
+        self._restarts.append(now)
+        return True
+
+    def _escalate_if_overdue(self) -> None:
+        if self._stop_started is None:
+            return
+        if time.monotonic() - self._stop_started < self.shutdown_timeout_sec:
+            return
+        self._signal_children(signal.SIGKILL)
+        self._stop_started = None
+
+    def _signal_children(self, signum: int) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                continue
+
+    def _install_signal_handlers(self) -> dict[int, object]:
+        previous: dict[int, object] = {}
+        for name in _FORWARDED_SIGNALS:
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            previous[signum] = signal.signal(signum, self._handle_signal)
+        return previous
+
+    def _handle_signal(self, signum: int, _frame: object) -> None:
+        if signum == getattr(signal, "SIGHUP", None):
+            self._recycling.update(self._children)
+            self._signal_children(signal.SIGTERM)
+            return
+        self.stop(signal.SIGTERM)
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
 
-Handler = Callable[[dict], Awaitable[object]]
-NativeRoute = tuple[str, str, Handler]
+Handler = Callable[[Any], Awaitable[object]]
+NativeRoute = tuple[str, str, Handler, dict[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class RouteOptions:
+    stream_body: bool = False
+    max_body_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_body_bytes is not None and self.max_body_bytes < 0:
+            raise ValueError("max_body_bytes must be >= 0")
+
+    def as_native(self) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if self.stream_body:
+            options["stream_body"] = True
+        if self.max_body_bytes is not None:
+            options["max_body_bytes"] = self.max_body_bytes
+        return options
 
 
 @dataclass(slots=True)
@@ -18,3 +36,4 @@ class RouteRecord:
     version: str | None = None
     deprecated: str | None = None
     tenant: str | None = None
+    options: RouteOptions = field(default_factory=RouteOptions)
@@ -0,0 +1,235 @@
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Mutex;
+use std::thread::{self, JoinHandle};
+
+use pyo3::exceptions::PyRuntimeError;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyTuple};
+use pyo3_async_runtimes::TaskLocals;
+
+/// Long-lived asyncio event loops, each running on its own OS thread until shutdown.
+///
+/// Handlers are scheduled onto these loops with `call_soon_threadsafe` and awaited
+/// from tokio as Rust futures, so no loop is created per request and the GIL is only
+/// held while Python code actually runs. On free-threaded builds the loops run
+/// handlers truly in parallel. `shutdown` (also run on drop) stops every loop,
+/// cancels its remaining tasks and joins the threads.
+pub struct EventLoopPool {
+    loops: Vec<LoopSlot>,
+    next: AtomicUsize,
+    threads: Mutex<Vec<JoinHandle<()>>>,
+}
+
+struct LoopSlot {
+    locals: TaskLocals,
+    inflight: AtomicUsize,
+}
+
+/// Loop assignment for one request; releases its in-flight slot on drop.
+pub struct LoopLease<'a> {
+    slot: &'a LoopSlot,
+}
+
+impl LoopLease<'_> {
+    pub fn locals(&self) -> &TaskLocals {
+        &self.slot.locals
+    }
+}
+
+impl Drop for LoopLease<'_> {
+    fn drop(&mut self) {
+        self.slot.inflight.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+impl EventLoopPool {
+    pub fn start(py: Python<'_>, size: usize) -> PyResult<Self> {
+        let asyncio = py.import("asyncio")?;
+        let size = size.max(1);
+        let mut pool = Self {
+            loops: Vec::with_capacity(size),
+            next: AtomicUsize::new(0),
+            threads: Mutex::new(Vec::with_capacity(size)),
+        };
+        for idx in 0..size {
+            let event_loop = asyncio.call_method0("new_event_loop")?;
+            let locals = TaskLocals::new(event_loop.clone()).copy_context(py)?;
+            let runner = event_loop.unbind();
+            // On error the loops started so far are stopped when `pool` drops.
+            let handle = thread::Builder::new()
+                .name(format!("vyro-py-loop-{idx}"))
+                .spawn(move || run_until_stopped(runner))
+                .map_err(|e| PyRuntimeError::new_err(format!("failed to start event loop: {e}")))?;
+            pool.loops.push(LoopSlot {
+                locals,
+                inflight: AtomicUsize::new(0),
+            });
+            if let Ok(mut threads) = pool.threads.lock() {
+                threads.push(handle);
+            }
+        }
+        Ok(pool)
+    }
+
+    /// Stop every loop and join its thread; later calls do nothing.
+    ///
+    /// Each loop cancels the tasks still pending on it and waits for them to unwind
+    /// before closing, so handlers get their `finally` blocks run.
+    pub fn shutdown(&self) {
+        let threads = match self.threads.lock() {
+            Ok(mut threads) => std::mem::take(&mut *threads),
+            Err(_) => return,
+        };
+        if threads.is_empty() {
+            return;
+        }
+        Python::with_gil(|py| {
+            for slot in &self.loops {
+                let event_loop = slot.locals.event_loop(py);
+                let stopped = event_loop
+                    .getattr("stop")
+                    .and_then(|stop| event_loop.call_method1("call_soon_threadsafe", (stop,)));
+                if let Err(err) = stopped {
+                    err.print(py);
+                }
+            }
+            py.allow_threads(|| {
+                for handle in threads {
+                    let _ = handle.join();
+                }
+            });
+        });
+    }
+
+    /// Assign a request to the loop with the fewest in-flight handlers.
+    ///
+    /// The scan starts at a rotating offset so ties spread round-robin instead of
+    /// piling onto the first loop.
+    pub fn acquire(&self) -> LoopLease<'_> {
+        let count = self.loops.len();
+        let slot = if count == 1 {
+            &self.loops[0]
+        } else {
+            let start = self.next.fetch_add(1, Ordering::Relaxed) % count;
+            (0..count)
+                .map(|offset| &self.loops[(start + offset) % count])
+                .min_by_key(|slot| slot.inflight.load(Ordering::Relaxed))
+                .unwrap_or(&self.loops[start])
+        };
+        slot.inflight.fetch_add(1, Ordering::Relaxed);
+        LoopLease { slot }
+    }
+}
+
+impl Drop for EventLoopPool {
+    fn drop(&mut self) {
+        self.shutdown();
+    }
+}
+
+fn run_until_stopped(event_loop: Py<PyAny>) {
+    Python::with_gil(|py| {
+        let event_loop = event_loop.bind(py);
+        let result = py.import("asyncio").and_then(|asyncio| {
+            asyncio.call_method1("set_event_loop", (event_loop,))?;
+            event_loop.call_method0("run_forever")?;
+            close_loop(&asyncio, event_loop)
+        });
+        if let Err(err) = result {
+            err.print(py);
+        }
+    });
+}
+
+/// Cancel the tasks left on a stopped loop, let them unwind, then close it
+/// (the same cleanup `asyncio.run` performs).
+fn close_loop(asyncio: &Bound<'_, PyModule>, event_loop: &Bound<'_, PyAny>) -> PyResult<()> {
+    let py = asyncio.py();
+    let tasks = asyncio.call_method1("all_tasks", (event_loop,))?;
+    let tasks = PyTuple::new(py, tasks.try_iter()?.collect::<PyResult<Vec<_>>>()?)?;
+    if !tasks.is_empty() {
+        for task in tasks.iter() {
+            task.call_method0("cancel")?;
+        }
+        let options = PyDict::new(py);
+        options.set_item("return_exceptions", true)?;
+        let gathered = asyncio.call_method("gather", tasks, Some(&options))?;
+        event_loop.call_method1("run_until_complete", (gathered,))?;
+    }
+    let asyncgens = event_loop.call_method0("shutdown_asyncgens")?;
+    event_loop.call_method1("run_until_complete", (asyncgens,))?;
+    event_loop.call_method0("close")?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::EventLoopPool;
+    use pyo3::prelude::*;
+
+    #[test]
+    fn pool_awaits_coroutines_on_persistent_loop() {
+        pyo3::prepare_freethreaded_python();
+        let (_pool, pending) = Python::with_gil(|py| {
+            let pool = EventLoopPool::start(py, 1).expect("event loop should start");
+            let coroutine = py
+                .import("asyncio")
+                .and_then(|asyncio| asyncio.call_method1("sleep", (0, 42)))
+                .expect("sleep coroutine should be created");
+            let lease = pool.acquire();
+            let pending = pyo3_async_runtimes::into_future_with_locals(lease.locals(), coroutine)
+                .expect("coroutine should convert into a future");
+            (pool, pending)
+        });
+        let runtime = tokio::runtime::Builder::new_current_thread()
+            .enable_all()
+            .build()
+            .expect("runtime should build");
+        let value = runtime
+            .block_on(pending)
+            .expect("coroutine should complete");
+        Python::with_gil(|py| assert_eq!(value.extract::<i64>(py).unwrap(), 42));
+    }
+
+    #[test]
+    fn shutdown_cancels_pending_tasks_and_joins_threads() {
+        pyo3::prepare_freethreaded_python();
+        let pool = Python::with_gil(|py| EventLoopPool::start(py, 2).expect("loops should start"));
+        let event_loop = Python::with_gil(|py| {
+            let lease = pool.acquire();
+            let event_loop = lease.locals().event_loop(py);
+            let sleep = py
+                .import("asyncio")
+                .and_then(|asyncio| asyncio.call_method1("sleep", (3600,)))
+                .expect("sleep coroutine should be created");
+            py.import("asyncio")
+                .and_then(|asyncio| {
+                    asyncio.call_method1("run_coroutine_threadsafe", (sleep, event_loop.clone()))
+                })
+                .expect("coroutine should be scheduled");
+            event_loop.unbind()
+        });
+        pool.shutdown();
+        Python::with_gil(|py| {
+            let closed: bool = event_loop
+                .bind(py)
+                .call_method0("is_closed")
+                .and_then(|closed| closed.extract())
+                .expect("loop state should be readable");
+            assert!(closed);
+        });
+        pool.shutdown();
+    }
+
+    #[test]
+    fn acquire_prefers_least_loaded_loop() {
+        pyo3::prepare_freethreaded_python();
+        let pool = Python::with_gil(|py| EventLoopPool::start(py, 2).expect("loops should start"));
+        let first = pool.acquire();
+        let second = pool.acquire();
+        assert!(!std::ptr::eq(first.locals(), second.locals()));
+        drop(first);
+        let third = pool.acquire();
+        assert!(!std::ptr::eq(third.locals(), second.locals()));
+    }
+}
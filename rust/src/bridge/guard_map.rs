@@ -0,0 +1,74 @@
+use http::HeaderName;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+use crate::middleware::guards::{
+    BackpressureGuard, CorsGuard, NativeGuards, RateLimitGuard, RateLimitKey,
+};
+
+/// Parse the guard spec exported by `Vyro.enable_native_guards`.
+pub fn parse_guards(obj: Option<&Bound<'_, PyAny>>) -> PyResult<NativeGuards> {
+    let Some(obj) = obj.filter(|obj| !obj.is_none()) else {
+        return Ok(NativeGuards::default());
+    };
+    let spec = obj
+        .downcast::<PyDict>()
+        .map_err(|_| PyValueError::new_err("guards must be a dict"))?;
+    let mut guards = NativeGuards::default();
+    if let Some(cors) = spec.get_item("cors")? {
+        let cors = cors
+            .downcast::<PyDict>()
+            .map_err(|_| PyValueError::new_err("guards['cors'] must be a dict"))?;
+        guards.cors = Some(
+            CorsGuard::new(
+                required(cors, "allow_origins")?,
+                required(cors, "allow_methods")?,
+                required(cors, "allow_headers")?,
+                required(cors, "allow_credentials")?,
+                required(cors, "max_age")?,
+            )
+            .map_err(PyValueError::new_err)?,
+        );
+    }
+    if let Some(limit) = spec.get_item("rate_limit")? {
+        let limit = limit
+            .downcast::<PyDict>()
+            .map_err(|_| PyValueError::new_err("guards['rate_limit'] must be a dict"))?;
+        let key: String = required(limit, "key")?;
+        let key = match key.strip_prefix("header:") {
+            Some(name) => RateLimitKey::Header(
+                HeaderName::from_bytes(name.trim().to_ascii_lowercase().as_bytes()).map_err(
+                    |e| PyValueError::new_err(format!("invalid rate limit header: {e}")),
+                )?,
+            ),
+            None if key == "client_ip" => RateLimitKey::ClientIp,
+            None => {
+                return Err(PyValueError::new_err(
+                    "rate limit key must be 'client_ip' or 'header:<name>'",
+                ))
+            }
+        };
+        guards.rate_limit = Some(RateLimitGuard::new(
+            required(limit, "rate_per_sec")?,
+            required(limit, "burst")?,
+            key,
+        ));
+    }
+    if let Some(backpressure) = spec.get_item("backpressure")? {
+        let backpressure = backpressure
+            .downcast::<PyDict>()
+            .map_err(|_| PyValueError::new_err("guards['backpressure'] must be a dict"))?;
+        guards.backpressure = Some(BackpressureGuard::new(required(
+            backpressure,
+            "max_inflight",
+        )?));
+    }
+    Ok(guards)
+}
+
+fn required<'py, T: FromPyObject<'py>>(dict: &Bound<'py, PyDict>, key: &str) -> PyResult<T> {
+    dict.get_item(key)?
+        .ok_or_else(|| PyValueError::new_err(format!("missing guard option '{key}'")))?
+        .extract()
+}
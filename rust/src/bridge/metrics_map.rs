@@ -0,0 +1,46 @@
+use std::time::Duration;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+use crate::observability::metrics::{PythonMetrics, ServerMetrics};
+
+/// Parse the metrics spec exported by `Vyro.enable_native_metrics`.
+pub fn parse_metrics(obj: Option<&Bound<'_, PyAny>>) -> PyResult<Option<ServerMetrics>> {
+    let Some(obj) = obj.filter(|obj| !obj.is_none()) else {
+        return Ok(None);
+    };
+    let spec = obj
+        .downcast::<PyDict>()
+        .map_err(|_| PyValueError::new_err("metrics must be a dict"))?;
+    let path: String = match spec.get_item("path")? {
+        Some(path) => path.extract()?,
+        None => "/metrics".to_string(),
+    };
+    if !path.starts_with('/') {
+        return Err(PyValueError::new_err("metrics path must start with '/'"));
+    }
+    let refresh: f64 = match spec.get_item("python_refresh_sec")? {
+        Some(value) => value.extract()?,
+        None => 5.0,
+    };
+    if !refresh.is_finite() || refresh < 0.0 {
+        return Err(PyValueError::new_err(
+            "python_refresh_sec must be a finite number >= 0",
+        ));
+    }
+    let python = match spec.get_item("render")? {
+        Some(render) if !render.is_none() => {
+            if !render.is_callable() {
+                return Err(PyValueError::new_err("metrics['render'] must be callable"));
+            }
+            Some(PythonMetrics::new(
+                render.unbind(),
+                Duration::from_secs_f64(refresh),
+            ))
+        }
+        _ => None,
+    };
+    Ok(Some(ServerMetrics::new(path, python)))
+}
@@ -1,5 +1,11 @@
 pub mod callback;
 pub mod context_map;
+pub mod event_loop;
+pub mod guard_map;
+pub mod metrics_map;
 pub mod py_entry;
+pub mod request_view;
 pub mod response_map;
+pub mod response_stream;
+pub mod response_view;
 pub mod route_map;
@@ -1,23 +1,54 @@
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
+use crate::bridge::event_loop::EventLoopPool;
+use crate::bridge::guard_map::parse_guards;
+use crate::bridge::metrics_map::parse_metrics;
 use crate::bridge::route_map::parse_routes;
+use crate::cache::response_cache::ResponseCache;
 use crate::errors::py_error::to_py_runtime;
-use crate::lifecycle::runtime::run;
+use crate::lifecycle::runtime::{run, ListenConfig};
 
 #[pyfunction]
+#[allow(clippy::too_many_arguments)]
+#[pyo3(signature = (
+    host,
+    port,
+    workers,
+    routes,
+    event_loops = 1,
+    response_cache_bytes = 0,
+    reuse_port = false,
+    guards = None,
+    metrics = None
+))]
 pub fn start_server(
     py: Python<'_>,
     host: String,
     port: u16,
     workers: usize,
     routes: Bound<'_, PyAny>,
+    event_loops: usize,
+    response_cache_bytes: usize,
+    reuse_port: bool,
+    guards: Option<Bound<'_, PyAny>>,
+    metrics: Option<Bound<'_, PyAny>>,
 ) -> PyResult<()> {
     if host.trim().is_empty() {
         return Err(PyValueError::new_err("host cannot be empty"));
     }
     let routes = parse_routes(&routes)?;
+    let guards = parse_guards(guards.as_ref())?;
+    let metrics = parse_metrics(metrics.as_ref())?;
     let workers = workers.max(1);
-    py.allow_threads(move || run(host, port, workers, routes))
+    let loops = EventLoopPool::start(py, event_loops)?;
+    let cache = (response_cache_bytes > 0).then(|| ResponseCache::new(response_cache_bytes));
+    let listen = ListenConfig {
+        host,
+        port,
+        workers,
+        reuse_port,
+    };
+    py.allow_threads(move || run(listen, routes, loops, cache, guards, metrics))
         .map_err(to_py_runtime)
 }
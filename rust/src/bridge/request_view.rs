@@ -0,0 +1,178 @@
+use std::sync::OnceLock;
+
+use bytes::Bytes;
+use http::HeaderMap;
+use pyo3::create_exception;
+use pyo3::exceptions::{PyStopAsyncIteration, PyValueError};
+use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyDict};
+
+use crate::http::body_stream::{BodyChunks, ChunkError};
+use crate::http::query::parse_query;
+use crate::http::request::IncomingRequest;
+use crate::observability::ids::{TraceIds, CORRELATION_ID_HEADER, TRACEPARENT_HEADER};
+
+create_exception!(
+    _native,
+    PayloadTooLargeError,
+    PyValueError,
+    "Streamed request body grew past the route's max_body_bytes; answered with 413."
+);
+
+/// True when `err` is (or subclasses) `PayloadTooLargeError`.
+pub fn is_payload_too_large(err: &PyErr) -> bool {
+    Python::with_gil(|py| err.is_instance_of::<PayloadTooLargeError>(py))
+}
+
+/// Read-only request handed to Python dispatch.
+///
+/// Headers, query and path params stay in their native form until Python asks
+/// for them; each view is materialized at most once per request. Correlation and
+/// trace ids are resolved natively on first use and included in the header view.
+#[pyclass(frozen, module = "vyro._native", name = "NativeRequest")]
+pub struct NativeRequest {
+    headers: HeaderMap,
+    query: Option<String>,
+    path_params: Vec<(String, String)>,
+    body: Bytes,
+    body_stream: Option<Py<RequestBodyStream>>,
+    trace_ids: OnceLock<TraceIds>,
+    // `GILOnceCell` is backed by `std::sync::Once` since pyo3 0.23, so it stays sound
+    // on free-threaded builds: racing threads may each build a view, but only the
+    // first is stored and every caller gets that one.
+    headers_view: GILOnceCell<Py<PyDict>>,
+    query_view: GILOnceCell<Py<PyDict>>,
+    path_params_view: GILOnceCell<Py<PyDict>>,
+    body_view: GILOnceCell<Py<PyBytes>>,
+}
+
+impl NativeRequest {
+    pub fn new(py: Python<'_>, req: IncomingRequest) -> PyResult<Self> {
+        let body_stream = match req.stream {
+            Some(chunks) => Some(Py::new(py, RequestBodyStream { chunks })?),
+            None => None,
+        };
+        Ok(Self {
+            headers: req.headers,
+            query: req.query,
+            path_params: req.path_params,
+            body: req.body,
+            body_stream,
+            trace_ids: OnceLock::new(),
+            headers_view: GILOnceCell::new(),
+            query_view: GILOnceCell::new(),
+            path_params_view: GILOnceCell::new(),
+            body_view: GILOnceCell::new(),
+        })
+    }
+}
+
+impl NativeRequest {
+    fn ids(&self) -> &TraceIds {
+        self.trace_ids
+            .get_or_init(|| TraceIds::resolve(&self.headers))
+    }
+}
+
+#[pymethods]
+impl NativeRequest {
+    /// Single header lookup (case-insensitive) without building the full mapping.
+    fn header(&self, name: &str) -> Option<String> {
+        self.headers
+            .get(name)
+            .map(|v| v.to_str().unwrap_or_default().to_string())
+    }
+
+    /// `(correlation_id, traceparent)` from the request or freshly generated.
+    #[getter]
+    fn trace_ids(&self) -> (&str, &str) {
+        let ids = self.ids();
+        (&ids.correlation_id, &ids.traceparent)
+    }
+
+    /// Lowercased headers, with generated correlation and trace ids filled in.
+    #[getter]
+    fn headers(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let view = self.headers_view.get_or_try_init(py, || -> PyResult<_> {
+            let dict = PyDict::new(py);
+            for (name, value) in self.headers.iter() {
+                dict.set_item(name.as_str(), value.to_str().unwrap_or_default())?;
+            }
+            let ids = self.ids();
+            if !self.headers.contains_key(CORRELATION_ID_HEADER) {
+                dict.set_item(CORRELATION_ID_HEADER, &ids.correlation_id)?;
+            }
+            if !self.headers.contains_key(TRACEPARENT_HEADER) {
+                dict.set_item(TRACEPARENT_HEADER, &ids.traceparent)?;
+            }
+            Ok(dict.unbind())
+        })?;
+        Ok(view.clone_ref(py))
+    }
+
+    #[getter]
+    fn query(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let view = self.query_view.get_or_try_init(py, || -> PyResult<_> {
+            let dict = PyDict::new(py);
+            for (key, value) in parse_query(self.query.as_deref()) {
+                dict.set_item(key, value)?;
+            }
+            Ok(dict.unbind())
+        })?;
+        Ok(view.clone_ref(py))
+    }
+
+    #[getter]
+    fn path_params(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let view = self
+            .path_params_view
+            .get_or_try_init(py, || -> PyResult<_> {
+                let dict = PyDict::new(py);
+                for (key, value) in &self.path_params {
+                    dict.set_item(key, value)?;
+                }
+                Ok(dict.unbind())
+            })?;
+        Ok(view.clone_ref(py))
+    }
+
+    #[getter]
+    fn body(&self, py: Python<'_>) -> Py<PyBytes> {
+        self.body_view
+            .get_or_init(py, || PyBytes::new(py, &self.body).unbind())
+            .clone_ref(py)
+    }
+
+    /// Async iterator over body chunks for routes declared with `stream_body=True`.
+    #[getter]
+    fn body_stream(&self, py: Python<'_>) -> Option<Py<RequestBodyStream>> {
+        self.body_stream.as_ref().map(|stream| stream.clone_ref(py))
+    }
+}
+
+#[pyclass(frozen, module = "vyro._native", name = "RequestBodyStream")]
+pub struct RequestBodyStream {
+    chunks: BodyChunks,
+}
+
+#[pymethods]
+impl RequestBodyStream {
+    fn __aiter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let chunks = self.chunks.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            match chunks.next().await {
+                Some(Ok(chunk)) => Python::with_gil(|py| Ok(PyBytes::new(py, &chunk).unbind())),
+                Some(Err(ChunkError::TooLarge)) => Err(PayloadTooLargeError::new_err(
+                    "request body exceeds max_body_bytes",
+                )),
+                Some(Err(ChunkError::Body(msg))) => Err(PyValueError::new_err(msg)),
+                None => Err(PyStopAsyncIteration::new_err(())),
+            }
+        })
+    }
+}
@@ -1,26 +1,47 @@
-use std::collections::HashMap;
 use std::path::PathBuf;
 
+use bytes::Bytes;
+use http::header::CONTENT_TYPE;
+use http::{HeaderMap, HeaderValue};
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyBytes, PyDict, PyList, PyString, PyTuple};
+use pyo3_async_runtimes::TaskLocals;
+
+use crate::bridge::response_stream::{is_async_iterable, PyChunkStream};
+use crate::bridge::response_view::{headers_from_py, NativeResponse};
 
 use crate::errors::core_error::CoreError;
 use crate::http::response::{OutgoingResponse, ResponseBody};
 use crate::serialization::content_type::{APPLICATION_JSON_UTF8, TEXT_PLAIN_UTF8};
 use crate::serialization::json::to_json_bytes;
 
+/// Map a handler result to a response; async iterables stream on `locals`' loop.
 pub fn py_to_response(
     py: Python<'_>,
     obj: Bound<'_, PyAny>,
+    locals: &TaskLocals,
 ) -> Result<OutgoingResponse, CoreError> {
+    if let Ok(response) = obj.downcast::<NativeResponse>() {
+        let response = response.get();
+        let mut headers = response.header_map().clone();
+        let (body, content_type) = py_to_body(py, response.body().bind(py), locals)?;
+        if let Some(ct) = content_type {
+            headers.entry(CONTENT_TYPE).or_insert(ct);
+        }
+        return Ok(OutgoingResponse {
+            status: response.status(),
+            headers,
+            body,
+        });
+    }
     if let Ok(tuple) = obj.downcast::<PyTuple>() {
-        return tuple_to_response(py, tuple);
+        return tuple_to_response(py, tuple, locals);
     }
 
-    let (body, content_type) = py_to_body(py, &obj)?;
-    let mut headers = HashMap::new();
+    let (body, content_type) = py_to_body(py, &obj, locals)?;
+    let mut headers = HeaderMap::new();
     if let Some(ct) = content_type {
-        headers.insert("content-type".to_string(), ct);
+        headers.insert(CONTENT_TYPE, ct);
     }
     Ok(OutgoingResponse {
         status: 200,
@@ -32,6 +53,7 @@ pub fn py_to_response(
 fn tuple_to_response(
     py: Python<'_>,
     tuple: &Bound<'_, PyTuple>,
+    locals: &TaskLocals,
 ) -> Result<OutgoingResponse, CoreError> {
     if tuple.len() != 2 && tuple.len() != 3 {
         return Err(CoreError::ResponseBuild(
@@ -44,25 +66,16 @@ fn tuple_to_response(
         .map_err(CoreError::from)?
         .extract()
         .map_err(CoreError::from)?;
-    let mut headers = HashMap::new();
-    if tuple.len() == 3 {
+    let mut headers = if tuple.len() == 3 {
         let headers_obj = tuple.get_item(2).map_err(CoreError::from)?;
-        if let Ok(dict) = headers_obj.downcast::<PyDict>() {
-            for (k, v) in dict.iter() {
-                let key: String = k.extract().map_err(CoreError::from)?;
-                let value: String = v.extract().map_err(CoreError::from)?;
-                headers.insert(key.to_ascii_lowercase(), value);
-            }
-        } else {
-            return Err(CoreError::ResponseBuild(
-                "headers must be a dict[str, str]".to_string(),
-            ));
-        }
-    }
+        headers_from_py(&headers_obj).map_err(CoreError::from)?
+    } else {
+        HeaderMap::new()
+    };
 
-    let (body, content_type) = py_to_body(py, &body_obj)?;
+    let (body, content_type) = py_to_body(py, &body_obj, locals)?;
     if let Some(ct) = content_type {
-        headers.entry("content-type".to_string()).or_insert(ct);
+        headers.entry(CONTENT_TYPE).or_insert(ct);
     }
     Ok(OutgoingResponse {
         status,
@@ -74,37 +87,46 @@ fn tuple_to_response(
 fn py_to_body(
     py: Python<'_>,
     obj: &Bound<'_, PyAny>,
-) -> Result<(ResponseBody, Option<String>), CoreError> {
+    locals: &TaskLocals,
+) -> Result<(ResponseBody, Option<HeaderValue>), CoreError> {
     if obj.is_none() {
         return Ok((
-            ResponseBody::Bytes(Vec::new()),
-            Some(APPLICATION_JSON_UTF8.to_string()),
+            ResponseBody::Bytes(Bytes::new()),
+            Some(HeaderValue::from_static(APPLICATION_JSON_UTF8)),
         ));
     }
     if let Some(path) = py_to_file_path(py, obj)? {
         return Ok((ResponseBody::File(path), None));
     }
     if let Ok(bytes) = obj.downcast::<PyBytes>() {
-        return Ok((ResponseBody::Bytes(bytes.as_bytes().to_vec()), None));
+        return Ok((
+            ResponseBody::Bytes(Bytes::copy_from_slice(bytes.as_bytes())),
+            None,
+        ));
     }
     if let Ok(text) = obj.downcast::<PyString>() {
         let s = text.to_string();
         return Ok((
-            ResponseBody::Bytes(s.into_bytes()),
-            Some(TEXT_PLAIN_UTF8.to_string()),
+            ResponseBody::Bytes(Bytes::from(s.into_bytes())),
+            Some(HeaderValue::from_static(TEXT_PLAIN_UTF8)),
         ));
     }
     if obj.is_instance_of::<PyDict>() || obj.is_instance_of::<PyList>() {
         let body = to_json_bytes(py, obj)?;
         return Ok((
-            ResponseBody::Bytes(body),
-            Some(APPLICATION_JSON_UTF8.to_string()),
+            ResponseBody::Bytes(Bytes::from(body)),
+            Some(HeaderValue::from_static(APPLICATION_JSON_UTF8)),
         ));
     }
+    if is_async_iterable(obj).map_err(CoreError::from)? {
+        let iterator = obj.call_method0("__aiter__").map_err(CoreError::from)?;
+        let stream = PyChunkStream::new(iterator.unbind(), locals.clone());
+        return Ok((ResponseBody::Stream(stream), None));
+    }
     let body = to_json_bytes(py, obj)?;
     Ok((
-        ResponseBody::Bytes(body),
-        Some(APPLICATION_JSON_UTF8.to_string()),
+        ResponseBody::Bytes(Bytes::from(body)),
+        Some(HeaderValue::from_static(APPLICATION_JSON_UTF8)),
     ))
 }
 
@@ -130,6 +152,14 @@ mod tests {
     use super::{py_to_response, ResponseBody};
     use pyo3::prelude::*;
     use pyo3::types::PyModule;
+    use pyo3_async_runtimes::TaskLocals;
+
+    fn locals(py: Python<'_>) -> TaskLocals {
+        let event_loop = PyModule::import(py, "asyncio")
+            .and_then(|asyncio| asyncio.call_method0("new_event_loop"))
+            .expect("event loop should be created");
+        TaskLocals::new(event_loop)
+    }
 
     #[test]
     fn pathlib_body_maps_to_file_response() {
@@ -141,11 +171,33 @@ mod tests {
                 .expect("Path symbol should exist")
                 .call1(("README.md",))
                 .expect("Path constructor should succeed");
-            let response = py_to_response(py, path_obj).expect("response mapping should succeed");
+            let response =
+                py_to_response(py, path_obj, &locals(py)).expect("response mapping should succeed");
             match response.body {
                 ResponseBody::File(path) => assert!(path.ends_with("README.md")),
-                ResponseBody::Bytes(_) => panic!("expected file response body"),
+                _ => panic!("expected file response body"),
             }
         });
     }
+
+    #[test]
+    fn async_generator_body_maps_to_stream_response() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let module = PyModule::from_code(
+                py,
+                c"async def rows():\n    yield b'a'\n",
+                c"rows.py",
+                c"rows",
+            )
+            .expect("fixture module should compile");
+            let generator = module
+                .getattr("rows")
+                .and_then(|rows| rows.call0())
+                .expect("generator should be created");
+            let response = py_to_response(py, generator, &locals(py))
+                .expect("response mapping should succeed");
+            assert!(matches!(response.body, ResponseBody::Stream(_)));
+        });
+    }
 }
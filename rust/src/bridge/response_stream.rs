@@ -0,0 +1,109 @@
+use std::fmt;
+use std::sync::atomic::{AtomicBool, Ordering};
+
+use bytes::Bytes;
+use pyo3::exceptions::PyStopAsyncIteration;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyString};
+use pyo3_async_runtimes::TaskLocals;
+
+use crate::errors::core_error::CoreError;
+
+/// Response body pulled chunk by chunk from a Python async iterator.
+///
+/// `__anext__` is only awaited when hyper polls for the next frame, so a slow
+/// client socket pauses the generator instead of buffering its output. The
+/// iterator runs on the event loop that executed the handler.
+pub struct PyChunkStream {
+    iterator: Py<PyAny>,
+    locals: TaskLocals,
+    exhausted: AtomicBool,
+}
+
+impl PyChunkStream {
+    pub fn new(iterator: Py<PyAny>, locals: TaskLocals) -> Self {
+        Self {
+            iterator,
+            locals,
+            exhausted: AtomicBool::new(false),
+        }
+    }
+
+    pub async fn next_chunk(&self) -> Option<Result<Bytes, CoreError>> {
+        if self.exhausted.load(Ordering::Acquire) {
+            return None;
+        }
+        let pending = Python::with_gil(|py| -> PyResult<_> {
+            let awaitable = self.iterator.bind(py).call_method0("__anext__")?;
+            pyo3_async_runtimes::into_future_with_locals(&self.locals, awaitable)
+        });
+        let result = match pending {
+            Ok(pending) => pending.await,
+            Err(err) => Err(err),
+        };
+        Python::with_gil(|py| match result {
+            Ok(chunk) => Some(chunk_to_bytes(chunk.bind(py))),
+            Err(err) => {
+                self.exhausted.store(true, Ordering::Release);
+                if err.is_instance_of::<PyStopAsyncIteration>(py) {
+                    None
+                } else {
+                    Some(Err(CoreError::from(err)))
+                }
+            }
+        })
+    }
+}
+
+impl Drop for PyChunkStream {
+    /// Close an unfinished generator (e.g. client disconnect) so its `finally` runs.
+    fn drop(&mut self) {
+        if self.exhausted.load(Ordering::Acquire) {
+            return;
+        }
+        Python::with_gil(|py| {
+            let iterator = self.iterator.bind(py);
+            let closed = iterator
+                .call_method0("aclose")
+                .and_then(|coroutine| {
+                    py.import("asyncio")?.call_method1(
+                        "run_coroutine_threadsafe",
+                        (coroutine, self.locals.event_loop(py)),
+                    )
+                })
+                .map(|_| ());
+            if let Err(err) = closed {
+                if !err.is_instance_of::<pyo3::exceptions::PyAttributeError>(py) {
+                    err.print(py);
+                }
+            }
+        });
+    }
+}
+
+impl fmt::Debug for PyChunkStream {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("PyChunkStream")
+            .field("exhausted", &self.exhausted.load(Ordering::Relaxed))
+            .finish_non_exhaustive()
+    }
+}
+
+fn chunk_to_bytes(chunk: &Bound<'_, PyAny>) -> Result<Bytes, CoreError> {
+    if let Ok(bytes) = chunk.downcast::<PyBytes>() {
+        return Ok(Bytes::copy_from_slice(bytes.as_bytes()));
+    }
+    if let Ok(text) = chunk.downcast::<PyString>() {
+        let text = text.to_str().map_err(CoreError::from)?;
+        return Ok(Bytes::copy_from_slice(text.as_bytes()));
+    }
+    let type_name = chunk.get_type().name().map_err(CoreError::from)?;
+    Err(CoreError::ResponseBuild(format!(
+        "stream chunks must be bytes or str, not {type_name}"
+    )))
+}
+
+/// Whether a handler result is an async iterable to stream rather than encode.
+pub fn is_async_iterable(obj: &Bound<'_, PyAny>) -> PyResult<bool> {
+    obj.hasattr("__aiter__")
+}
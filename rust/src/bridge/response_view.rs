@@ -0,0 +1,217 @@
+use http::HeaderMap;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyString};
+
+use crate::http::headers::{header_name, header_value};
+
+/// Pre-validated response headers that can be built once and reused per route.
+///
+/// Names and values are checked when the set is created, so responses carrying a
+/// `HeaderSet` are copied straight into hyper without re-parsing.
+#[pyclass(frozen, module = "vyro._native", name = "HeaderSet")]
+#[derive(Clone)]
+pub struct HeaderSet {
+    headers: HeaderMap,
+}
+
+impl HeaderSet {
+    pub fn header_map(&self) -> &HeaderMap {
+        &self.headers
+    }
+}
+
+#[pymethods]
+impl HeaderSet {
+    #[new]
+    #[pyo3(signature = (headers = None))]
+    fn py_new(headers: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+        let headers = match headers {
+            Some(obj) => headers_from_py(obj)?,
+            None => HeaderMap::new(),
+        };
+        Ok(Self { headers })
+    }
+
+    /// New set with `other`'s entries replacing same-named entries of this one.
+    fn merge(&self, other: &HeaderSet) -> HeaderSet {
+        let mut headers = self.headers.clone();
+        for name in other.headers.keys() {
+            headers.remove(name);
+        }
+        for (name, value) in other.headers.iter() {
+            headers.append(name.clone(), value.clone());
+        }
+        HeaderSet { headers }
+    }
+
+    fn get(&self, name: &str) -> Option<String> {
+        self.headers
+            .get(name)
+            .map(|v| v.to_str().unwrap_or_default().to_string())
+    }
+
+    fn items(&self) -> Vec<(String, String)> {
+        self.headers
+            .iter()
+            .map(|(k, v)| {
+                (
+                    k.as_str().to_string(),
+                    v.to_str().unwrap_or_default().to_string(),
+                )
+            })
+            .collect()
+    }
+
+    fn __len__(&self) -> usize {
+        self.headers.len()
+    }
+
+    fn __contains__(&self, name: &str) -> bool {
+        self.headers.contains_key(name)
+    }
+}
+
+/// Response descriptor handlers or middleware can construct (and reuse) instead of
+/// returning a `(body, status, headers)` tuple.
+#[pyclass(frozen, module = "vyro._native", name = "Response")]
+pub struct NativeResponse {
+    body: Py<PyAny>,
+    status: u16,
+    headers: HeaderMap,
+}
+
+impl NativeResponse {
+    pub fn body(&self) -> &Py<PyAny> {
+        &self.body
+    }
+
+    pub fn status(&self) -> u16 {
+        self.status
+    }
+
+    pub fn header_map(&self) -> &HeaderMap {
+        &self.headers
+    }
+}
+
+#[pymethods]
+impl NativeResponse {
+    #[new]
+    #[pyo3(signature = (body = None, status = 200, headers = None))]
+    fn py_new(
+        py: Python<'_>,
+        body: Option<Py<PyAny>>,
+        status: u16,
+        headers: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Self> {
+        if !(100..=999).contains(&status) {
+            return Err(PyValueError::new_err(format!(
+                "invalid status code: {status}"
+            )));
+        }
+        let headers = match headers {
+            Some(obj) => headers_from_py(obj)?,
+            None => HeaderMap::new(),
+        };
+        Ok(Self {
+            body: body.unwrap_or_else(|| py.None()),
+            status,
+            headers,
+        })
+    }
+
+    #[getter(body)]
+    fn py_body(&self, py: Python<'_>) -> Py<PyAny> {
+        self.body.clone_ref(py)
+    }
+
+    #[getter(status)]
+    fn py_status(&self) -> u16 {
+        self.status
+    }
+
+    #[getter(headers)]
+    fn py_headers(&self) -> HeaderSet {
+        HeaderSet {
+            headers: self.headers.clone(),
+        }
+    }
+}
+
+/// Build a `HeaderMap` from a `HeaderSet`, a `dict[str, str]` or an iterable of
+/// `(name, value)` pairs (pairs may repeat a name, e.g. `set-cookie`).
+pub fn headers_from_py(obj: &Bound<'_, PyAny>) -> PyResult<HeaderMap> {
+    if let Ok(set) = obj.downcast::<HeaderSet>() {
+        return Ok(set.get().headers.clone());
+    }
+    let mut headers = HeaderMap::new();
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        headers.reserve(dict.len());
+        for (key, value) in dict.iter() {
+            let (name, value) = header_pair(&key, &value)?;
+            headers.insert(name, value);
+        }
+        return Ok(headers);
+    }
+    if obj.is_instance_of::<PyString>() {
+        return Err(PyValueError::new_err(
+            "headers must be a HeaderSet, dict[str, str] or iterable of pairs",
+        ));
+    }
+    for item in obj.try_iter()? {
+        let (key, value): (Bound<'_, PyAny>, Bound<'_, PyAny>) = item?.extract()?;
+        let (name, value) = header_pair(&key, &value)?;
+        headers.append(name, value);
+    }
+    Ok(headers)
+}
+
+fn header_pair(
+    key: &Bound<'_, PyAny>,
+    value: &Bound<'_, PyAny>,
+) -> PyResult<(http::HeaderName, http::HeaderValue)> {
+    let key = key.downcast::<PyString>()?;
+    let value = value.downcast::<PyString>()?;
+    let name = header_name(key.to_str()?).map_err(|e| PyValueError::new_err(e.to_string()))?;
+    let value = header_value(value.to_str()?).map_err(|e| PyValueError::new_err(e.to_string()))?;
+    Ok((name, value))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::HeaderSet;
+    use pyo3::prelude::*;
+    use pyo3::types::PyDict;
+
+    #[test]
+    fn header_set_keeps_repeated_pairs_and_merges_by_name() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let pairs = vec![
+                ("Set-Cookie", "a=1"),
+                ("set-cookie", "b=2"),
+                ("Cache-Control", "no-cache"),
+            ];
+            let base = HeaderSet::py_new(Some(&pairs.into_pyobject(py).unwrap()))
+                .expect("pairs should parse");
+            assert_eq!(base.header_map().get_all("set-cookie").iter().count(), 2);
+
+            let overrides = PyDict::new(py);
+            overrides.set_item("cache-control", "max-age=60").unwrap();
+            let merged = base.merge(&HeaderSet::py_new(Some(overrides.as_any())).unwrap());
+            assert_eq!(merged.get("Cache-Control").as_deref(), Some("max-age=60"));
+            assert_eq!(merged.__len__(), 3);
+        });
+    }
+
+    #[test]
+    fn header_set_rejects_invalid_names() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let bad = PyDict::new(py);
+            bad.set_item("bad header", "x").unwrap();
+            assert!(HeaderSet::py_new(Some(bad.as_any())).is_err());
+        });
+    }
+}
@@ -1,8 +1,12 @@
 use pyo3::exceptions::PyValueError;
+use std::time::Duration;
+
+use http::HeaderName;
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyTuple};
+use pyo3::types::{PyDict, PyList, PyTuple};
 
-use crate::routing::radix::RouteDefinition;
+use crate::cache::response_cache::CacheRule;
+use crate::routing::radix::{RouteDefinition, RouteOptions};
 
 pub fn parse_routes(routes: &Bound<'_, PyAny>) -> PyResult<Vec<RouteDefinition>> {
     let list = routes
@@ -11,21 +15,64 @@ pub fn parse_routes(routes: &Bound<'_, PyAny>) -> PyResult<Vec<RouteDefinition>>
     let mut out = Vec::with_capacity(list.len());
     for item in list.iter() {
         let tuple = item.downcast::<PyTuple>().map_err(|_| {
-            PyValueError::new_err("each route must be tuple(method, path, handler)")
+            PyValueError::new_err("each route must be tuple(method, path, handler[, options])")
         })?;
-        if tuple.len() != 3 {
+        if tuple.len() != 3 && tuple.len() != 4 {
             return Err(PyValueError::new_err(
-                "each route must have exactly 3 items: (method, path, handler)",
+                "each route must have 3 or 4 items: (method, path, handler[, options])",
             ));
         }
         let method: String = tuple.get_item(0)?.extract()?;
         let path: String = tuple.get_item(1)?.extract()?;
         let handler: Py<PyAny> = tuple.get_item(2)?.extract()?;
+        let options = if tuple.len() == 4 {
+            parse_route_options(&tuple.get_item(3)?)?
+        } else {
+            RouteOptions::default()
+        };
         out.push(RouteDefinition {
             method,
             path,
             handler,
+            options,
         });
     }
     Ok(out)
 }
+
+fn parse_route_options(obj: &Bound<'_, PyAny>) -> PyResult<RouteOptions> {
+    let dict = obj
+        .downcast::<PyDict>()
+        .map_err(|_| PyValueError::new_err("route options must be a dict"))?;
+    let mut options = RouteOptions::default();
+    if let Some(value) = dict.get_item("stream_body")? {
+        options.stream_body = value.extract()?;
+    }
+    if let Some(value) = dict.get_item("max_body_bytes")? {
+        options.max_body_bytes = value.extract()?;
+    }
+    if let Some(value) = dict.get_item("cache_ttl_sec")? {
+        let ttl: f64 = value.extract()?;
+        if !ttl.is_finite() || ttl < 0.0 {
+            return Err(PyValueError::new_err(
+                "cache_ttl_sec must be a finite number >= 0",
+            ));
+        }
+        let vary = match dict.get_item("cache_vary")? {
+            Some(names) => names
+                .extract::<Vec<String>>()?
+                .iter()
+                .map(|name| {
+                    HeaderName::from_bytes(name.to_ascii_lowercase().as_bytes())
+                        .map_err(|e| PyValueError::new_err(format!("invalid vary header: {e}")))
+                })
+                .collect::<PyResult<Vec<_>>>()?,
+            None => Vec::new(),
+        };
+        options.cache = Some(CacheRule {
+            ttl: Duration::from_secs_f64(ttl),
+            vary,
+        });
+    }
+    Ok(options)
+}
@@ -0,0 +1 @@
+pub mod response_cache;
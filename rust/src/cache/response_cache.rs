@@ -0,0 +1,316 @@
+use std::collections::{BTreeMap, HashMap};
+use std::fmt::Write as _;
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
+
+use bytes::Bytes;
+use http::header::{AUTHORIZATION, CACHE_CONTROL, COOKIE, SET_COOKIE};
+use http::{HeaderMap, HeaderName};
+
+use crate::http::response::{OutgoingResponse, ResponseBody};
+
+/// Route-level caching rule exported from `ResponseCachePolicy`.
+#[derive(Clone, Debug)]
+pub struct CacheRule {
+    pub ttl: Duration,
+    pub vary: Vec<HeaderName>,
+}
+
+/// Rendered response kept by the cache; cheap to clone (body is shared).
+#[derive(Clone, Debug)]
+pub struct CachedResponse {
+    pub status: u16,
+    pub headers: HeaderMap,
+    pub body: Bytes,
+}
+
+impl CachedResponse {
+    pub fn to_outgoing(&self) -> OutgoingResponse {
+        OutgoingResponse {
+            status: self.status,
+            headers: self.headers.clone(),
+            body: ResponseBody::Bytes(self.body.clone()),
+        }
+    }
+
+    fn weight(&self, key: &str) -> usize {
+        let headers: usize = self
+            .headers
+            .iter()
+            .map(|(k, v)| k.as_str().len() + v.len())
+            .sum();
+        key.len() + headers + self.body.len()
+    }
+}
+
+struct Entry {
+    response: CachedResponse,
+    expires_at: Instant,
+    weight: usize,
+    tick: u64,
+}
+
+#[derive(Default)]
+struct Store {
+    entries: HashMap<String, Entry>,
+    recency: BTreeMap<u64, String>,
+    tick: u64,
+    bytes: usize,
+}
+
+impl Store {
+    fn touch(&mut self, key: &str) {
+        self.tick += 1;
+        let tick = self.tick;
+        if let Some(entry) = self.entries.get_mut(key) {
+            self.recency.remove(&entry.tick);
+            entry.tick = tick;
+            self.recency.insert(tick, key.to_string());
+        }
+    }
+
+    fn remove(&mut self, key: &str) {
+        if let Some(entry) = self.entries.remove(key) {
+            self.recency.remove(&entry.tick);
+            self.bytes -= entry.weight;
+        }
+    }
+
+    fn evict_until(&mut self, max_bytes: usize) {
+        while self.bytes > max_bytes {
+            let Some((_, key)) = self.recency.pop_first() else {
+                break;
+            };
+            if let Some(entry) = self.entries.remove(&key) {
+                self.bytes -= entry.weight;
+            }
+        }
+    }
+}
+
+/// Byte-bounded LRU cache of complete responses, consulted before the Python handler.
+pub struct ResponseCache {
+    max_bytes: usize,
+    store: Mutex<Store>,
+}
+
+impl ResponseCache {
+    pub fn new(max_bytes: usize) -> Self {
+        Self {
+            max_bytes,
+            store: Mutex::new(Store::default()),
+        }
+    }
+
+    /// Key for a cacheable request, or `None` when the request must bypass the cache.
+    pub fn key_for(
+        method: &str,
+        path: &str,
+        query: Option<&str>,
+        headers: &HeaderMap,
+        rule: &CacheRule,
+    ) -> Option<String> {
+        if method != "GET" && method != "HEAD" {
+            return None;
+        }
+        // Credentialed requests may get personalised responses; only cache them when
+        // the credential is part of the key.
+        for credential in [&AUTHORIZATION, &COOKIE] {
+            if headers.contains_key(credential) && !rule.vary.contains(credential) {
+                return None;
+            }
+        }
+        if header_has_token(headers.get(CACHE_CONTROL), "no-store") {
+            return None;
+        }
+        let mut key = String::with_capacity(method.len() + path.len() + 32);
+        key.push_str(method);
+        key.push(' ');
+        key.push_str(path);
+        if let Some(query) = query.filter(|q| !q.is_empty()) {
+            let mut pairs: Vec<&str> = query.split('&').filter(|p| !p.is_empty()).collect();
+            // Stable on the name only: repeated parameters keep the order the handler sees.
+            pairs.sort_by_key(|&pair| pair.split_once('=').map_or(pair, |(name, _)| name));
+            key.push('?');
+            key.push_str(&pairs.join("&"));
+        }
+        for name in &rule.vary {
+            key.push('\0');
+            key.push_str(name.as_str());
+            key.push('=');
+            // Length-prefixed so `["ab", "c"]` and `["a", "bc"]` stay distinct; a value
+            // that is not visible ASCII cannot be keyed faithfully, so skip the cache.
+            for value in headers.get_all(name) {
+                let value = value.to_str().ok()?;
+                let _ = write!(key, "{}:{value}", value.len());
+            }
+        }
+        Some(key)
+    }
+
+    pub fn get(&self, key: &str) -> Option<CachedResponse> {
+        let mut store = self.store.lock().ok()?;
+        let expired = match store.entries.get(key) {
+            Some(entry) => entry.expires_at <= Instant::now(),
+            None => return None,
+        };
+        if expired {
+            store.remove(key);
+            return None;
+        }
+        store.touch(key);
+        store.entries.get(key).map(|entry| entry.response.clone())
+    }
+
+    /// Store a handler response when it is a cacheable, fully buffered 200.
+    pub fn insert(&self, key: String, response: &OutgoingResponse, ttl: Duration) {
+        let Some(cached) = cacheable(response) else {
+            return;
+        };
+        let weight = cached.weight(&key);
+        if ttl.is_zero() || weight > self.max_bytes {
+            return;
+        }
+        let Ok(mut store) = self.store.lock() else {
+            return;
+        };
+        store.remove(&key);
+        store.tick += 1;
+        let tick = store.tick;
+        store.recency.insert(tick, key.clone());
+        store.bytes += weight;
+        store.entries.insert(
+            key,
+            Entry {
+                response: cached,
+                expires_at: Instant::now() + ttl,
+                weight,
+                tick,
+            },
+        );
+        store.evict_until(self.max_bytes);
+    }
+}
+
+fn cacheable(response: &OutgoingResponse) -> Option<CachedResponse> {
+    if response.status != 200 || response.headers.contains_key(SET_COOKIE) {
+        return None;
+    }
+    let cache_control = response.headers.get(CACHE_CONTROL);
+    if header_has_token(cache_control, "no-store") || header_has_token(cache_control, "private") {
+        return None;
+    }
+    let ResponseBody::Bytes(body) = &response.body else {
+        return None;
+    };
+    Some(CachedResponse {
+        status: response.status,
+        headers: response.headers.clone(),
+        body: body.clone(),
+    })
+}
+
+fn header_has_token(value: Option<&http::HeaderValue>, token: &str) -> bool {
+    value
+        .and_then(|v| v.to_str().ok())
+        .is_some_and(|v| v.to_ascii_lowercase().contains(token))
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+
+    use bytes::Bytes;
+    use http::{HeaderMap, HeaderName, HeaderValue};
+
+    use super::{CacheRule, ResponseCache};
+    use crate::http::response::{OutgoingResponse, ResponseBody};
+
+    fn response(body: &'static [u8]) -> OutgoingResponse {
+        OutgoingResponse {
+            status: 200,
+            headers: HeaderMap::new(),
+            body: ResponseBody::Bytes(Bytes::from_static(body)),
+        }
+    }
+
+    fn rule(vary: &[&'static str]) -> CacheRule {
+        CacheRule {
+            ttl: Duration::from_secs(30),
+            vary: vary.iter().map(|v| HeaderName::from_static(v)).collect(),
+        }
+    }
+
+    #[test]
+    fn key_normalizes_query_order_and_vary_headers() {
+        let mut headers = HeaderMap::new();
+        headers.insert("accept", HeaderValue::from_static("application/json"));
+        let rule = rule(&["accept"]);
+        let a = ResponseCache::key_for("GET", "/items", Some("b=2&a=1"), &headers, &rule);
+        let b = ResponseCache::key_for("GET", "/items", Some("a=1&b=2"), &headers, &rule);
+        assert_eq!(a, b);
+        assert!(a.unwrap().ends_with("\0accept=16:application/json"));
+        assert!(ResponseCache::key_for("POST", "/items", None, &headers, &rule).is_none());
+    }
+
+    #[test]
+    fn key_keeps_repeated_query_parameters_in_order() {
+        let headers = HeaderMap::new();
+        let rule = rule(&[]);
+        let key = |query| ResponseCache::key_for("GET", "/items", Some(query), &headers, &rule);
+        assert_ne!(key("a=1&a=2"), key("a=2&a=1"));
+        assert_eq!(key("b=1&a=1&a=2"), key("a=1&a=2&b=1"));
+    }
+
+    #[test]
+    fn credentialed_requests_bypass_unless_varied_on() {
+        let mut headers = HeaderMap::new();
+        headers.insert("cookie", HeaderValue::from_static("session=abc"));
+        assert!(ResponseCache::key_for("GET", "/me", None, &headers, &rule(&[])).is_none());
+        let varied = ResponseCache::key_for("GET", "/me", None, &headers, &rule(&["cookie"]));
+        assert!(varied.unwrap().ends_with("\0cookie=11:session=abc"));
+        headers.insert("authorization", HeaderValue::from_static("Bearer t"));
+        assert!(ResponseCache::key_for("GET", "/me", None, &headers, &rule(&["cookie"])).is_none());
+    }
+
+    #[test]
+    fn key_keeps_repeated_vary_values_apart_and_skips_opaque_values() {
+        let rule = rule(&["accept-language"]);
+        let key = |values: &[&str]| {
+            let mut headers = HeaderMap::new();
+            for value in values {
+                let value = HeaderValue::from_bytes(value.as_bytes()).unwrap();
+                headers.append("accept-language", value);
+            }
+            ResponseCache::key_for("GET", "/items", None, &headers, &rule)
+        };
+        assert_ne!(key(&["ab", "c"]), key(&["a", "bc"]));
+        assert!(key(&["ab", "c"]).is_some());
+        assert!(key(&["d\u{e9}"]).is_none());
+    }
+
+    #[test]
+    fn evicts_least_recently_used_when_over_budget() {
+        let cache = ResponseCache::new(40);
+        let ttl = Duration::from_secs(30);
+        cache.insert("a".to_string(), &response(b"0123456789"), ttl);
+        cache.insert("b".to_string(), &response(b"0123456789"), ttl);
+        assert!(cache.get("a").is_some());
+        cache.insert("c".to_string(), &response(b"0123456789"), ttl);
+        cache.insert("d".to_string(), &response(b"0123456789"), ttl);
+        assert!(cache.get("a").is_some());
+        assert!(cache.get("b").is_none());
+        assert_eq!(
+            cache.get("d").unwrap().body,
+            Bytes::from_static(b"0123456789")
+        );
+    }
+
+    #[test]
+    fn expired_entries_are_not_served() {
+        let cache = ResponseCache::new(1024);
+        cache.insert("a".to_string(), &response(b"x"), Duration::from_millis(1));
+        std::thread::sleep(Duration::from_millis(5));
+        assert!(cache.get("a").is_none());
+    }
+}
@@ -7,6 +7,7 @@ pub enum CoreError {
     Hyper(hyper::Error),
     Py(pyo3::PyErr),
     InvalidConfig(String),
+    RequestBody(String),
     ResponseBuild(String),
 }
 
@@ -17,6 +18,7 @@ impl Display for CoreError {
             Self::Hyper(e) => write!(f, "hyper error: {e}"),
             Self::Py(e) => write!(f, "python error: {e}"),
             Self::InvalidConfig(msg) => write!(f, "invalid config: {msg}"),
+            Self::RequestBody(msg) => write!(f, "request body error: {msg}"),
             Self::ResponseBuild(msg) => write!(f, "response build error: {msg}"),
         }
     }
@@ -0,0 +1,67 @@
+use std::sync::Arc;
+
+use bytes::Bytes;
+use http_body_util::BodyExt;
+use hyper::body::Incoming;
+use tokio::sync::{mpsc, Mutex};
+
+/// Frames buffered ahead of the handler before the socket stops being read.
+const STREAM_BUFFER_FRAMES: usize = 8;
+
+#[derive(Clone, Debug)]
+pub enum ChunkError {
+    /// More than `max_body_bytes` arrived; the dispatcher answers 413.
+    TooLarge,
+    Body(String),
+}
+
+pub type ChunkResult = Result<Bytes, ChunkError>;
+
+/// Request body delivered frame by frame through a bounded channel.
+///
+/// A background task reads hyper `Incoming` frames and parks once the buffer is
+/// full, so a slow consumer applies backpressure to the client connection.
+#[derive(Clone, Debug)]
+pub struct BodyChunks {
+    rx: Arc<Mutex<mpsc::Receiver<ChunkResult>>>,
+}
+
+impl BodyChunks {
+    pub fn spawn(body: Incoming, max_bytes: Option<usize>) -> Self {
+        let (tx, rx) = mpsc::channel(STREAM_BUFFER_FRAMES);
+        tokio::spawn(pump(body, max_bytes, tx));
+        Self {
+            rx: Arc::new(Mutex::new(rx)),
+        }
+    }
+
+    pub async fn next(&self) -> Option<ChunkResult> {
+        self.rx.lock().await.recv().await
+    }
+}
+
+async fn pump(mut body: Incoming, max_bytes: Option<usize>, tx: mpsc::Sender<ChunkResult>) {
+    let mut received = 0usize;
+    while let Some(frame) = body.frame().await {
+        let frame = match frame {
+            Ok(frame) => frame,
+            Err(err) => {
+                let _ = tx
+                    .send(Err(ChunkError::Body(format!("request body error: {err}"))))
+                    .await;
+                return;
+            }
+        };
+        let Ok(data) = frame.into_data() else {
+            continue;
+        };
+        received += data.len();
+        if max_bytes.is_some_and(|limit| received > limit) {
+            let _ = tx.send(Err(ChunkError::TooLarge)).await;
+            return;
+        }
+        if tx.send(Ok(data)).await.is_err() {
+            return;
+        }
+    }
+}
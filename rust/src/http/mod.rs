@@ -1,3 +1,4 @@
+pub mod body_stream;
 pub mod headers;
 pub mod query;
 pub mod request;
@@ -1,11 +1,13 @@
-use std::collections::HashMap;
-
 use bytes::Bytes;
+use http::HeaderMap;
+
+use crate::http::body_stream::BodyChunks;
 
 #[derive(Debug, Clone)]
 pub struct IncomingRequest {
-    pub headers: HashMap<String, String>,
-    pub query: HashMap<String, String>,
-    pub path_params: HashMap<String, String>,
+    pub headers: HeaderMap,
+    pub query: Option<String>,
+    pub path_params: Vec<(String, String)>,
     pub body: Bytes,
+    pub stream: Option<BodyChunks>,
 }
@@ -1,16 +1,21 @@
-use std::collections::HashMap;
 use std::path::PathBuf;
 
-#[derive(Debug, Clone)]
+use bytes::Bytes;
+use http::HeaderMap;
+
+use crate::bridge::response_stream::PyChunkStream;
+
+#[derive(Debug)]
 pub enum ResponseBody {
-    Bytes(Vec<u8>),
+    Bytes(Bytes),
     File(PathBuf),
+    Stream(PyChunkStream),
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug)]
 pub struct OutgoingResponse {
     pub status: u16,
-    pub headers: HashMap<String, String>,
+    pub headers: HeaderMap,
     pub body: ResponseBody,
 }
 
@@ -18,8 +23,8 @@ impl Default for OutgoingResponse {
     fn default() -> Self {
         Self {
             status: 200,
-            headers: HashMap::new(),
-            body: ResponseBody::Bytes(b"".to_vec()),
+            headers: HeaderMap::new(),
+            body: ResponseBody::Bytes(Bytes::new()),
         }
     }
 }
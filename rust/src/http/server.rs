@@ -1,47 +1,76 @@
-use std::collections::HashMap;
 use std::convert::Infallible;
 use std::net::SocketAddr;
 use std::sync::Arc;
+use std::time::Instant;
 
 use bytes::Bytes;
 use futures_util::StreamExt;
-use http::header::{HeaderValue, CONTENT_TYPE};
-use http::{Request, Response, StatusCode};
-use http_body_util::combinators::BoxBody;
-use http_body_util::{BodyExt, Full, StreamBody};
+use http::header::{HeaderMap, HeaderValue, CONTENT_LENGTH, CONTENT_TYPE, ORIGIN, RETRY_AFTER};
+use http::{Method, Request, Response, StatusCode};
+use http_body_util::combinators::UnsyncBoxBody;
+use http_body_util::{BodyExt, Full, LengthLimitError, Limited, StreamBody};
 use hyper::body::{Frame, Incoming};
 use hyper::service::service_fn;
 use hyper_util::rt::{TokioExecutor, TokioIo};
 use hyper_util::server::conn::auto::Builder;
-use tokio::net::TcpListener;
+use tokio::net::{TcpListener, TcpSocket};
 use tokio_util::io::ReaderStream;
 
 use crate::bridge::callback::call_python_handler;
+use crate::bridge::event_loop::EventLoopPool;
+use crate::bridge::request_view::is_payload_too_large;
+use crate::cache::response_cache::ResponseCache;
 use crate::errors::core_error::CoreError;
-use crate::http::headers::{header_name, header_value};
-use crate::http::query::parse_query;
+use crate::http::body_stream::BodyChunks;
 use crate::http::request::IncomingRequest;
 use crate::http::response::{OutgoingResponse, ResponseBody};
-use crate::http::status::{internal_error_status, method_not_allowed_status, not_found_status};
+use crate::http::status::{
+    internal_error_status, method_not_allowed_status, no_content_status, not_found_status,
+    payload_too_large_status, service_unavailable_status, too_many_requests_status,
+};
+use crate::middleware::guards::{NativeGuards, Rejection};
+use crate::observability::metrics::ServerMetrics;
 use crate::routing::method_table::RouteRegistry;
-use crate::serialization::content_type::TEXT_PLAIN_UTF8;
+use crate::routing::params::LookupResult;
+use crate::serialization::content_type::{PROMETHEUS_TEXT, TEXT_PLAIN_UTF8};
 
-type Body = BoxBody<Bytes, std::io::Error>;
+/// Unsync so bodies can be driven by Python awaitables, which are `Send` but not `Sync`.
+type Body = UnsyncBoxBody<Bytes, std::io::Error>;
 
-pub async fn serve(host: String, port: u16, registry: RouteRegistry) -> Result<(), CoreError> {
+pub struct ServerState {
+    pub registry: RouteRegistry,
+    pub loops: EventLoopPool,
+    pub cache: Option<ResponseCache>,
+    pub guards: NativeGuards,
+    pub metrics: Option<ServerMetrics>,
+}
+
+const LISTEN_BACKLOG: u32 = 1024;
+
+/// Accept connections until the listener fails or the process receives Ctrl-C.
+pub async fn serve(
+    host: String,
+    port: u16,
+    reuse_port: bool,
+    state: Arc<ServerState>,
+) -> Result<(), CoreError> {
     let addr: SocketAddr = format!("{host}:{port}")
         .parse()
         .map_err(|e| CoreError::InvalidConfig(format!("invalid host/port: {e}")))?;
 
-    let listener = TcpListener::bind(addr).await?;
-    let state = Arc::new(registry);
+    let listener = bind_listener(addr, reuse_port)?;
+    let interrupted = tokio::signal::ctrl_c();
+    tokio::pin!(interrupted);
 
     loop {
-        let (stream, _) = listener.accept().await?;
+        let (stream, peer) = tokio::select! {
+            accepted = listener.accept() => accepted?,
+            _ = &mut interrupted => return Ok(()),
+        };
         let io = TokioIo::new(stream);
         let state = state.clone();
         tokio::spawn(async move {
-            let service = service_fn(move |req| handle_request(req, state.clone()));
+            let service = service_fn(move |req| handle_request(req, peer, state.clone()));
             let builder = Builder::new(TokioExecutor::new());
             if let Err(err) = builder.serve_connection_with_upgrades(io, service).await {
                 eprintln!("connection error: {err}");
@@ -50,70 +79,215 @@ pub async fn serve(host: String, port: u16, registry: RouteRegistry) -> Result<(
     }
 }
 
+/// Bind the listening socket; with `reuse_port` several worker processes share it
+/// and the kernel balances accepted connections between them.
+fn bind_listener(addr: SocketAddr, reuse_port: bool) -> Result<TcpListener, CoreError> {
+    let socket = if addr.is_ipv4() {
+        TcpSocket::new_v4()?
+    } else {
+        TcpSocket::new_v6()?
+    };
+    #[cfg(unix)]
+    socket.set_reuseaddr(true)?;
+    if reuse_port {
+        enable_reuse_port(&socket)?;
+    }
+    socket.bind(addr)?;
+    Ok(socket.listen(LISTEN_BACKLOG)?)
+}
+
+#[cfg(all(
+    unix,
+    not(target_os = "solaris"),
+    not(target_os = "illumos"),
+    not(target_os = "cygwin")
+))]
+fn enable_reuse_port(socket: &TcpSocket) -> Result<(), CoreError> {
+    Ok(socket.set_reuseport(true)?)
+}
+
+#[cfg(not(all(
+    unix,
+    not(target_os = "solaris"),
+    not(target_os = "illumos"),
+    not(target_os = "cygwin")
+)))]
+fn enable_reuse_port(_socket: &TcpSocket) -> Result<(), CoreError> {
+    Err(CoreError::InvalidConfig(
+        "SO_REUSEPORT is not supported on this platform".to_string(),
+    ))
+}
+
 async fn handle_request(
     req: Request<Incoming>,
-    registry: Arc<RouteRegistry>,
+    peer: SocketAddr,
+    state: Arc<ServerState>,
 ) -> Result<Response<Body>, hyper::Error> {
-    match process_request(req, registry).await {
-        Ok(resp) => Ok(resp),
-        Err(err) => Ok(internal_error_response(err)),
+    if let Some(metrics) = &state.metrics {
+        if req.method() == Method::GET && req.uri().path() == metrics.path {
+            return Ok(metrics_response(metrics).await);
+        }
+    }
+    let guards = &state.guards;
+    if guards.is_empty() {
+        return Ok(respond(process_request(req, state.clone()).await));
     }
+    let started = Instant::now();
+    let origin = req.headers().get(ORIGIN).cloned();
+    let admission = match guards.admit(req.method(), req.headers(), peer.ip()) {
+        Ok(admission) => admission,
+        Err(Rejection::Preflight(headers)) => return Ok(preflight_response(headers)),
+        Err(rejection) => {
+            let mut resp = rejection_response(&rejection);
+            if let Some(metrics) = &state.metrics {
+                metrics
+                    .rejected()
+                    .record(resp.status().as_u16(), started.elapsed());
+            }
+            guards.decorate(origin.as_ref(), resp.headers_mut());
+            return Ok(resp);
+        }
+    };
+    let mut resp = respond(process_request(req, state.clone()).await);
+    drop(admission);
+    guards.decorate(origin.as_ref(), resp.headers_mut());
+    Ok(resp)
+}
+
+fn respond(result: Result<Response<Body>, CoreError>) -> Response<Body> {
+    result.unwrap_or_else(internal_error_response)
 }
 
 async fn process_request(
     req: Request<Incoming>,
-    registry: Arc<RouteRegistry>,
+    state: Arc<ServerState>,
 ) -> Result<Response<Body>, CoreError> {
+    let started = Instant::now();
+    let registry = &state.registry;
     let method = req.method().as_str().to_string();
     let path = req.uri().path().to_string();
 
-    let lookup = if let Some(found) = registry.lookup(&method, &path) {
-        found
-    } else if registry.path_exists_for_other_method(&method, &path) {
-        return Ok(simple_response(
-            method_not_allowed_status(),
-            b"Method Not Allowed".to_vec(),
-            TEXT_PLAIN_UTF8,
-        ));
-    } else {
-        return Ok(simple_response(
-            not_found_status(),
-            b"Not Found".to_vec(),
-            TEXT_PLAIN_UTF8,
-        ));
+    let Some(lookup) = registry.lookup(&method, &path) else {
+        let resp = if registry.path_exists_for_other_method(&method, &path) {
+            simple_response(
+                method_not_allowed_status(),
+                b"Method Not Allowed".to_vec(),
+                TEXT_PLAIN_UTF8,
+            )
+        } else {
+            simple_response(not_found_status(), b"Not Found".to_vec(), TEXT_PLAIN_UTF8)
+        };
+        if let Some(metrics) = &state.metrics {
+            metrics
+                .unmatched()
+                .record(resp.status().as_u16(), started.elapsed());
+        }
+        return Ok(resp);
     };
+    if state.metrics.is_none() {
+        return dispatch(req, lookup, &state, &method, &path).await;
+    }
+    let route = lookup.metrics.clone();
+    let _in_flight = route.enter();
+    let result = dispatch(req, lookup, &state, &method, &path).await;
+    let status = result
+        .as_ref()
+        .map_or(internal_error_status().as_u16(), |resp| {
+            resp.status().as_u16()
+        });
+    route.record(status, started.elapsed());
+    result
+}
 
+/// Run a matched route: response cache, body limits and the Python handler.
+async fn dispatch(
+    req: Request<Incoming>,
+    lookup: LookupResult,
+    state: &ServerState,
+    method: &str,
+    path: &str,
+) -> Result<Response<Body>, CoreError> {
     let (parts, body) = req.into_parts();
-    let body_bytes = body.collect().await.map_err(CoreError::from)?.to_bytes();
-    let headers = parts
-        .headers
-        .iter()
-        .map(|(k, v)| {
-            (
-                k.as_str().to_string(),
-                v.to_str().unwrap_or_default().to_string(),
-            )
-        })
-        .collect::<HashMap<_, _>>();
-    let query = parse_query(parts.uri.query());
+    let options = lookup.options;
+    let cache_key = match (&state.cache, &options.cache) {
+        (Some(_), Some(rule)) => {
+            ResponseCache::key_for(method, path, parts.uri.query(), &parts.headers, rule)
+        }
+        _ => None,
+    };
+    if let (Some(cache), Some(key)) = (&state.cache, &cache_key) {
+        if let Some(hit) = cache.get(key) {
+            return to_hyper_response(hit.to_outgoing());
+        }
+    }
+    if exceeds_body_limit(&parts.headers, options.max_body_bytes) {
+        return Ok(payload_too_large_response());
+    }
+    let (body_bytes, stream) = if options.stream_body {
+        (
+            Bytes::new(),
+            Some(BodyChunks::spawn(body, options.max_body_bytes)),
+        )
+    } else {
+        match read_body(body, options.max_body_bytes).await? {
+            Some(bytes) => (bytes, None),
+            None => return Ok(payload_too_large_response()),
+        }
+    };
 
     let request = IncomingRequest {
-        headers,
-        query,
+        headers: parts.headers,
+        query: parts.uri.query().map(str::to_owned),
         path_params: lookup.path_params,
         body: body_bytes,
+        stream,
     };
 
-    let response = call_python_handler(lookup.handler, request).await?;
+    let response = match call_python_handler(lookup.handler, request, &state.loops).await {
+        Ok(response) => response,
+        // A streamed body crossed `max_body_bytes` while the handler was reading it.
+        Err(CoreError::Py(err)) if options.stream_body && is_payload_too_large(&err) => {
+            return Ok(payload_too_large_response());
+        }
+        Err(err) => return Err(err),
+    };
+    if let (Some(cache), Some(key), Some(rule)) = (&state.cache, cache_key, &options.cache) {
+        cache.insert(key, &response, rule.ttl);
+    }
     to_hyper_response(response)
 }
 
+/// Buffer the whole body, or `None` when it grows past `max_bytes`.
+async fn read_body(body: Incoming, max_bytes: Option<usize>) -> Result<Option<Bytes>, CoreError> {
+    let Some(limit) = max_bytes else {
+        return Ok(Some(
+            body.collect().await.map_err(CoreError::from)?.to_bytes(),
+        ));
+    };
+    match Limited::new(body, limit).collect().await {
+        Ok(collected) => Ok(Some(collected.to_bytes())),
+        Err(err) if err.is::<LengthLimitError>() => Ok(None),
+        Err(err) => Err(CoreError::RequestBody(err.to_string())),
+    }
+}
+
+fn exceeds_body_limit(headers: &HeaderMap, max_bytes: Option<usize>) -> bool {
+    let Some(limit) = max_bytes else {
+        return false;
+    };
+    headers
+        .get(CONTENT_LENGTH)
+        .and_then(|v| v.to_str().ok())
+        .and_then(|v| v.parse::<usize>().ok())
+        .is_some_and(|len| len > limit)
+}
+
 fn to_hyper_response(out: OutgoingResponse) -> Result<Response<Body>, CoreError> {
     let status = StatusCode::from_u16(out.status)
         .map_err(|e| CoreError::ResponseBuild(format!("invalid status code: {e}")))?;
     let mut builder = Response::builder().status(status);
-    for (k, v) in out.headers {
-        builder = builder.header(header_name(&k)?, header_value(&v)?);
+    if let Some(headers) = builder.headers_mut() {
+        *headers = out.headers;
     }
     let body = match out.body {
         ResponseBody::Bytes(body) => full_body(body),
@@ -122,7 +296,15 @@ fn to_hyper_response(out: OutgoingResponse) -> Result<Response<Body>, CoreError>
             let file = tokio::fs::File::from_std(file);
             let stream = ReaderStream::new(file)
                 .map(|item: Result<Bytes, std::io::Error>| item.map(Frame::data));
-            BodyExt::boxed(StreamBody::new(stream))
+            BodyExt::boxed_unsync(StreamBody::new(stream))
+        }
+        ResponseBody::Stream(chunks) => {
+            let stream = futures_util::stream::unfold(chunks, |chunks| async move {
+                let item = chunks.next_chunk().await?;
+                let frame = item.map(Frame::data).map_err(std::io::Error::other);
+                Some((frame, chunks))
+            });
+            BodyExt::boxed_unsync(StreamBody::new(stream))
         }
     };
     builder
@@ -140,10 +322,51 @@ fn simple_response(status: StatusCode, body: Vec<u8>, content_type: &str) -> Res
     resp
 }
 
-fn full_body(body: Vec<u8>) -> Body {
-    Full::new(Bytes::from(body))
+async fn metrics_response(metrics: &ServerMetrics) -> Response<Body> {
+    simple_response(
+        StatusCode::OK,
+        metrics.render().await.into_bytes(),
+        PROMETHEUS_TEXT,
+    )
+}
+
+fn preflight_response(headers: HeaderMap) -> Response<Body> {
+    let mut resp = Response::new(full_body(Bytes::new()));
+    *resp.status_mut() = no_content_status();
+    *resp.headers_mut() = headers;
+    resp
+}
+
+fn rejection_response(rejection: &Rejection) -> Response<Body> {
+    let mut resp = match rejection {
+        Rejection::TooManyRequests => simple_response(
+            too_many_requests_status(),
+            b"Too Many Requests".to_vec(),
+            TEXT_PLAIN_UTF8,
+        ),
+        Rejection::Overloaded | Rejection::Preflight(_) => simple_response(
+            service_unavailable_status(),
+            b"Service Unavailable".to_vec(),
+            TEXT_PLAIN_UTF8,
+        ),
+    };
+    resp.headers_mut()
+        .insert(RETRY_AFTER, HeaderValue::from_static("1"));
+    resp
+}
+
+fn payload_too_large_response() -> Response<Body> {
+    simple_response(
+        payload_too_large_status(),
+        b"Payload Too Large".to_vec(),
+        TEXT_PLAIN_UTF8,
+    )
+}
+
+fn full_body(body: impl Into<Bytes>) -> Body {
+    Full::new(body.into())
         .map_err(|never: Infallible| match never {})
-        .boxed()
+        .boxed_unsync()
 }
 
 fn internal_error_response(err: CoreError) -> Response<Body> {
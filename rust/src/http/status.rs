@@ -11,3 +11,19 @@ pub fn method_not_allowed_status() -> StatusCode {
 pub fn internal_error_status() -> StatusCode {
     StatusCode::INTERNAL_SERVER_ERROR
 }
+
+pub fn payload_too_large_status() -> StatusCode {
+    StatusCode::PAYLOAD_TOO_LARGE
+}
+
+pub fn no_content_status() -> StatusCode {
+    StatusCode::NO_CONTENT
+}
+
+pub fn too_many_requests_status() -> StatusCode {
+    StatusCode::TOO_MANY_REQUESTS
+}
+
+pub fn service_unavailable_status() -> StatusCode {
+    StatusCode::SERVICE_UNAVAILABLE
+}
@@ -1,17 +1,29 @@
 mod bridge;
+mod cache;
 mod errors;
 mod http;
 mod lifecycle;
 mod middleware;
+mod observability;
 mod routing;
 mod serialization;
 
 use bridge::py_entry::start_server;
+use bridge::request_view::{NativeRequest, PayloadTooLargeError, RequestBodyStream};
+use bridge::response_view::{HeaderSet, NativeResponse};
 use pyo3::prelude::*;
 use pyo3::wrap_pyfunction;
 
-#[pymodule]
+#[pymodule(gil_used = false)]
 fn _native(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(start_server, m)?)?;
+    m.add_class::<NativeRequest>()?;
+    m.add_class::<RequestBodyStream>()?;
+    m.add_class::<NativeResponse>()?;
+    m.add_class::<HeaderSet>()?;
+    m.add(
+        "PayloadTooLargeError",
+        m.py().get_type::<PayloadTooLargeError>(),
+    )?;
     Ok(())
 }
@@ -1,16 +1,59 @@
+use std::sync::Arc;
+
+use tokio::runtime::Runtime;
+
+use crate::bridge::event_loop::EventLoopPool;
+use crate::cache::response_cache::ResponseCache;
 use crate::errors::core_error::CoreError;
-use crate::http::server::serve;
+use crate::http::server::{serve, ServerState};
 use crate::lifecycle::bootstrap::build_runtime;
+use crate::middleware::guards::NativeGuards;
+use crate::observability::metrics::ServerMetrics;
 use crate::routing::method_table::RouteRegistry;
 use crate::routing::radix::RouteDefinition;
 
+/// Where and how the server listens.
+pub struct ListenConfig {
+    pub host: String,
+    pub port: u16,
+    pub workers: usize,
+    pub reuse_port: bool,
+}
+
 pub fn run(
-    host: String,
-    port: u16,
-    workers: usize,
+    listen: ListenConfig,
     routes: Vec<RouteDefinition>,
+    loops: EventLoopPool,
+    cache: Option<ResponseCache>,
+    guards: NativeGuards,
+    mut metrics: Option<ServerMetrics>,
 ) -> Result<(), CoreError> {
-    let runtime = build_runtime(workers)?;
+    // Leaked on purpose: the runtime lives for the whole process and is shared with
+    // pyo3-async-runtimes so Rust futures awaited from Python run on the same workers.
+    let runtime: &'static Runtime = Box::leak(Box::new(build_runtime(listen.workers)?));
+    let _ = pyo3_async_runtimes::tokio::init_with_runtime(runtime);
     let registry = RouteRegistry::from_routes(routes)?;
-    runtime.block_on(serve(host, port, registry))
+    if let Some(metrics) = metrics.as_mut() {
+        metrics.track(registry.route_metrics());
+        if listen.reuse_port {
+            metrics.label_process(std::process::id());
+        }
+    }
+    let state = Arc::new(ServerState {
+        registry,
+        loops,
+        cache,
+        guards,
+        metrics,
+    });
+    let served = runtime.block_on(serve(
+        listen.host,
+        listen.port,
+        listen.reuse_port,
+        state.clone(),
+    ));
+    // Connection tasks may still hold the state on the leaked runtime, so the loops
+    // are stopped explicitly rather than on drop.
+    state.loops.shutdown();
+    served
 }
@@ -0,0 +1,399 @@
+use std::collections::hash_map::RandomState;
+use std::collections::{HashMap, HashSet};
+use std::hash::BuildHasher;
+use std::net::IpAddr;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::Mutex;
+use std::time::Instant;
+
+use http::header::{
+    ACCESS_CONTROL_ALLOW_CREDENTIALS, ACCESS_CONTROL_ALLOW_HEADERS, ACCESS_CONTROL_ALLOW_METHODS,
+    ACCESS_CONTROL_ALLOW_ORIGIN, ACCESS_CONTROL_MAX_AGE, ACCESS_CONTROL_REQUEST_METHOD, ORIGIN,
+    VARY,
+};
+use http::{HeaderMap, HeaderName, HeaderValue, Method};
+
+const RATE_LIMIT_SHARDS: usize = 16;
+const MAX_KEYS_PER_SHARD: usize = 4096;
+/// Keys freed per eviction sweep, so the O(n) sweep runs at most once per this many new keys.
+const EVICT_BATCH: usize = MAX_KEYS_PER_SHARD / 4;
+
+/// Declarative request guards enforced on the tokio worker before Python runs.
+#[derive(Default)]
+pub struct NativeGuards {
+    pub cors: Option<CorsGuard>,
+    pub rate_limit: Option<RateLimitGuard>,
+    pub backpressure: Option<BackpressureGuard>,
+}
+
+pub enum Rejection {
+    /// CORS preflight answered natively with these headers (possibly empty).
+    Preflight(HeaderMap),
+    TooManyRequests,
+    Overloaded,
+}
+
+/// Admitted request; holds the in-flight slot until dropped.
+pub struct Admission<'a> {
+    _permit: Option<InflightPermit<'a>>,
+}
+
+impl NativeGuards {
+    pub fn is_empty(&self) -> bool {
+        self.cors.is_none() && self.rate_limit.is_none() && self.backpressure.is_none()
+    }
+
+    pub fn admit(
+        &self,
+        method: &Method,
+        headers: &HeaderMap,
+        peer: IpAddr,
+    ) -> Result<Admission<'_>, Rejection> {
+        if let Some(cors) = &self.cors {
+            if let Some(preflight) = cors.preflight(method, headers) {
+                return Err(Rejection::Preflight(preflight));
+            }
+        }
+        let permit = match &self.backpressure {
+            Some(guard) => Some(guard.try_acquire().ok_or(Rejection::Overloaded)?),
+            None => None,
+        };
+        if let Some(limiter) = &self.rate_limit {
+            if !limiter.allow(headers, peer) {
+                return Err(Rejection::TooManyRequests);
+            }
+        }
+        Ok(Admission { _permit: permit })
+    }
+
+    /// Add CORS response headers for an allowed `origin` unless the handler set them.
+    pub fn decorate(&self, origin: Option<&HeaderValue>, out: &mut HeaderMap) {
+        if let (Some(cors), Some(origin)) = (&self.cors, origin) {
+            if !out.contains_key(ACCESS_CONTROL_ALLOW_ORIGIN) {
+                cors.write_simple(origin, out);
+            }
+        }
+    }
+}
+
+pub struct CorsGuard {
+    any_origin: bool,
+    origins: HashSet<String>,
+    methods: Vec<Method>,
+    allow_methods: HeaderValue,
+    allow_headers: HeaderValue,
+    max_age: HeaderValue,
+    credentials: bool,
+}
+
+impl CorsGuard {
+    pub fn new(
+        origins: Vec<String>,
+        methods: Vec<String>,
+        headers: Vec<String>,
+        credentials: bool,
+        max_age: u64,
+    ) -> Result<Self, String> {
+        let methods = methods
+            .iter()
+            .map(|m| Method::from_bytes(m.to_ascii_uppercase().as_bytes()))
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| format!("invalid CORS method: {e}"))?;
+        let joined_methods = methods
+            .iter()
+            .map(Method::as_str)
+            .collect::<Vec<_>>()
+            .join(", ");
+        Ok(Self {
+            any_origin: origins.iter().any(|o| o == "*"),
+            origins: origins.into_iter().collect(),
+            methods,
+            allow_methods: value(&joined_methods)?,
+            allow_headers: value(&headers.join(", "))?,
+            max_age: HeaderValue::from(max_age),
+            credentials,
+        })
+    }
+
+    fn preflight(&self, method: &Method, headers: &HeaderMap) -> Option<HeaderMap> {
+        if method != Method::OPTIONS {
+            return None;
+        }
+        let origin = headers.get(ORIGIN)?;
+        let requested = headers.get(ACCESS_CONTROL_REQUEST_METHOD)?;
+        let mut out = HeaderMap::new();
+        let method_allowed = Method::from_bytes(requested.as_bytes())
+            .is_ok_and(|requested| self.methods.contains(&requested));
+        if method_allowed && self.write_simple(origin, &mut out) {
+            out.insert(ACCESS_CONTROL_ALLOW_METHODS, self.allow_methods.clone());
+            out.insert(ACCESS_CONTROL_ALLOW_HEADERS, self.allow_headers.clone());
+            out.insert(ACCESS_CONTROL_MAX_AGE, self.max_age.clone());
+        }
+        Some(out)
+    }
+
+    fn write_simple(&self, origin: &HeaderValue, out: &mut HeaderMap) -> bool {
+        let allowed = self.any_origin
+            || origin
+                .to_str()
+                .is_ok_and(|origin| self.origins.contains(origin));
+        if !allowed {
+            return false;
+        }
+        let allow_origin = if self.any_origin {
+            HeaderValue::from_static("*")
+        } else {
+            origin.clone()
+        };
+        out.insert(ACCESS_CONTROL_ALLOW_ORIGIN, allow_origin);
+        out.append(VARY, HeaderValue::from_static("origin"));
+        if self.credentials {
+            out.insert(
+                ACCESS_CONTROL_ALLOW_CREDENTIALS,
+                HeaderValue::from_static("true"),
+            );
+        }
+        true
+    }
+}
+
+pub enum RateLimitKey {
+    ClientIp,
+    Header(HeaderName),
+}
+
+struct Bucket {
+    tokens: f64,
+    last: Instant,
+}
+
+/// Token buckets per client key, sharded so workers rarely contend on one lock.
+pub struct RateLimitGuard {
+    rate_per_sec: f64,
+    burst: f64,
+    key: RateLimitKey,
+    hasher: RandomState,
+    shards: Vec<Mutex<HashMap<String, Bucket>>>,
+}
+
+impl RateLimitGuard {
+    pub fn new(rate_per_sec: f64, burst: u32, key: RateLimitKey) -> Self {
+        Self {
+            rate_per_sec: rate_per_sec.max(0.0),
+            burst: f64::from(burst.max(1)),
+            key,
+            hasher: RandomState::new(),
+            shards: (0..RATE_LIMIT_SHARDS)
+                .map(|_| Mutex::new(HashMap::new()))
+                .collect(),
+        }
+    }
+
+    fn allow(&self, headers: &HeaderMap, peer: IpAddr) -> bool {
+        let header_key = match &self.key {
+            RateLimitKey::Header(name) => headers.get(name).and_then(|v| v.to_str().ok()),
+            RateLimitKey::ClientIp => None,
+        };
+        match header_key {
+            Some(key) => self.take(key),
+            None => self.take(&peer.to_string()),
+        }
+    }
+
+    fn take(&self, key: &str) -> bool {
+        let shard = &self.shards[self.hasher.hash_one(key) as usize % self.shards.len()];
+        let mut buckets = shard
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner());
+        let now = Instant::now();
+        if !buckets.contains_key(key) {
+            if buckets.len() >= MAX_KEYS_PER_SHARD {
+                self.evict(&mut buckets, now);
+            }
+            buckets.insert(
+                key.to_string(),
+                Bucket {
+                    tokens: self.burst,
+                    last: now,
+                },
+            );
+        }
+        let Some(bucket) = buckets.get_mut(key) else {
+            return true;
+        };
+        let elapsed = now.duration_since(bucket.last).as_secs_f64();
+        bucket.tokens = (bucket.tokens + elapsed * self.rate_per_sec).min(self.burst);
+        bucket.last = now;
+        if bucket.tokens < 1.0 {
+            return false;
+        }
+        bucket.tokens -= 1.0;
+        true
+    }
+
+    /// Bring a full shard down to `MAX_KEYS_PER_SHARD - EVICT_BATCH` keys.
+    ///
+    /// Buckets that have refilled completely carry no state and go first; if that is
+    /// not enough (e.g. `rate_per_sec == 0`, or callers inventing header values), the
+    /// least recently seen keys are dropped so the shard never exceeds its cap.
+    fn evict(&self, buckets: &mut HashMap<String, Bucket>, now: Instant) {
+        buckets.retain(|_, bucket| {
+            let elapsed = now.duration_since(bucket.last).as_secs_f64();
+            bucket.tokens + elapsed * self.rate_per_sec < self.burst
+        });
+        let target = MAX_KEYS_PER_SHARD - EVICT_BATCH;
+        if buckets.len() <= target {
+            return;
+        }
+        let excess = buckets.len() - target;
+        let mut seen: Vec<Instant> = buckets.values().map(|bucket| bucket.last).collect();
+        let cutoff = *seen.select_nth_unstable(excess - 1).1;
+        buckets.retain(|_, bucket| bucket.last > cutoff);
+    }
+}
+
+pub struct BackpressureGuard {
+    max_inflight: usize,
+    inflight: AtomicUsize,
+}
+
+pub struct InflightPermit<'a> {
+    guard: &'a BackpressureGuard,
+}
+
+impl Drop for InflightPermit<'_> {
+    fn drop(&mut self) {
+        self.guard.inflight.fetch_sub(1, Ordering::AcqRel);
+    }
+}
+
+impl BackpressureGuard {
+    pub fn new(max_inflight: usize) -> Self {
+        Self {
+            max_inflight: max_inflight.max(1),
+            inflight: AtomicUsize::new(0),
+        }
+    }
+
+    fn try_acquire(&self) -> Option<InflightPermit<'_>> {
+        let mut current = self.inflight.load(Ordering::Acquire);
+        loop {
+            if current >= self.max_inflight {
+                return None;
+            }
+            match self.inflight.compare_exchange_weak(
+                current,
+                current + 1,
+                Ordering::AcqRel,
+                Ordering::Acquire,
+            ) {
+                Ok(_) => return Some(InflightPermit { guard: self }),
+                Err(actual) => current = actual,
+            }
+        }
+    }
+}
+
+fn value(raw: &str) -> Result<HeaderValue, String> {
+    HeaderValue::from_str(raw).map_err(|e| format!("invalid CORS header value: {e}"))
+}
+
+#[cfg(test)]
+mod tests {
+    use std::net::{IpAddr, Ipv4Addr};
+
+    use http::{HeaderMap, HeaderName, HeaderValue, Method};
+
+    use super::{
+        BackpressureGuard, CorsGuard, NativeGuards, RateLimitGuard, RateLimitKey, Rejection,
+        MAX_KEYS_PER_SHARD, RATE_LIMIT_SHARDS,
+    };
+
+    const PEER: IpAddr = IpAddr::V4(Ipv4Addr::LOCALHOST);
+
+    fn cors() -> CorsGuard {
+        CorsGuard::new(
+            vec!["https://app.example".to_string()],
+            vec!["GET".to_string(), "POST".to_string()],
+            vec!["content-type".to_string()],
+            false,
+            600,
+        )
+        .expect("cors config should be valid")
+    }
+
+    #[test]
+    fn preflight_is_answered_with_allow_headers() {
+        let guards = NativeGuards {
+            cors: Some(cors()),
+            ..NativeGuards::default()
+        };
+        let mut headers = HeaderMap::new();
+        headers.insert("origin", HeaderValue::from_static("https://app.example"));
+        headers.insert(
+            "access-control-request-method",
+            HeaderValue::from_static("POST"),
+        );
+        match guards.admit(&Method::OPTIONS, &headers, PEER) {
+            Err(Rejection::Preflight(out)) => {
+                assert_eq!(out["access-control-allow-origin"], "https://app.example");
+                assert_eq!(out["access-control-allow-methods"], "GET, POST");
+                assert_eq!(out["access-control-max-age"], "600");
+            }
+            _ => panic!("expected native preflight answer"),
+        }
+    }
+
+    #[test]
+    fn rate_limit_rejects_after_burst_per_key() {
+        let guards = NativeGuards {
+            rate_limit: Some(RateLimitGuard::new(0.0, 2, RateLimitKey::ClientIp)),
+            ..NativeGuards::default()
+        };
+        let headers = HeaderMap::new();
+        assert!(guards.admit(&Method::GET, &headers, PEER).is_ok());
+        assert!(guards.admit(&Method::GET, &headers, PEER).is_ok());
+        assert!(matches!(
+            guards.admit(&Method::GET, &headers, PEER),
+            Err(Rejection::TooManyRequests)
+        ));
+        let other = IpAddr::V4(Ipv4Addr::new(10, 0, 0, 1));
+        assert!(guards.admit(&Method::GET, &headers, other).is_ok());
+    }
+
+    #[test]
+    fn rate_limit_key_table_stays_bounded() {
+        let guard = RateLimitGuard::new(
+            0.0,
+            1,
+            RateLimitKey::Header(HeaderName::from_static("x-api-key")),
+        );
+        let cap = MAX_KEYS_PER_SHARD * RATE_LIMIT_SHARDS;
+        for idx in 0..cap * 2 {
+            let mut headers = HeaderMap::new();
+            headers.insert("x-api-key", HeaderValue::from(idx));
+            guard.allow(&headers, PEER);
+        }
+        for shard in &guard.shards {
+            let len = shard.lock().expect("shard lock").len();
+            assert!(len <= MAX_KEYS_PER_SHARD, "shard holds {len} keys");
+        }
+    }
+
+    #[test]
+    fn backpressure_releases_slot_when_admission_drops() {
+        let guards = NativeGuards {
+            backpressure: Some(BackpressureGuard::new(1)),
+            ..NativeGuards::default()
+        };
+        let headers = HeaderMap::new();
+        let first = guards.admit(&Method::GET, &headers, PEER);
+        assert!(first.is_ok());
+        assert!(matches!(
+            guards.admit(&Method::GET, &headers, PEER),
+            Err(Rejection::Overloaded)
+        ));
+        drop(first);
+        assert!(guards.admit(&Method::GET, &headers, PEER).is_ok());
+    }
+}
@@ -1,2 +1,3 @@
 pub mod chain;
+pub mod guards;
 pub mod hooks;
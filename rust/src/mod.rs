@@ -1,7 +1,9 @@
 pub mod bridge;
+pub mod cache;
 pub mod errors;
 pub mod http;
 pub mod lifecycle;
 pub mod middleware;
+pub mod observability;
 pub mod routing;
 pub mod serialization;
@@ -0,0 +1,95 @@
+use std::cell::Cell;
+use std::collections::hash_map::RandomState;
+use std::hash::{BuildHasher, Hasher};
+use std::time::{SystemTime, UNIX_EPOCH};
+
+use http::HeaderMap;
+
+pub const CORRELATION_ID_HEADER: &str = "x-correlation-id";
+pub const TRACEPARENT_HEADER: &str = "traceparent";
+
+thread_local! {
+    static STATE: Cell<u64> = Cell::new(seed());
+}
+
+/// Correlation id and W3C `traceparent` for one request, taken from its headers or
+/// generated. Mirrors `vyro.observability.ids.resolve_request_ids`.
+pub struct TraceIds {
+    pub correlation_id: String,
+    pub traceparent: String,
+}
+
+impl TraceIds {
+    pub fn resolve(headers: &HeaderMap) -> Self {
+        let header = |name: &str| headers.get(name).and_then(|v| v.to_str().ok());
+        let traceparent = header(TRACEPARENT_HEADER);
+        let (correlation_id, trace_id) = match header(CORRELATION_ID_HEADER) {
+            Some(value) => (value.to_string(), None),
+            None => {
+                let trace_id = format!("{:032x}", trace_id());
+                (trace_id.clone(), Some(trace_id))
+            }
+        };
+        let traceparent = match traceparent {
+            Some(value) => value.to_string(),
+            None => {
+                let trace_id = trace_id.unwrap_or_else(|| trace_id_from(&correlation_id));
+                format!("00-{trace_id}-{:016x}-01", span_id())
+            }
+        };
+        Self {
+            correlation_id,
+            traceparent,
+        }
+    }
+}
+
+/// Random non-zero 128-bit trace id.
+pub fn trace_id() -> u128 {
+    let id = (u128::from(next_u64()) << 64) | u128::from(next_u64());
+    id.max(1)
+}
+
+/// Random non-zero 64-bit span id.
+pub fn span_id() -> u64 {
+    next_u64().max(1)
+}
+
+fn trace_id_from(seed: &str) -> String {
+    let candidate: String = seed
+        .chars()
+        .filter(|c| *c != '-')
+        .map(|c| c.to_ascii_lowercase())
+        .collect();
+    let valid = candidate.len() == 32
+        && candidate.bytes().all(|b| b.is_ascii_hexdigit())
+        && candidate.bytes().any(|b| b != b'0');
+    if valid {
+        candidate
+    } else {
+        format!("{:032x}", trace_id())
+    }
+}
+
+/// splitmix64 over a per-thread state; ids need uniqueness, not unpredictability.
+fn next_u64() -> u64 {
+    STATE.with(|state| {
+        let next = state.get().wrapping_add(0x9E37_79B9_7F4A_7C15);
+        state.set(next);
+        let mut z = next;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        z ^ (z >> 31)
+    })
+}
+
+fn seed() -> u64 {
+    // RandomState carries OS-seeded per-thread keys; mixing in the clock keeps
+    // threads created after a fork from repeating the parent's sequence.
+    let mut hasher = RandomState::new().build_hasher();
+    let nanos = SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .map_or(0, |d| d.as_nanos());
+    hasher.write_u128(nanos);
+    hasher.finish()
+}
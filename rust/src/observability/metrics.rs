@@ -0,0 +1,366 @@
+use std::fmt::Write as _;
+use std::sync::atomic::{AtomicI64, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
+
+use pyo3::prelude::*;
+
+/// Upper bounds of the latency histogram, matching `vyro.observability.latency`.
+const LATENCY_BOUNDS_MS: [f64; 14] = [
+    0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0,
+];
+const LATENCY_BOUNDS_US: [u64; 14] = [
+    500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000,
+    2_500_000, 5_000_000, 10_000_000,
+];
+const STATUS_CLASSES: [&str; 5] = ["1xx", "2xx", "3xx", "4xx", "5xx"];
+
+/// Per-status-class counters; updated with relaxed atomics from any tokio worker.
+#[derive(Default)]
+struct ClassSeries {
+    requests: AtomicU64,
+    sum_us: AtomicU64,
+    /// Non-cumulative; the overflow slot counts samples above the last bound.
+    buckets: [AtomicU64; LATENCY_BOUNDS_US.len() + 1],
+}
+
+/// RED series for one (method, route template) pair, split by status class.
+pub struct RouteMetrics {
+    method: String,
+    route: String,
+    in_flight: AtomicI64,
+    classes: [ClassSeries; 5],
+}
+
+/// Decrements the in-flight gauge when the request finishes or is cancelled.
+pub struct InFlight<'a> {
+    metrics: &'a RouteMetrics,
+}
+
+impl Drop for InFlight<'_> {
+    fn drop(&mut self) {
+        self.metrics.in_flight.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+impl RouteMetrics {
+    pub fn new(method: &str, route: &str) -> Self {
+        Self {
+            method: method.to_string(),
+            route: route.to_string(),
+            in_flight: AtomicI64::new(0),
+            classes: Default::default(),
+        }
+    }
+
+    pub fn enter(&self) -> InFlight<'_> {
+        self.in_flight.fetch_add(1, Ordering::Relaxed);
+        InFlight { metrics: self }
+    }
+
+    pub fn record(&self, status: u16, elapsed: Duration) {
+        let class = usize::from(status / 100).clamp(1, 5) - 1;
+        let series = &self.classes[class];
+        let micros = u64::try_from(elapsed.as_micros()).unwrap_or(u64::MAX);
+        let bucket = LATENCY_BOUNDS_US
+            .iter()
+            .position(|bound| micros <= *bound)
+            .unwrap_or(LATENCY_BOUNDS_US.len());
+        series.requests.fetch_add(1, Ordering::Relaxed);
+        series.sum_us.fetch_add(micros, Ordering::Relaxed);
+        series.buckets[bucket].fetch_add(1, Ordering::Relaxed);
+    }
+
+    fn labels(&self, process: &str) -> String {
+        format!(
+            "method=\"{}\",route=\"{}\"{process}",
+            escape_label(&self.method),
+            escape_label(&self.route)
+        )
+    }
+}
+
+/// Cached output of a Python render callable, refreshed at most once per interval.
+pub struct PythonMetrics {
+    render: Arc<Py<PyAny>>,
+    refresh: Duration,
+    process: Option<String>,
+    cached: Mutex<Option<(Instant, Arc<str>)>>,
+}
+
+impl PythonMetrics {
+    pub fn new(render: Py<PyAny>, refresh: Duration) -> Self {
+        Self {
+            render: Arc::new(render),
+            refresh,
+            process: None,
+            cached: Mutex::new(None),
+        }
+    }
+
+    async fn text(&self) -> Option<Arc<str>> {
+        if let Some(text) = self.fresh() {
+            return Some(text);
+        }
+        let render = self.render.clone();
+        let rendered = tokio::task::spawn_blocking(move || {
+            Python::with_gil(|py| render.call0(py)?.extract::<String>(py))
+        })
+        .await;
+        match rendered {
+            Ok(Ok(text)) => {
+                let text: Arc<str> = match &self.process {
+                    Some(label) => Arc::from(with_label(&text, label)),
+                    None => Arc::from(text),
+                };
+                if let Ok(mut cached) = self.cached.lock() {
+                    *cached = Some((Instant::now(), text.clone()));
+                }
+                Some(text)
+            }
+            Ok(Err(err)) => {
+                eprintln!("python metrics render failed: {err}");
+                self.stale()
+            }
+            Err(err) => {
+                eprintln!("python metrics render failed: {err}");
+                self.stale()
+            }
+        }
+    }
+
+    fn fresh(&self) -> Option<Arc<str>> {
+        let cached = self.cached.lock().ok()?;
+        let (at, text) = cached.as_ref()?;
+        (at.elapsed() < self.refresh).then(|| text.clone())
+    }
+
+    fn stale(&self) -> Option<Arc<str>> {
+        let cached = self.cached.lock().ok()?;
+        cached.as_ref().map(|(_, text)| text.clone())
+    }
+}
+
+/// Native RED metrics for every route plus the optional `/metrics` endpoint config.
+///
+/// The endpoint is answered before guards run, so it bypasses rate limits, CORS and
+/// auth checks; expose it on an internal path.
+pub struct ServerMetrics {
+    pub path: String,
+    routes: Vec<Arc<RouteMetrics>>,
+    unmatched: RouteMetrics,
+    rejected: RouteMetrics,
+    python: Option<PythonMetrics>,
+    /// `,pid="..."` once `label_process` is called, else empty.
+    process: String,
+}
+
+impl ServerMetrics {
+    pub fn new(path: String, python: Option<PythonMetrics>) -> Self {
+        Self {
+            path,
+            routes: Vec::new(),
+            unmatched: RouteMetrics::new("*", "unmatched"),
+            rejected: RouteMetrics::new("*", "rejected"),
+            python,
+            process: String::new(),
+        }
+    }
+
+    /// Label every series with this process id. Worker processes sharing a port each
+    /// keep their own counters and a scrape reaches only one of them, so without the
+    /// label series from different workers would look like one counter resetting.
+    pub fn label_process(&mut self, pid: u32) {
+        let label = format!("pid=\"{pid}\"");
+        self.process = format!(",{label}");
+        if let Some(python) = self.python.as_mut() {
+            python.process = Some(label);
+        }
+    }
+
+    /// Register the per-route series owned by the route table.
+    pub fn track(&mut self, routes: Vec<Arc<RouteMetrics>>) {
+        self.routes = routes;
+    }
+
+    /// Series for requests that matched no route (404/405).
+    pub fn unmatched(&self) -> &RouteMetrics {
+        &self.unmatched
+    }
+
+    /// Series for requests refused by native guards before routing.
+    pub fn rejected(&self) -> &RouteMetrics {
+        &self.rejected
+    }
+
+    /// Prometheus text exposition of native series followed by the Python registry.
+    pub async fn render(&self) -> String {
+        let mut out = self.render_native();
+        if let Some(python) = &self.python {
+            if let Some(text) = python.text().await {
+                out.push_str(&text);
+            }
+        }
+        out
+    }
+
+    fn render_native(&self) -> String {
+        let series: Vec<&RouteMetrics> = self
+            .routes
+            .iter()
+            .map(Arc::as_ref)
+            .chain([&self.unmatched, &self.rejected])
+            .collect();
+        let mut out = String::with_capacity(256 + series.len() * 2048);
+
+        header(
+            &mut out,
+            "vyro_http_requests_total",
+            "counter",
+            "Requests handled per route and status class",
+        );
+        for route in &series {
+            let labels = route.labels(&self.process);
+            for (class, name) in route.classes.iter().zip(STATUS_CLASSES) {
+                let count = class.requests.load(Ordering::Relaxed);
+                if count > 0 {
+                    let _ = writeln!(
+                        out,
+                        "vyro_http_requests_total{{{labels},status_class=\"{name}\"}} {count}"
+                    );
+                }
+            }
+        }
+
+        header(
+            &mut out,
+            "vyro_http_errors_total",
+            "counter",
+            "Requests per route answered with a 5xx status",
+        );
+        for route in &series {
+            let errors = route.classes[4].requests.load(Ordering::Relaxed);
+            let _ = writeln!(
+                out,
+                "vyro_http_errors_total{{{}}} {errors}",
+                route.labels(&self.process)
+            );
+        }
+
+        header(
+            &mut out,
+            "vyro_http_requests_in_flight",
+            "gauge",
+            "Requests currently being handled per route",
+        );
+        for route in &series {
+            let value = route.in_flight.load(Ordering::Relaxed);
+            let _ = writeln!(
+                out,
+                "vyro_http_requests_in_flight{{{}}} {value}",
+                route.labels(&self.process)
+            );
+        }
+
+        header(
+            &mut out,
+            "vyro_http_request_duration_ms",
+            "histogram",
+            "Time to response head per route in milliseconds",
+        );
+        for route in &series {
+            let labels = route.labels(&self.process);
+            for (class, name) in route.classes.iter().zip(STATUS_CLASSES) {
+                let count = class.requests.load(Ordering::Relaxed);
+                if count == 0 {
+                    continue;
+                }
+                let labels = format!("{labels},status_class=\"{name}\"");
+                let mut cumulative = 0;
+                for (bucket, bound) in class.buckets.iter().zip(LATENCY_BOUNDS_MS) {
+                    cumulative += bucket.load(Ordering::Relaxed);
+                    let _ = writeln!(out, "vyro_http_request_duration_ms_bucket{{{labels},le=\"{bound}\"}} {cumulative}");
+                }
+                // Derive the total from the buckets so a concurrent `record` cannot
+                // leave `+Inf` below a finite bucket.
+                cumulative += class.buckets[LATENCY_BOUNDS_US.len()].load(Ordering::Relaxed);
+                let sum_ms = class.sum_us.load(Ordering::Relaxed) as f64 / 1000.0;
+                let _ = writeln!(
+                    out,
+                    "vyro_http_request_duration_ms_bucket{{{labels},le=\"+Inf\"}} {cumulative}"
+                );
+                let _ = writeln!(
+                    out,
+                    "vyro_http_request_duration_ms_sum{{{labels}}} {sum_ms}"
+                );
+                let _ = writeln!(
+                    out,
+                    "vyro_http_request_duration_ms_count{{{labels}}} {cumulative}"
+                );
+            }
+        }
+        out
+    }
+}
+
+/// Add `label` to every sample line of a Prometheus text exposition.
+fn with_label(text: &str, label: &str) -> String {
+    let mut out = String::with_capacity(text.len() + text.len() / 8);
+    for line in text.lines() {
+        if line.is_empty() || line.starts_with('#') {
+            out.push_str(line);
+        } else {
+            match line.find(['{', ' ']) {
+                Some(at) if line[at..].starts_with("{}") => {
+                    let _ = write!(out, "{}{{{label}}}{}", &line[..at], &line[at + 2..]);
+                }
+                Some(at) if line[at..].starts_with('{') => {
+                    let _ = write!(out, "{}{{{label},{}", &line[..at], &line[at + 1..]);
+                }
+                Some(at) => {
+                    let _ = write!(out, "{}{{{label}}}{}", &line[..at], &line[at..]);
+                }
+                None => out.push_str(line),
+            }
+        }
+        out.push('\n');
+    }
+    out
+}
+
+fn header(out: &mut String, name: &str, kind: &str, help: &str) {
+    let _ = writeln!(out, "# HELP {name} {help}");
+    let _ = writeln!(out, "# TYPE {name} {kind}");
+}
+
+fn escape_label(value: &str) -> String {
+    value
+        .replace('\\', "\\\\")
+        .replace('"', "\\\"")
+        .replace('\n', "\\n")
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn with_label_adds_the_label_to_every_sample() {
+        let text = "# TYPE a counter\na 1\nb{x=\"y z\"} 2\nc{} 3\n";
+        assert_eq!(
+            with_label(text, "pid=\"7\""),
+            "# TYPE a counter\na{pid=\"7\"} 1\nb{pid=\"7\",x=\"y z\"} 2\nc{pid=\"7\"} 3\n"
+        );
+    }
+
+    #[test]
+    fn labelled_process_appears_on_native_series() {
+        let mut metrics = ServerMetrics::new("/metrics".to_string(), None);
+        metrics.label_process(42);
+        metrics.rejected().record(429, Duration::from_millis(1));
+        let text = metrics.render_native();
+        assert!(text.contains(
+            "vyro_http_requests_total{method=\"*\",route=\"rejected\",pid=\"42\",status_class=\"4xx\"} 1"
+        ));
+    }
+}
@@ -4,6 +4,7 @@ use std::sync::Arc;
 use matchit::Router;
 
 use crate::errors::core_error::CoreError;
+use crate::observability::metrics::RouteMetrics;
 use crate::routing::errors::RoutingResult;
 use crate::routing::params::LookupResult;
 use crate::routing::radix::{RouteDefinition, RouteHandler};
@@ -11,20 +12,26 @@ use crate::routing::radix::{RouteDefinition, RouteHandler};
 #[derive(Clone, Default)]
 pub struct RouteRegistry {
     method_routers: HashMap<String, Arc<Router<RouteHandler>>>,
+    route_metrics: Vec<Arc<RouteMetrics>>,
 }
 
 impl RouteRegistry {
     pub fn from_routes(routes: Vec<RouteDefinition>) -> RoutingResult<Self> {
         let mut per_method: HashMap<String, Router<RouteHandler>> = HashMap::new();
         per_method.reserve(routes.len().max(1));
+        let mut route_metrics = Vec::with_capacity(routes.len());
         for route in routes {
             let method = normalize_method(&route.method);
+            let metrics = Arc::new(RouteMetrics::new(&method, &route.path));
+            route_metrics.push(metrics.clone());
             let entry = per_method.entry(method).or_default();
             entry
                 .insert(
                     route.path,
                     RouteHandler {
                         handler: Arc::new(route.handler),
+                        options: Arc::new(route.options),
+                        metrics,
                     },
                 )
                 .map_err(|e| CoreError::InvalidConfig(format!("route conflict: {e}")))?;
@@ -33,7 +40,15 @@ impl RouteRegistry {
             .into_iter()
             .map(|(k, v)| (k, Arc::new(v)))
             .collect();
-        Ok(Self { method_routers })
+        Ok(Self {
+            method_routers,
+            route_metrics,
+        })
+    }
+
+    /// RED series of every registered route, keyed by its path template.
+    pub fn route_metrics(&self) -> Vec<Arc<RouteMetrics>> {
+        self.route_metrics.clone()
     }
 
     pub fn lookup(&self, method: &str, path: &str) -> Option<LookupResult> {
@@ -42,12 +57,15 @@ impl RouteRegistry {
             .get(method)
             .or_else(|| self.method_routers.get(&normalize_method(method)))?;
         let found = router.at(path).ok()?;
-        let mut params = HashMap::with_capacity(found.params.len());
-        for (k, v) in found.params.iter() {
-            params.insert(k.to_string(), v.to_string());
-        }
+        let params = found
+            .params
+            .iter()
+            .map(|(k, v)| (k.to_string(), v.to_string()))
+            .collect();
         Some(LookupResult {
             handler: found.value.handler.clone(),
+            options: found.value.options.clone(),
+            metrics: found.value.metrics.clone(),
             path_params: params,
         })
     }
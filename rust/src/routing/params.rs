@@ -1,9 +1,13 @@
-use std::collections::HashMap;
 use std::sync::Arc;
 
 use pyo3::prelude::*;
 
+use crate::observability::metrics::RouteMetrics;
+use crate::routing::radix::RouteOptions;
+
 pub struct LookupResult {
     pub handler: Arc<Py<PyAny>>,
-    pub path_params: HashMap<String, String>,
+    pub options: Arc<RouteOptions>,
+    pub metrics: Arc<RouteMetrics>,
+    pub path_params: Vec<(String, String)>,
 }
@@ -2,13 +2,27 @@ use std::sync::Arc;
 
 use pyo3::prelude::*;
 
+use crate::cache::response_cache::CacheRule;
+use crate::observability::metrics::RouteMetrics;
+
+/// Per-route execution options exported from the Python route plan.
+#[derive(Clone, Debug, Default)]
+pub struct RouteOptions {
+    pub stream_body: bool,
+    pub max_body_bytes: Option<usize>,
+    pub cache: Option<CacheRule>,
+}
+
 #[derive(Clone)]
 pub struct RouteHandler {
     pub handler: Arc<Py<PyAny>>,
+    pub options: Arc<RouteOptions>,
+    pub metrics: Arc<RouteMetrics>,
 }
 
 pub struct RouteDefinition {
     pub method: String,
     pub path: String,
     pub handler: Py<PyAny>,
+    pub options: RouteOptions,
 }
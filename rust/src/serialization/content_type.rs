@@ -1,2 +1,3 @@
 pub const APPLICATION_JSON_UTF8: &str = "application/json; charset=utf-8";
 pub const TEXT_PLAIN_UTF8: &str = "text/plain; charset=utf-8";
+pub const PROMETHEUS_TEXT: &str = "text/plain; version=0.0.4; charset=utf-8";
@@ -1,37 +1,309 @@
+use std::io::Write;
+
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyString};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBool, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple, PyType};
 
 use crate::errors::core_error::CoreError;
 
+const MAX_DEPTH: usize = 512;
+
+static UUID_TYPE: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+static DATE_TYPE: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+static DECIMAL_TYPE: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+static DATACLASS_FIELDS: GILOnceCell<Py<PyAny>> = GILOnceCell::new();
+
+/// Encode a handler return value straight into JSON bytes.
+///
+/// Walks dict/list/tuple/str/int/float/bool/None natively and renders UUID,
+/// date/datetime and Decimal as strings, matching `vyro.api.jsonschema.TYPE_MAP`.
+/// Dataclass instances are encoded as objects of their fields.
 pub fn to_json_bytes(py: Python<'_>, obj: &Bound<'_, PyAny>) -> Result<Vec<u8>, CoreError> {
-    let json = py.import("json").map_err(CoreError::from)?;
-    let dumped = json
-        .call_method1("dumps", (obj,))
-        .map_err(CoreError::from)?;
+    let mut out = Vec::with_capacity(estimate_capacity(obj));
+    write_value(py, obj, &mut out, 0)?;
+    Ok(out)
+}
 
-    if let Ok(s) = dumped.downcast::<PyString>() {
-        let txt = s.to_string();
-        #[cfg(feature = "simd-json")]
-        {
-            let mut value: serde_json::Value = serde_json::from_str(&txt)
-                .map_err(|e| CoreError::ResponseBuild(format!("json parse error: {e}")))?;
-            let mut out = Vec::new();
-            simd_json::to_writer(&mut out, &mut value).map_err(|e| {
-                CoreError::ResponseBuild(format!("simd-json serialization error: {e}"))
-            })?;
-            return Ok(out);
+fn estimate_capacity(obj: &Bound<'_, PyAny>) -> usize {
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        return 2 + dict.len() * 32;
+    }
+    if let Ok(list) = obj.downcast::<PyList>() {
+        return 2 + list.len() * 16;
+    }
+    64
+}
+
+fn write_value(
+    py: Python<'_>,
+    obj: &Bound<'_, PyAny>,
+    out: &mut Vec<u8>,
+    depth: usize,
+) -> Result<(), CoreError> {
+    if depth > MAX_DEPTH {
+        return Err(CoreError::ResponseBuild(
+            "json nesting exceeds maximum depth".to_string(),
+        ));
+    }
+    if obj.is_none() {
+        out.extend_from_slice(b"null");
+        return Ok(());
+    }
+    if let Ok(text) = obj.downcast::<PyString>() {
+        return write_str(out, text.to_str().map_err(CoreError::from)?);
+    }
+    if let Ok(flag) = obj.downcast::<PyBool>() {
+        out.extend_from_slice(if flag.is_true() {
+            &b"true"[..]
+        } else {
+            &b"false"[..]
+        });
+        return Ok(());
+    }
+    if let Ok(int) = obj.downcast::<PyInt>() {
+        return write_int(int, out);
+    }
+    if let Ok(float) = obj.downcast::<PyFloat>() {
+        return write_float(float.value(), out);
+    }
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        out.push(b'{');
+        for (idx, (key, value)) in dict.iter().enumerate() {
+            if idx > 0 {
+                out.push(b',');
+            }
+            write_key(&key, out)?;
+            out.push(b':');
+            write_value(py, &value, out, depth + 1)?;
         }
-        #[cfg(not(feature = "simd-json"))]
-        {
-            return Ok(txt.into_bytes());
+        out.push(b'}');
+        return Ok(());
+    }
+    if let Ok(list) = obj.downcast::<PyList>() {
+        out.push(b'[');
+        for (idx, item) in list.iter().enumerate() {
+            if idx > 0 {
+                out.push(b',');
+            }
+            write_value(py, &item, out, depth + 1)?;
+        }
+        out.push(b']');
+        return Ok(());
+    }
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        out.push(b'[');
+        for (idx, item) in tuple.iter().enumerate() {
+            if idx > 0 {
+                out.push(b',');
+            }
+            write_value(py, &item, out, depth + 1)?;
+        }
+        out.push(b']');
+        return Ok(());
+    }
+    write_extended(py, obj, out, depth)
+}
+
+fn write_extended(
+    py: Python<'_>,
+    obj: &Bound<'_, PyAny>,
+    out: &mut Vec<u8>,
+    depth: usize,
+) -> Result<(), CoreError> {
+    let uuid_type = UUID_TYPE
+        .import(py, "uuid", "UUID")
+        .map_err(CoreError::from)?;
+    let decimal_type = DECIMAL_TYPE
+        .import(py, "decimal", "Decimal")
+        .map_err(CoreError::from)?;
+    if obj
+        .is_instance(uuid_type.as_any())
+        .map_err(CoreError::from)?
+        || obj
+            .is_instance(decimal_type.as_any())
+            .map_err(CoreError::from)?
+    {
+        let text = obj.str().map_err(CoreError::from)?;
+        return write_str(out, text.to_str().map_err(CoreError::from)?);
+    }
+
+    let date_type = DATE_TYPE
+        .import(py, "datetime", "date")
+        .map_err(CoreError::from)?;
+    if obj
+        .is_instance(date_type.as_any())
+        .map_err(CoreError::from)?
+    {
+        let iso = obj.call_method0("isoformat").map_err(CoreError::from)?;
+        let text = iso
+            .downcast::<PyString>()
+            .map_err(|e| CoreError::Py(e.into()))?;
+        return write_str(out, text.to_str().map_err(CoreError::from)?);
+    }
+
+    if !obj.is_instance_of::<PyType>()
+        && obj
+            .get_type()
+            .hasattr("__dataclass_fields__")
+            .map_err(CoreError::from)?
+    {
+        return write_dataclass(py, obj, out, depth);
+    }
+
+    let type_name = obj.get_type().name().map_err(CoreError::from)?;
+    Err(CoreError::ResponseBuild(format!(
+        "Object of type {type_name} is not JSON serializable"
+    )))
+}
+
+fn write_dataclass(
+    py: Python<'_>,
+    obj: &Bound<'_, PyAny>,
+    out: &mut Vec<u8>,
+    depth: usize,
+) -> Result<(), CoreError> {
+    let fields_fn = DATACLASS_FIELDS
+        .get_or_try_init(py, || -> PyResult<Py<PyAny>> {
+            Ok(py.import("dataclasses")?.getattr("fields")?.unbind())
+        })
+        .map_err(CoreError::from)?;
+    let fields = fields_fn.bind(py).call1((obj,)).map_err(CoreError::from)?;
+    out.push(b'{');
+    for (idx, field) in fields.try_iter().map_err(CoreError::from)?.enumerate() {
+        let field = field.map_err(CoreError::from)?;
+        let name = field.getattr("name").map_err(CoreError::from)?;
+        let name = name
+            .downcast::<PyString>()
+            .map_err(|e| CoreError::Py(e.into()))?;
+        let value = obj.getattr(name).map_err(CoreError::from)?;
+        if idx > 0 {
+            out.push(b',');
         }
+        write_str(out, name.to_str().map_err(CoreError::from)?)?;
+        out.push(b':');
+        write_value(py, &value, out, depth + 1)?;
     }
+    out.push(b'}');
+    Ok(())
+}
 
-    if let Ok(b) = dumped.downcast::<PyBytes>() {
-        return Ok(b.as_bytes().to_vec());
+fn write_key(key: &Bound<'_, PyAny>, out: &mut Vec<u8>) -> Result<(), CoreError> {
+    if let Ok(text) = key.downcast::<PyString>() {
+        return write_str(out, text.to_str().map_err(CoreError::from)?);
+    }
+    if key.is_none() {
+        out.extend_from_slice(b"\"null\"");
+        return Ok(());
+    }
+    if let Ok(flag) = key.downcast::<PyBool>() {
+        out.extend_from_slice(if flag.is_true() {
+            &b"\"true\""[..]
+        } else {
+            &b"\"false\""[..]
+        });
+        return Ok(());
     }
+    if let Ok(int) = key.downcast::<PyInt>() {
+        out.push(b'"');
+        write_int(int, out)?;
+        out.push(b'"');
+        return Ok(());
+    }
+    if let Ok(float) = key.downcast::<PyFloat>() {
+        out.push(b'"');
+        write_float(float.value(), out)?;
+        out.push(b'"');
+        return Ok(());
+    }
+    let type_name = key.get_type().name().map_err(CoreError::from)?;
+    Err(CoreError::ResponseBuild(format!(
+        "keys must be str, int, float, bool or None, not {type_name}"
+    )))
+}
 
-    Err(CoreError::ResponseBuild(
-        "json.dumps returned unsupported type".to_string(),
-    ))
+fn write_str(out: &mut Vec<u8>, value: &str) -> Result<(), CoreError> {
+    serde_json::to_writer(out, value)
+        .map_err(|e| CoreError::ResponseBuild(format!("json serialization error: {e}")))
+}
+
+fn write_int(int: &Bound<'_, PyInt>, out: &mut Vec<u8>) -> Result<(), CoreError> {
+    if let Ok(value) = int.extract::<i64>() {
+        return write!(out, "{value}").map_err(CoreError::from);
+    }
+    if let Ok(value) = int.extract::<u64>() {
+        return write!(out, "{value}").map_err(CoreError::from);
+    }
+    let digits = int.str().map_err(CoreError::from)?;
+    out.extend_from_slice(digits.to_str().map_err(CoreError::from)?.as_bytes());
+    Ok(())
+}
+
+fn write_float(value: f64, out: &mut Vec<u8>) -> Result<(), CoreError> {
+    if value.is_nan() {
+        out.extend_from_slice(b"NaN");
+        return Ok(());
+    }
+    if value.is_infinite() {
+        out.extend_from_slice(if value > 0.0 {
+            &b"Infinity"[..]
+        } else {
+            &b"-Infinity"[..]
+        });
+        return Ok(());
+    }
+    serde_json::to_writer(out, &value)
+        .map_err(|e| CoreError::ResponseBuild(format!("json serialization error: {e}")))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::to_json_bytes;
+    use pyo3::prelude::*;
+    use pyo3::types::PyDict;
+
+    fn encode(source: &std::ffi::CStr) -> String {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let locals = PyDict::new(py);
+            py.run(source, None, Some(&locals))
+                .expect("fixture code should run");
+            let value = locals
+                .get_item("value")
+                .expect("lookup should succeed")
+                .expect("fixture should define value");
+            let bytes = to_json_bytes(py, &value).expect("encoding should succeed");
+            String::from_utf8(bytes).expect("output should be utf-8")
+        })
+    }
+
+    #[test]
+    fn encodes_builtin_containers_and_scalars() {
+        let out =
+            encode(c"value = {'a': [1, 2.5, True, None], 'b': ('x', 'y\"'), 3: False, 'n': 2**70}");
+        assert_eq!(
+            out,
+            r#"{"a":[1,2.5,true,null],"b":["x","y\""],"3":false,"n":1180591620717411303424}"#
+        );
+    }
+
+    #[test]
+    fn encodes_schema_mapped_types_and_dataclasses() {
+        let out = encode(
+            c"
+import dataclasses, datetime, decimal, uuid
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    at: datetime.date
+    price: decimal.Decimal
+
+value = [Item(uuid.UUID(int=1), datetime.date(2024, 1, 2), decimal.Decimal('1.50'))]
+",
+        );
+        assert_eq!(
+            out,
+            r#"[{"id":"00000000-0000-0000-0000-000000000001","at":"2024-01-02","price":"1.50"}]"#
+        );
+    }
 }
@@ -3,6 +3,7 @@ import pytest
 from vyro import Vyro
 from vyro.errors import HandlerSignatureError
 from vyro.middleware.idempotency import IdempotencyKeyMiddleware
+from vyro.observability.metrics import MetricsRegistry
 from vyro.runtime.resilience.backpressure import BackpressureController
 from vyro.runtime.security.authorization import AuthorizationCore
 from vyro.runtime.security.api_keys import APIKeyManager
@@ -67,6 +68,17 @@ def test_sync_handler_is_rejected() -> None:
             return {"ok": True}
 
 
+def test_stream_body_route_accepts_query_bound_collections() -> None:
+    app = Vyro()
+
+    # Parameters bind from path, query and headers only, so collection types stay valid.
+    @app.post("/upload/:id", stream_body=True)
+    async def upload_chunks(ctx, id: int, tags: list[str] | None = None):  # type: ignore[no-untyped-def]
+        return {"id": id}
+
+    assert app._router.records()[0].options.stream_body  # noqa: SLF001
+
+
 def test_app_symbol_is_removed() -> None:
     with pytest.raises(ImportError):
         from vyro import App  # type: ignore[attr-defined]  # noqa: F401
@@ -211,6 +223,16 @@ def test_vyro_accepts_custom_http_client() -> None:
     assert app._http_client is client  # noqa: SLF001
 
 
+def test_vyro_outbound_pipeline_uses_configured_components() -> None:
+    app = Vyro()
+    bulkhead = OutboundBulkhead(default_limit=4)
+    app.set_outbound_bulkhead(bulkhead)
+    pipeline = app.outbound_pipeline(hedge_after_sec=0.05)
+    assert pipeline.client is app._http_client  # noqa: SLF001
+    assert pipeline.bulkhead is bulkhead
+    assert pipeline.hedge_after_sec == 0.05
+
+
 def test_vyro_accepts_custom_etag_manager() -> None:
     app = Vyro()
     manager = ETagManager()
@@ -388,6 +410,32 @@ def test_vyro_accepts_custom_cors_profile() -> None:
     assert app._cors.name == "permissive"  # noqa: SLF001
 
 
+def test_vyro_exports_selected_native_guards() -> None:
+    app = Vyro()
+    assert app._native_guards is None  # noqa: SLF001
+    app.set_backpressure(BackpressureController(max_inflight=8))
+    app.enable_native_guards(rate_limit_key="client_ip", backpressure=True)
+    guards = app._native_guards  # noqa: SLF001
+    assert guards is not None
+    assert set(guards) == {"rate_limit", "backpressure"}
+    assert guards["backpressure"] == {"max_inflight": 8}
+
+
+def test_vyro_exports_native_metrics_spec() -> None:
+    app = Vyro()
+    assert app._native_metrics is None  # noqa: SLF001
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs").inc()
+    app.enable_native_metrics(path="/internal/metrics", registry=registry, python_refresh_sec=1)
+    spec = app._native_metrics  # noqa: SLF001
+    assert spec is not None
+    assert spec["path"] == "/internal/metrics"
+    assert spec["python_refresh_sec"] == 1.0
+    assert "jobs_total 1" in spec["render"]()
+    with pytest.raises(ValueError):
+        app.enable_native_metrics(path="metrics")
+
+
 def test_vyro_accepts_custom_csrf_protector() -> None:
     app = Vyro()
     protector = CSRFProtector(secret=b"test-secret")
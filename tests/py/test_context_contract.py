@@ -1,3 +1,7 @@
+import asyncio
+
+import pytest
+
 from vyro.http.context import Context
 
 
@@ -96,3 +100,144 @@ def test_context_uses_incoming_traceparent() -> None:
         }
     )
     assert ctx.traceparent == value
+
+
+def test_context_generated_ids_are_w3c_trace_context() -> None:
+    ctx = Context.from_native({"headers": {}, "query": {}, "path_params": {}, "body": b""})
+    version, trace_id, span_id, flags = ctx.traceparent.split("-")
+    assert (version, flags) == ("00", "01")
+    assert len(trace_id) == 32 and int(trace_id, 16) != 0
+    assert len(span_id) == 16 and int(span_id, 16) != 0
+    assert ctx.correlation_id == trace_id
+
+
+def test_context_seeds_trace_id_from_uuid_correlation_id() -> None:
+    correlation_id = "4BF92F35-77B3-4DA6-A3CE-929D0E0E4736"
+    ctx = Context.from_native(
+        {
+            "headers": {"x-correlation-id": correlation_id},
+            "query": {},
+            "path_params": {},
+            "body": b"",
+        }
+    )
+    assert ctx.correlation_id == correlation_id
+    assert ctx.traceparent.split("-")[1] == "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_context_replaces_non_hex_correlation_id_in_traceparent() -> None:
+    ctx = Context.from_native(
+        {"headers": {"x-correlation-id": "abc-123"}, "query": {}, "path_params": {}, "body": b""}
+    )
+    trace_id = ctx.traceparent.split("-")[1]
+    assert len(trace_id) == 32 and int(trace_id, 16) != 0
+
+
+def test_context_header_lookup_is_case_insensitive() -> None:
+    ctx = Context.from_native(
+        {
+            "headers": {"X-Tenant": "acme"},
+            "query": {},
+            "path_params": {},
+            "body": b"",
+        }
+    )
+    assert ctx.header("x-tenant") == "acme"
+    assert ctx.header("X-TENANT") == "acme"
+    assert ctx.header("missing", "fallback") == "fallback"
+    assert ctx.header("x-correlation-id") == ctx.correlation_id
+
+
+def test_context_wraps_native_request_lazily() -> None:
+    class _NativeRequest:
+        def __init__(self) -> None:
+            self.header_calls: list[str] = []
+
+        def header(self, name):  # type: ignore[no-untyped-def]
+            self.header_calls.append(name)
+            return {"x-tenant": "acme"}.get(name)
+
+        @property
+        def headers(self):  # type: ignore[no-untyped-def]
+            raise AssertionError("full header mapping should not be built")
+
+        query = {"q": "ok"}
+        path_params = {"id": "7"}
+        body = b"{}"
+        body_stream = None
+
+    native = _NativeRequest()
+    ctx = Context.from_native(native)
+    assert ctx.header("X-Tenant") == "acme"
+    assert ctx.query["q"] == "ok"
+    assert ctx.path_params["id"] == "7"
+    assert ctx.json() == {}
+    assert native.header_calls == ["x-tenant"]
+
+
+def test_context_stream_yields_buffered_body_for_regular_routes() -> None:
+    ctx = Context.from_native(
+        {
+            "headers": {},
+            "query": {},
+            "path_params": {},
+            "body": b"payload",
+        }
+    )
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in ctx.stream()]
+
+    assert asyncio.run(collect()) == [b"payload"]
+
+
+def test_context_body_bytes_rejects_streamed_requests() -> None:
+    async def chunks():  # type: ignore[no-untyped-def]
+        yield b"a"
+        yield b"b"
+
+    ctx = Context.from_native(
+        {
+            "headers": {},
+            "query": {},
+            "path_params": {},
+            "body": b"",
+            "body_stream": chunks(),
+        }
+    )
+    with pytest.raises(RuntimeError, match="streamed"):
+        ctx.body_bytes()
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in ctx.stream()]
+
+    assert asyncio.run(collect()) == [b"a", b"b"]
+
+
+def test_context_uses_request_trace_ids_without_copying_headers() -> None:
+    class _NativeRequest:
+        def __init__(self) -> None:
+            self.headers = {
+                "x-correlation-id": "c1",
+                "traceparent": "00-" + "a" * 32 + "-" + "b" * 16 + "-01",
+            }
+
+        @property
+        def trace_ids(self):  # type: ignore[no-untyped-def]
+            return self.headers["x-correlation-id"], self.headers["traceparent"]
+
+        def header(self, name):  # type: ignore[no-untyped-def]
+            raise AssertionError("ids should come from trace_ids")
+
+        query: dict[str, str] = {}
+        path_params: dict[str, str] = {}
+        body = b""
+        body_stream = None
+
+    native = _NativeRequest()
+    ctx = Context.from_native(native)
+    assert ctx.correlation_id == "c1"
+    assert ctx.header("traceparent") == native.headers["traceparent"]
+    assert ctx.headers["x-correlation-id"] == "c1"
+    native.headers["x-added"] = "1"
+    assert ctx.headers["x-added"] == "1"
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+import vyro.http.response as response_module
+
+
+def test_native_response_descriptors_resolve_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = types.ModuleType("vyro._native")
+    fake.Response = object()  # type: ignore[attr-defined]
+    fake.HeaderSet = object()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "vyro._native", fake)
+
+    assert response_module.Response is fake.Response
+    assert response_module.HeaderSet is fake.HeaderSet
+    with pytest.raises(AttributeError):
+        response_module.DoesNotExist  # noqa: B018
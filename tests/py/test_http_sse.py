@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from vyro.http.sse import SSEEvent, SSEResponse
 
 
@@ -33,3 +37,33 @@ def test_sse_response_builds_event_stream_payload_and_headers() -> None:
     assert status == 200
     assert isinstance(payload, bytes)
     assert headers["content-type"].startswith("text/event-stream")
+
+
+def test_sse_response_streams_events_from_async_source() -> None:
+    async def ticks():  # type: ignore[no-untyped-def]
+        yield "one"
+        yield SSEEvent(data="two", event="tick")
+
+    stream = SSEResponse(source=ticks())
+    stream.send("ready")
+
+    payload, status, headers = stream.as_tuple()
+    assert status == 200
+    assert headers["content-type"].startswith("text/event-stream")
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in payload]
+
+    assert asyncio.run(collect()) == [
+        b"data: ready\n\n",
+        b"data: one\n\n",
+        b"event: tick\ndata: two\n\n",
+    ]
+    with pytest.raises(RuntimeError, match="streaming"):
+        stream.body_bytes()
+
+
+def test_sse_response_keeps_positional_status_and_headers() -> None:
+    stream = SSEResponse([SSEEvent(data="hi")], 201, {"content-type": "text/event-stream"})
+    payload, status, headers = stream.as_tuple()
+    assert (payload, status, headers) == (b"data: hi\n\n", 201, {"content-type": "text/event-stream"})
@@ -13,6 +13,11 @@ class _SampleMiddleware:
         return response
 
 
+class _TenantMiddleware(Middleware):
+    def __init__(self, tenant: int) -> None:
+        self.tenant = tenant
+
+
 def test_middleware_chain_constructs() -> None:
     chain = MiddlewareChain([_SampleMiddleware()])
     assert chain is not None
@@ -112,3 +117,78 @@ def test_middleware_registry_filters_by_route_group() -> None:
     assert api_items == [global_mw, api_mw]
     assert admin_items == [global_mw, admin_mw]
     assert other_items == [global_mw]
+
+
+def test_middleware_registry_trie_matches_prefix_scan_and_invalidates_on_add() -> None:
+    reg = MiddlewareRegistry()
+    tenants = [_TenantMiddleware(idx) for idx in range(60)]
+    for idx, mw in enumerate(tenants):
+        reg.add(mw, priority=100 - idx, group=f"/t{idx}")
+    first = _TenantMiddleware(-1)
+    reg.add(first, priority=1)
+
+    selected = reg.ordered_for_path("/t12/orders")
+    assert selected == (first, tenants[12])
+    assert reg.ordered_for_path("/t12/orders") is selected
+    assert reg.items_for_path("/t1") == [first, tenants[1]]
+    assert reg.items_for_path("/t1/orders") == [first, tenants[1]]
+    assert reg.items_for_path("/other") == [first]
+
+    late = _TenantMiddleware(99)
+    reg.add(late, priority=0, group="/t1")
+    assert reg.ordered_for_path("/t12/orders") == (first, tenants[12])
+    assert reg.ordered_for_path("/t1/orders") == (late, first, tenants[1])
+
+
+def test_middleware_registry_groups_match_whole_segments() -> None:
+    reg = MiddlewareRegistry()
+    root_mw = _TenantMiddleware(0)
+    t1_mw = _TenantMiddleware(1)
+    reg.add(root_mw, group="/")
+    reg.add(t1_mw, group="/t1/")
+
+    assert reg.items_for_path("/t12/orders") == [root_mw]
+    assert reg.items_for_path("/t1") == [root_mw, t1_mw]
+    assert reg.items_for_path("/t1/") == [root_mw, t1_mw]
+
+
+def test_router_compile_bakes_group_middleware_into_dispatch() -> None:
+    from vyro.routing.registry import RouterRegistry
+
+    calls: list[str] = []
+
+    class _Audit(Middleware):
+        async def before_request(self, ctx):  # type: ignore[no-untyped-def]
+            calls.append(f"before:{ctx.path_params.get('id')}")
+
+        async def after_response(self, ctx, response):  # type: ignore[no-untyped-def]
+            calls.append("after")
+            return {**response, "audited": True}
+
+    router = RouterRegistry()
+
+    @router.add_route("GET", "/admin/:id")
+    async def admin(ctx, id: int):  # type: ignore[no-untyped-def]
+        return {"id": id}
+
+    @router.add_route("GET", "/public")
+    async def public(ctx):  # type: ignore[no-untyped-def]
+        return {"ok": True}
+
+    middlewares = MiddlewareRegistry()
+    middlewares.add(_Audit(), group="/admin")
+
+    plan = {path: dispatch for _, path, dispatch, _ in router.compile(middlewares)}
+    records = {record.normalized_path: record for record in router.records()}
+    assert plan["/public"] is records["/public"].dispatch
+    assert plan["/admin/{id}"] is not records["/admin/{id}"].dispatch
+
+    payload = {"headers": {}, "query": {}, "path_params": {"id": "7"}}
+    result = asyncio.run(plan["/admin/{id}"](payload))
+    assert result == {"id": 7, "audited": True}
+    assert calls == ["before:7", "after"]
+
+    assert router.compile(middlewares) == router.compile(middlewares)
+    middlewares.add(_Audit())
+    recompiled = {path: dispatch for _, path, dispatch, _ in router.compile(middlewares)}
+    assert recompiled["/public"] is not records["/public"].dispatch
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from vyro.observability.latency import LatencyTracker
+from vyro.observability.latency import LatencySnapshot, LatencyTracker, RouteLatencyTracker
 
 
 def test_latency_tracker_quantiles() -> None:
@@ -25,4 +25,72 @@ def test_latency_prometheus_render() -> None:
     tracker.observe(25.0)
     rendered = tracker.render_prometheus()
     assert "# HELP vyro_request_latency_ms" in rendered
-    assert 'vyro_request_latency_ms{quantile="0.95"}' in rendered
+    assert "# TYPE vyro_request_latency_ms histogram" in rendered
+    assert 'vyro_request_latency_ms_bucket{le="10"} 0' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="25"} 2' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="+Inf"} 2' in rendered
+    assert "vyro_request_latency_ms_sum 37.5" in rendered
+    assert "vyro_request_latency_ms_count 2" in rendered
+
+
+def test_latency_prometheus_bucket_bounds_are_inclusive() -> None:
+    tracker = LatencyTracker()
+    for value in (2.5, 10.0, 1000.0):
+        tracker.observe(value)
+    rendered = tracker.render_prometheus()
+    assert 'vyro_request_latency_ms_bucket{le="1"} 0' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="2.5"} 1' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="10"} 2' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="500"} 2' in rendered
+    assert 'vyro_request_latency_ms_bucket{le="1000"} 3' in rendered
+
+
+def test_latency_prometheus_sum_keeps_full_precision() -> None:
+    tracker = LatencyTracker()
+    tracker.merge(LatencySnapshot(counts=((12345, 100_000),), count=100_000, sum_ms=1234567.25))
+    rendered = tracker.render_prometheus()
+    assert "vyro_request_latency_ms_sum 1234567.25\n" in rendered
+    assert "vyro_request_latency_ms_count 100000\n" in rendered
+
+
+def test_latency_tracker_memory_is_bounded_by_buckets() -> None:
+    tracker = LatencyTracker()
+    for _ in range(50):
+        for value in range(1, 2001):
+            tracker.observe(value * 0.5)
+    assert tracker.count == 100_000
+    assert len(tracker._counts) < 4_000  # noqa: SLF001
+    assert abs(tracker.quantile(0.99) - 990.0) / 990.0 < 0.002
+    assert tracker.quantile(0.0) == 0.5
+    assert tracker.quantile(1.0) == 1000.0
+
+
+def test_latency_snapshots_merge_across_workers() -> None:
+    first = LatencyTracker()
+    second = LatencyTracker()
+    for value in range(1, 51):
+        first.observe(float(value))
+    for value in range(51, 101):
+        second.observe(float(value))
+
+    shipped = LatencySnapshot.from_dict(second.snapshot().to_dict())
+    merged = first.snapshot().merge(shipped)
+    assert merged.count == 100
+    assert merged.sum_ms == 5050.0
+    assert abs(merged.quantile(0.5) - 51.0) < 0.1
+
+    first.merge(shipped)
+    assert first.snapshot() == merged
+
+
+def test_route_latency_tracker_renders_labelled_histograms() -> None:
+    routes = RouteLatencyTracker()
+    routes.observe("get", "/users", 4.0)
+    routes.observe("GET", "/users", 40.0)
+    routes.observe("POST", "/orders", 120.0)
+    assert routes.tracker("GET", "/users").count == 2
+
+    rendered = routes.render_prometheus()
+    assert "# TYPE vyro_route_latency_ms histogram" in rendered
+    assert 'vyro_route_latency_ms_bucket{method="GET",route="/users",le="5"} 1' in rendered
+    assert 'vyro_route_latency_ms_count{method="POST",route="/orders"} 1' in rendered
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import io
 import json
 import os
+import threading
 
-from vyro.observability.logging import SamplingPolicy, make_log_record, should_emit
+import pytest
+
+from vyro.observability.logging import (
+    LogPipeline,
+    SamplingPolicy,
+    configure_log_pipeline,
+    emit_log,
+    make_log_record,
+    shutdown_log_pipeline,
+    should_emit,
+)
 
 
 def test_make_log_record_contains_core_fields() -> None:
@@ -56,3 +68,96 @@ def test_log_record_redacts_configured_keys() -> None:
     assert record["session_id"] == "***REDACTED***"
     assert record["private_note"] == "***REDACTED***"
     assert record["other"] == "ok"
+
+
+def test_log_pipeline_batches_lines_off_thread() -> None:
+    out = io.StringIO()
+    pipeline = LogPipeline(stream=out, redact_keys=["session_id"])
+    try:
+        for index in range(100):
+            assert pipeline.emit("info", "tick", index=index, session_id="s1")
+        assert pipeline.flush()
+    finally:
+        pipeline.close()
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 100
+    first = json.loads(lines[0])
+    assert first["index"] == 0
+    assert first["session_id"] == "***REDACTED***"
+    assert pipeline.written == 100
+    assert pipeline.batches < 100
+
+
+def test_log_pipeline_drops_when_full_and_counts_by_level() -> None:
+    release = threading.Event()
+
+    class SlowStream(io.StringIO):
+        def write(self, text: str) -> int:
+            release.wait(5)
+            return super().write(text)
+
+    out = SlowStream()
+    pipeline = LogPipeline(stream=out, capacity=2, batch_max_lines=1)
+    try:
+        results = [pipeline.emit("error", "burst", n=n) for n in range(10)]
+        assert results.count(False) >= 6
+        assert pipeline.dropped == results.count(False)
+        assert pipeline.dropped_by_level == {"ERROR": pipeline.dropped}
+    finally:
+        release.set()
+        pipeline.close()
+    assert len(out.getvalue().splitlines()) == results.count(True)
+
+
+def test_log_pipeline_block_policy_waits_for_space() -> None:
+    out = io.StringIO()
+    pipeline = LogPipeline(stream=out, capacity=1, batch_max_lines=1, overflow="block")
+    try:
+        assert all(pipeline.emit("info", "steady", n=n) for n in range(20))
+        assert pipeline.flush()
+    finally:
+        pipeline.close()
+    assert pipeline.dropped == 0
+    assert len(out.getvalue().splitlines()) == 20
+
+
+def test_emit_log_routes_through_configured_pipeline() -> None:
+    out = io.StringIO()
+    err = io.StringIO()
+    pipeline = configure_log_pipeline(LogPipeline(stream=out, err_stream=err))
+    try:
+        emit_log("INFO", "hello", service="vyro")
+        emit_log("ERROR", "boom", err=True)
+        assert pipeline.flush()
+    finally:
+        shutdown_log_pipeline()
+    assert json.loads(out.getvalue())["service"] == "vyro"
+    assert json.loads(err.getvalue())["message"] == "boom"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_log_pipeline_keeps_writing_in_forked_child() -> None:
+    read_fd, write_fd = os.pipe()
+    pipeline = LogPipeline(stream=io.StringIO())
+    try:
+        assert pipeline.emit("info", "parent")
+        assert pipeline.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                with os.fdopen(write_fd, "w") as child_out:
+                    pipeline.stream = child_out
+                    for n in range(3):
+                        pipeline.emit("info", "child", n=n)
+                    code = 0 if pipeline.flush(timeout_sec=1) and pipeline.pending == 0 else 2
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as parent_in:
+            lines = parent_in.read().splitlines()
+        _, status = os.waitpid(pid, 0)
+    finally:
+        pipeline.close()
+    assert os.WEXITSTATUS(status) == 0
+    assert [json.loads(line)["n"] for line in lines] == [0, 1, 2]
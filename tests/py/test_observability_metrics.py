@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from vyro.observability.metrics import MetricsRegistry, ThroughputTracker, create_default_registry
+import pytest
+
+from vyro.observability.metrics import (
+    OVERFLOW_LABEL_VALUE,
+    MetricsRegistry,
+    ThroughputTracker,
+    create_default_registry,
+)
 
 
 def test_metrics_counter_increment_and_render() -> None:
@@ -26,6 +33,88 @@ def test_metrics_render_includes_labels() -> None:
     assert 'vyro_requests_by_status_total{method="GET",status="200"} 1' in rendered
 
 
+def test_counter_keeps_one_series_per_label_set() -> None:
+    registry = MetricsRegistry()
+    registry.counter("vyro_tenant_requests_total", "Per tenant", labels={"tenant": "a"}).inc()
+    registry.counter("vyro_tenant_requests_total", "Per tenant", labels={"tenant": "b"}).inc(4)
+    registry.counter("vyro_tenant_requests_total", "Per tenant", labels={"tenant": "a"}).inc()
+    rendered = registry.render_prometheus()
+    assert rendered.count("# TYPE vyro_tenant_requests_total counter") == 1
+    assert 'vyro_tenant_requests_total{tenant="a"} 2' in rendered
+    assert 'vyro_tenant_requests_total{tenant="b"} 4' in rendered
+
+
+def test_family_returns_cached_child_handles() -> None:
+    registry = MetricsRegistry()
+    family = registry.counter_family("vyro_route_hits_total", "Hits", ("method", "route"))
+    handle = family.labels("GET", "/users")
+    assert family.labels(method="GET", route="/users") is handle
+    handle.inc()
+    handle.inc()
+    assert 'vyro_route_hits_total{method="GET",route="/users"} 2' in registry.render_prometheus()
+    with pytest.raises(ValueError):
+        family.labels("GET")
+    with pytest.raises(ValueError):
+        registry.gauge_family("vyro_route_hits_total", "Hits", ("method", "route"))
+
+
+def test_gauge_and_histogram_families_render() -> None:
+    registry = MetricsRegistry()
+    queue = registry.gauge_family("vyro_queue_depth", "Queue depth", ("queue",)).labels("jobs")
+    queue.set(5)
+    queue.dec(2)
+    latency = registry.histogram_family(
+        "vyro_db_seconds", "DB latency", ("pool",), buckets=(0.01, 0.1, 1.0)
+    ).labels(pool="main")
+    for value in (0.005, 0.01, 0.5, 3.0):
+        latency.observe(value)
+    rendered = registry.render_prometheus()
+    assert "# TYPE vyro_queue_depth gauge" in rendered
+    assert 'vyro_queue_depth{queue="jobs"} 3' in rendered
+    assert "# TYPE vyro_db_seconds histogram" in rendered
+    assert 'vyro_db_seconds_bucket{pool="main",le="0.01"} 2' in rendered
+    assert 'vyro_db_seconds_bucket{pool="main",le="1"} 3' in rendered
+    assert 'vyro_db_seconds_bucket{pool="main",le="+Inf"} 4' in rendered
+    assert 'vyro_db_seconds_count{pool="main"} 4' in rendered
+
+
+def test_gauge_and_histogram_values_keep_full_precision() -> None:
+    registry = MetricsRegistry()
+    registry.gauge("vyro_heap_bytes", "Heap bytes").set(3221225472)
+    registry.gauge("vyro_ratio", "Ratio").set(0.1234567891)
+    registry.gauge("vyro_nan", "NaN").set(float("nan"))
+    timing = registry.histogram("vyro_job_ms", "Job time", buckets=(1000.0, 2500000.0))
+    timing.observe(1234567)
+    timing.observe(0.25)
+    rendered = registry.render_prometheus()
+    assert "vyro_heap_bytes 3221225472\n" in rendered
+    assert "vyro_ratio 0.1234567891\n" in rendered
+    assert "vyro_nan NaN\n" in rendered
+    assert 'vyro_job_ms_bucket{le="2500000"} 2' in rendered
+    assert "vyro_job_ms_sum 1234567.25\n" in rendered
+
+
+def test_family_cardinality_limit_routes_to_overflow_series() -> None:
+    registry = MetricsRegistry()
+    family = registry.counter_family("vyro_tenant_total", "Tenants", ("tenant",), max_series=2)
+    family.labels("a").inc()
+    family.labels("b").inc()
+    family.labels("c").inc()
+    family.labels("d").inc()
+    assert len(family) == 2
+    assert family.overflowed
+    rendered = "".join(registry.iter_prometheus())
+    assert f'vyro_tenant_total{{tenant="{OVERFLOW_LABEL_VALUE}"}} 2' in rendered
+    family.remove("a")
+    assert 'tenant="a"' not in registry.render_prometheus()
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("vyro_paths_total", "Paths", labels={"path": 'a"b\\c'}).inc()
+    assert 'vyro_paths_total{path="a\\"b\\\\c"} 1' in registry.render_prometheus()
+
+
 def test_default_registry_has_core_metric() -> None:
     registry = create_default_registry()
     rendered = registry.render_prometheus()
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
 
-from vyro.observability.tracing import export_span, start_span
+import pytest
+
+from vyro.observability.tracing import BatchSpanExporter, FileSpanSink, Tracer, export_span, start_span
 
 
 def test_start_span_parses_traceparent() -> None:
@@ -22,3 +30,145 @@ def test_export_span_returns_json_payload() -> None:
     assert payload["name"] == "db.query"
     assert payload["status"] == "ok"
     assert payload["attributes"]["table"] == "users"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now_ns = 1_000_000_000
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance_ms(self, ms: float) -> None:
+        self.now_ns += int(ms * 1_000_000)
+
+
+class _ListSink:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def write(self, lines: list[str]) -> None:
+        self.lines.extend(lines)
+
+    def close(self) -> None:
+        return None
+
+
+def _tracer(sink: _ListSink, clock: _Clock, **options: object) -> Tracer:
+    exporter = BatchSpanExporter(sink=sink, flush_interval_sec=0.01)
+    return Tracer(exporter=exporter, _clock_ns=clock, **options)  # type: ignore[arg-type]
+
+
+def test_tracer_follows_traceparent_sampled_flag() -> None:
+    sink, clock = _ListSink(), _Clock()
+    tracer = _tracer(sink, clock, keep_errors=False)
+    kept = tracer.start_span("in", traceparent="00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+    skipped = tracer.start_span("in", traceparent="00-5bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00")
+    child = tracer.start_span("db", parent=kept)
+    assert kept.traceparent.endswith("-01")
+    assert skipped.traceparent.endswith("-00")
+    for span in (child, kept, skipped):
+        span.finish()
+    assert tracer.exporter.flush()
+    names = [json.loads(line)["name"] for line in sink.lines]
+    assert names == ["db", "in"]
+    assert tracer.sampled_out == 1
+
+
+def test_tracer_tail_keeps_error_and_slow_traces() -> None:
+    sink, clock = _ListSink(), _Clock()
+    tracer = _tracer(sink, clock, sample_rate=0.0, slow_threshold_ms=100.0)
+
+    fast = tracer.start_span("fast")
+    fast.finish()
+
+    failing = tracer.start_span("failing")
+    with pytest.raises(RuntimeError):
+        with tracer.start_span("step", parent=failing):
+            raise RuntimeError("boom")
+    failing.finish()
+
+    slow = tracer.start_span("slow")
+    clock.advance_ms(250)
+    slow.finish()
+
+    assert tracer.exporter.flush()
+    payloads = [json.loads(line) for line in sink.lines]
+    assert [p["name"] for p in payloads] == ["step", "failing", "slow"]
+    assert payloads[0]["status"] == "error"
+    assert payloads[2]["duration_ms"] == 250.0
+    assert tracer.tail_kept == 2
+    assert tracer.sampled_out == 1
+
+
+def test_tracer_enforces_span_budget_per_second() -> None:
+    sink, clock = _ListSink(), _Clock()
+    tracer = _tracer(sink, clock, max_spans_per_sec=3)
+    for _ in range(5):
+        tracer.start_span("burst").finish()
+    clock.advance_ms(1000)
+    tracer.start_span("later").finish()
+    assert tracer.exporter.flush()
+    assert len(sink.lines) == 4
+    assert tracer.budget_dropped == 2
+
+
+def test_tracer_is_consistent_under_concurrent_spans() -> None:
+    sink = _ListSink()
+    tracer = Tracer(
+        exporter=BatchSpanExporter(sink=sink, flush_interval_sec=0.01),
+        sample_rate=0.0,
+        slow_threshold_ms=0.0,
+        max_pending_traces=4,
+        max_spans_per_sec=1000,
+    )
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            for _ in range(500):
+                root = tracer.start_span("root")
+                tracer.start_span("child", parent=root).finish()
+                root.finish()
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    assert tracer.exporter.flush()
+    assert errors == []
+    assert tracer.tail_kept + tracer.sampled_out == 8 * 500
+    exported = len(sink.lines) + tracer.exporter.dropped
+    assert exported <= 1000 * (1 + elapsed) + 1
+
+
+def test_batch_exporter_writes_file_sink(tmp_path: Path) -> None:
+    target = tmp_path / "spans.ndjson"
+    exporter = BatchSpanExporter(sink=FileSpanSink(str(target)), batch_size=2)
+    for index in range(5):
+        span = start_span(f"op-{index}")
+        span.finish()
+        assert exporter.export(span)
+    exporter.shutdown()
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [f"op-{i}" for i in range(5)]
+    assert exporter.exported == 5
+
+
+def test_batch_exporter_drains_queued_spans_at_exit(tmp_path: Path) -> None:
+    target = tmp_path / "spans.ndjson"
+    script = (
+        "from vyro.observability.tracing import BatchSpanExporter, FileSpanSink, start_span\n"
+        f"exporter = BatchSpanExporter(sink=FileSpanSink({str(target)!r}), flush_interval_sec=60)\n"
+        "span = start_span('late')\n"
+        "span.finish()\n"
+        "assert exporter.export(span)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=30)
+    assert [json.loads(line)["name"] for line in target.read_text(encoding="utf-8").splitlines()] == ["late"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from vyro.routing.aot import compile_routes
-from vyro.typing import RouteRecord
+from vyro.typing import RouteOptions, RouteRecord
 
 
 async def _dispatch_a(native_ctx: dict) -> object:
@@ -59,3 +59,32 @@ def test_compile_routes_rejects_duplicates() -> None:
 
     with pytest.raises(ValueError, match="Duplicate route declaration detected"):
         compile_routes(routes)
+
+
+def test_compile_routes_exports_body_options() -> None:
+    routes = [
+        RouteRecord(
+            method="POST",
+            original_path="/upload",
+            normalized_path="/upload",
+            dispatch=_dispatch_a,
+            handler=_dispatch_a,
+            options=RouteOptions(stream_body=True, max_body_bytes=1024),
+        ),
+        RouteRecord(
+            method="GET",
+            original_path="/ping",
+            normalized_path="/ping",
+            dispatch=_dispatch_b,
+            handler=_dispatch_b,
+        ),
+    ]
+
+    compiled = compile_routes(routes)
+    assert compiled[0][3] == {}
+    assert compiled[1][3] == {"stream_body": True, "max_body_bytes": 1024}
+
+
+def test_route_options_reject_negative_body_limit() -> None:
+    with pytest.raises(ValueError, match="max_body_bytes"):
+        RouteOptions(max_body_bytes=-1)
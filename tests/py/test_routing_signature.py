@@ -7,7 +7,8 @@ from uuid import UUID
 import pytest
 
 from vyro.errors import HandlerSignatureError
-from vyro.routing.signature import bind_request_kwargs
+from vyro.http.context import Context
+from vyro.routing.signature import bind_request_kwargs, compile_binder
 
 
 def test_bind_request_kwargs_with_path_cast() -> None:
@@ -74,3 +75,39 @@ def test_bind_request_kwargs_advanced_scalar_coercion() -> None:
     assert isinstance(kwargs["due"], date)
     assert isinstance(kwargs["price"], Decimal)
     assert kwargs["retries"] == 3
+
+
+def test_compile_binder_resolves_sources_and_converters_once() -> None:
+    def handler(  # type: ignore[no-untyped-def]
+        ctx, id: int, limit: Optional[int], x_tenant: str, page: int = 1
+    ):
+        return id, limit, x_tenant, page
+
+    params = list(inspect.signature(handler).parameters.values())
+    binder = compile_binder("handler", params, "/items/{id}")
+    assert binder.entries == (
+        ("id", True, "id", int, True),
+        ("limit", False, "limit", int, True),
+        ("x_tenant", False, "x-tenant", None, True),
+        ("page", False, "page", int, False),
+    )
+
+    ctx = Context.from_native(
+        {
+            "headers": {"X-Tenant": "acme"},
+            "query": {"limit": "5"},
+            "path_params": {"id": "7"},
+        }
+    )
+    assert binder.bind(ctx) == {"id": 7, "limit": 5, "x_tenant": "acme"}
+
+
+def test_compile_binder_reports_missing_parameter() -> None:
+    def handler(ctx, id: int):  # type: ignore[no-untyped-def]
+        return id
+
+    params = list(inspect.signature(handler).parameters.values())
+    binder = compile_binder("handler", params, "/items")
+    ctx = Context.from_native({"headers": {}, "query": {}, "path_params": {}})
+    with pytest.raises(HandlerSignatureError, match="Missing request parameter 'id'"):
+        binder.bind(ctx)
@@ -19,3 +19,7 @@ def test_backpressure_reject_when_limit_reached() -> None:
     assert controller.should_reject() is False
     assert controller.acquire() is True
     assert controller.should_reject() is True
+
+
+def test_backpressure_exports_native_spec() -> None:
+    assert BackpressureController(max_inflight=64).as_native() == {"max_inflight": 64}
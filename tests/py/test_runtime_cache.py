@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import time
 
-from vyro.runtime.platform.cache import MemoryCacheBackend, RedisCacheBackend
+from vyro.app.container import build_default_components
+from vyro.runtime.platform.cache import (
+    AsyncCacheAdapter,
+    BoundedMemoryCacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
 
 
 class FakeRedis:
@@ -42,3 +49,95 @@ def test_redis_cache_backend_uses_prefix_and_operations() -> None:
     assert cache.get("k") == "v"
     cache.delete("k")
     assert "app:k" not in redis.store
+
+
+def test_bounded_memory_cache_evicts_to_entry_budget_and_counts_stats() -> None:
+    cache = BoundedMemoryCacheBackend(max_entries=4, shards=1, admission="lru")
+    for idx in range(10):
+        cache.set(f"k{idx}", idx)
+    assert len(cache) == 4
+    assert cache.get("k9") == 9
+    assert cache.get("k0") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 1, 6, 4)
+    assert stats.hit_ratio == 0.5
+
+
+def test_bounded_memory_cache_tinylfu_keeps_hot_keys_over_one_hit_scans() -> None:
+    cache = BoundedMemoryCacheBackend(max_entries=8, shards=1)
+    for idx in range(8):
+        cache.set(f"hot{idx}", idx)
+    for _ in range(10):
+        for idx in range(8):
+            assert cache.get(f"hot{idx}") == idx
+    for idx in range(100):
+        cache.set(f"scan{idx}", idx)
+    assert all(cache.get(f"hot{idx}") == idx for idx in range(8))
+    assert cache.stats().rejections == 100
+
+
+def test_bounded_memory_cache_respects_byte_budget() -> None:
+    cache = BoundedMemoryCacheBackend(max_bytes=100, shards=1, admission="lru", sizer=lambda _k, v: len(v))
+    cache.set("a", b"x" * 60)
+    cache.set("b", b"y" * 60)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"y" * 60
+    cache.set("huge", b"z" * 101)
+    assert cache.get("huge") is None
+    assert cache.stats().bytes == 60
+
+
+def test_bounded_memory_cache_sweeps_expired_entries() -> None:
+    now = [0.0]
+    cache = BoundedMemoryCacheBackend(shards=2, _clock=lambda: now[0])
+    cache.set("short", 1, ttl_sec=1.0)
+    cache.set("long", 2, ttl_sec=10.0)
+    cache.set("forever", 3)
+    now[0] = 5.0
+    assert cache.sweep_expired() == 1
+    assert len(cache) == 2
+    assert cache.get("long") == 2
+    now[0] = 11.0
+    assert cache.get("long") is None
+    assert cache.stats().expirations == 2
+
+
+def test_bounded_memory_cache_background_sweeper_stops_cleanly() -> None:
+    cache = BoundedMemoryCacheBackend()
+    cache.set("k", "v", ttl_sec=0.01)
+    cache.start_sweeper(interval_sec=0.01)
+    time.sleep(0.05)
+    cache.stop_sweeper()
+    assert len(cache) == 0
+
+
+def test_async_cache_adapter_exposes_batch_operations() -> None:
+    adapter = AsyncCacheAdapter(BoundedMemoryCacheBackend())
+
+    async def scenario() -> list[object]:
+        await adapter.amset({"a": 1, "b": 2})
+        await adapter.adelete_many(["a"])
+        return await adapter.amget(["a", "b"])
+
+    assert asyncio.run(scenario()) == [None, 2]
+
+
+def test_bounded_memory_cache_never_exceeds_max_entries_across_shards() -> None:
+    cache = BoundedMemoryCacheBackend(max_entries=10, admission="lru")
+    assert cache.shards == 8
+    for index in range(200):
+        cache.set(f"k{index}", index)
+    assert len(cache) <= 10
+
+    tiny = BoundedMemoryCacheBackend(max_entries=1, admission="lru")
+    tiny.set("a", 1)
+    tiny.set("b", 2)
+    assert len(tiny) == 1
+
+
+def test_default_app_cache_keeps_read_your_write() -> None:
+    cache = build_default_components()["cache"]
+    assert type(cache) is MemoryCacheBackend
+    for index in range(200_000):
+        cache.set(f"k{index}", index)
+    assert cache.get("k199999") == 199999
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import fnmatch
+
 from vyro.runtime.platform.cache import MemoryCacheBackend
-from vyro.runtime.platform.cache_invalidation import CacheInvalidationHooks
+from vyro.runtime.platform.cache_invalidation import (
+    CacheInvalidationHooks,
+    CacheTagIndex,
+    MemoryTagStore,
+    RedisTagStore,
+)
 
 
 def test_cache_invalidation_hooks_trigger_on_set_and_delete() -> None:
@@ -22,3 +29,113 @@ def test_cache_invalidation_hooks_apply_write_to_backend() -> None:
     hooks = CacheInvalidationHooks()
     hooks.set(backend, "k2", "v2", ttl_sec=0.5)
     assert backend.get("k2") == "v2"
+
+
+class _FakeRedisSets:
+    def __init__(self) -> None:
+        self.sets: dict[str, set[bytes]] = {}
+        self.ttls: dict[str, int] = {}
+        self.evals = 0
+
+    def sadd(self, name, *members):  # type: ignore[no-untyped-def]
+        self.sets.setdefault(name, set()).update(m.encode() for m in members)
+
+    def smembers(self, name):  # type: ignore[no-untyped-def]
+        return set(self.sets.get(name, set()))
+
+    def srem(self, name, member):  # type: ignore[no-untyped-def]
+        self.sets.get(name, set()).discard(member.encode())
+
+    def delete(self, name):  # type: ignore[no-untyped-def]
+        self.sets.pop(name, None)
+        self.ttls.pop(name, None)
+
+    def ttl(self, name):  # type: ignore[no-untyped-def]
+        if name not in self.sets:
+            return -2
+        return self.ttls.get(name, -1)
+
+    def expire(self, name, seconds):  # type: ignore[no-untyped-def]
+        self.ttls[name] = seconds
+
+    def persist(self, name):  # type: ignore[no-untyped-def]
+        self.ttls.pop(name, None)
+
+    def scan_iter(self, match):  # type: ignore[no-untyped-def]
+        return iter([name.encode() for name in self.sets if fnmatch.fnmatchcase(name, match)])
+
+    def eval(self, script, numkeys, *args):  # type: ignore[no-untyped-def]
+        # Stand-in for the tag script: same steps, applied atomically by construction.
+        self.evals += 1
+        names, (seconds, key, *tags) = args[:numkeys], args[numkeys:]
+        for index, name in enumerate(names):
+            remaining = self.ttl(name)
+            self.sadd(name, *(tags if index == 0 else [key]))
+            if seconds == 0:
+                if remaining >= 0:
+                    self.persist(name)
+            elif remaining == -2 or 0 <= remaining < seconds:
+                self.expire(name, seconds)
+
+
+def test_cache_tag_index_invalidates_groups_and_prefixes_in_memory() -> None:
+    backend = MemoryCacheBackend()
+    hooks = CacheInvalidationHooks()
+    dropped: list[str] = []
+    hooks.on_delete(dropped.append)
+    index = CacheTagIndex(hooks=hooks)
+    for key, path, tenant in (("a", "/v1/orders/1", "t1"), ("b", "/v1/orders/2", "t2"), ("c", "/v1/users/1", "t1")):
+        backend.set(key, key)
+        index.tag(key, [f"tenant:{tenant}"], path=path)
+
+    assert index.invalidate_prefix(backend, "/v1/orders/*") == 2
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (None, None, "c")
+    assert sorted(dropped) == ["a", "b"]
+    assert index.invalidate(backend, "tenant:t1") == 1
+    assert backend.get("c") is None
+    assert index.invalidate(backend, "tenant:t2") == 0
+
+
+def test_memory_tag_store_forgets_expired_keys() -> None:
+    now = [0.0]
+    store = MemoryTagStore(_clock=lambda: now[0])
+    store.add("short", ["t"], ttl_sec=1.0)
+    now[0] = 5.0
+    for idx in range(1023):
+        store.add(f"k{idx}", ["other"])
+    assert store.pop_tag("t") == set()
+
+
+def test_redis_tag_store_keeps_index_in_redis_sets() -> None:
+    redis = _FakeRedisSets()
+    store = RedisTagStore(client=redis, prefix="app:tag:")
+    store.add("resp:a", ["tenant:t1", "route:/orders"], ttl_sec=30)
+    store.add("resp:b", ["tenant:t1"])
+    assert redis.ttls["app:tag:key:resp:a"] == 31
+    assert "app:tag:tenant:t1" not in redis.ttls
+    assert store.pop_tag("tenant:t1") == {"resp:a", "resp:b"}
+    assert redis.sets["app:tag:route:/orders"] == set()
+    assert "app:tag:key:resp:a" not in redis.sets
+
+
+def test_redis_tag_store_tags_in_one_call_and_keeps_longest_ttl() -> None:
+    redis = _FakeRedisSets()
+    store = RedisTagStore(client=redis, prefix="app:tag:")
+    store.add("resp:a", ["route:/a", "prefix:/a"], ttl_sec=60)
+    store.add("resp:b", ["route:/a"], ttl_sec=5)
+    assert redis.evals == 2
+    assert redis.ttls["app:tag:route:/a"] == 61
+
+
+def test_root_prefix_is_not_tagged_and_invalidates_everything() -> None:
+    redis = _FakeRedisSets()
+    backend = MemoryCacheBackend()
+    for index in (CacheTagIndex(), CacheTagIndex(store=RedisTagStore(client=redis))):
+        for key, path in (("a", "/v1/orders/1"), ("b", "/health")):
+            backend.set(key, key)
+            index.tag(key, ["tenant:t1"], path=path)
+        assert index.invalidate_prefix(backend, "/") == 2
+        assert (backend.get("a"), backend.get("b")) == (None, None)
+        assert index.invalidate(backend, "tenant:t1") == 0
+    assert redis.sets == {}
+    assert not any(name.endswith("prefix:/") for name in redis.ttls)
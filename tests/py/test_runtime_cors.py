@@ -21,3 +21,11 @@ def test_cors_preflight_rejects_disallowed_method() -> None:
     profile = CORSProfile(name="strict", allow_origins=("*",), allow_methods=("GET",))
     headers = profile.apply(origin="https://example.com", preflight=True, request_method="POST")
     assert headers == {}
+
+
+def test_cors_profile_exports_native_guard_spec() -> None:
+    profile = CORSProfile(name="strict", allow_origins=("https://a.example",), allow_methods=("get",))
+    spec = profile.as_native()
+    assert spec["allow_origins"] == ["https://a.example"]
+    assert spec["allow_methods"] == ["GET"]
+    assert spec["max_age"] == 600
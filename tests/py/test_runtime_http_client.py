@@ -1,44 +1,120 @@
 from __future__ import annotations
 
 import asyncio
+from urllib.error import HTTPError
 
 import pytest
 
-from vyro.runtime.edge.http_client import AsyncHttpClient, HttpResponse
+from vyro.runtime.edge.http_client import AsyncHttpClient, HttpPoolLimits
 from vyro.runtime.resilience.timeout_budget import TimeoutBudget
 
 
-def test_async_http_client_returns_response_and_decodes_json(monkeypatch: pytest.MonkeyPatch) -> None:
-    client = AsyncHttpClient()
-
-    def fake_send(request, timeout_sec):  # type: ignore[no-untyped-def]
-        assert request.get_method() == "GET"
-        assert timeout_sec == pytest.approx(2.0)
-        return HttpResponse(status=200, headers={"content-type": "application/json"}, body=b'{"ok":true}')
-
-    monkeypatch.setattr(AsyncHttpClient, "_send", staticmethod(fake_send))
-
-    response = asyncio.run(client.get("https://example.com/health", timeout_sec=2.0))
-    assert response.status == 200
-    assert response.json() == {"ok": True}
-
-
-def test_async_http_client_clamps_timeout_by_budget(monkeypatch: pytest.MonkeyPatch) -> None:
-    client = AsyncHttpClient()
-    now = [100.0]
-    budget = TimeoutBudget(timeout_sec=5.0, _clock=lambda: now[0])
-    now[0] = 102.0
-
-    captured: dict[str, float | None] = {"timeout": None}
-
-    def fake_send(request, timeout_sec):  # type: ignore[no-untyped-def]
-        captured["timeout"] = timeout_sec
-        return HttpResponse(status=204, headers={}, body=b"")
-
-    monkeypatch.setattr(AsyncHttpClient, "_send", staticmethod(fake_send))
-
-    asyncio.run(client.get("https://example.com/health", timeout_sec=10.0, budget=budget))
-    assert captured["timeout"] == pytest.approx(3.0)
+async def _serve(responses: list[bytes], delay: float = 0.0):  # type: ignore[no-untyped-def]
+    connections: list[int] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(1)
+        try:
+            while responses:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(delay)
+                writer.write(responses.pop(0))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", connections
+
+
+def test_async_http_client_reuses_keep_alive_connection_and_decodes_json() -> None:
+    async def scenario() -> None:
+        server, base, connections = await _serve(
+            [
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 11\r\n\r\n{\"ok\":true}",
+                b"HTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\nhi",
+            ]
+        )
+        async with server, AsyncHttpClient() as client:
+            first = await client.get(f"{base}/health", timeout_sec=2.0)
+            assert first.status == 200
+            assert first.headers["content-type"] == "application/json"
+            assert first.json() == {"ok": True}
+            assert client.idle_connections(base) == 1
+            second = await client.post(f"{base}/items", body=b"payload")
+            assert (second.status, second.body) == (201, b"hi")
+        assert len(connections) == 1
+
+    asyncio.run(scenario())
+
+
+def test_async_http_client_streams_chunked_body() -> None:
+    async def scenario() -> None:
+        server, base, _ = await _serve(
+            [b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nabc\r\n2\r\nde\r\n0\r\n\r\n"]
+        )
+        async with server, AsyncHttpClient() as client:
+            async with client.stream("GET", f"{base}/events") as response:
+                chunks = [chunk async for chunk in response]
+            assert b"".join(chunks) == b"abcde"
+            assert client.idle_connections(base) == 1
+
+    asyncio.run(scenario())
+
+
+def test_async_http_client_follows_redirects_and_raises_like_urlopen() -> None:
+    async def scenario() -> None:
+        found = b"HTTP/1.1 302 Found\r\nLocation: /b\r\nContent-Length: 0\r\n\r\n"
+        missing = b"HTTP/1.1 404 Not Found\r\nContent-Length: 4\r\n\r\nnope"
+        server, base, _ = await _serve(
+            [found, b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok", missing, missing, found]
+        )
+        async with server, AsyncHttpClient() as client:
+            followed = await client.get(f"{base}/a")
+            assert (followed.status, followed.body) == (200, b"ok")
+            with pytest.raises(HTTPError) as excinfo:
+                await client.get(f"{base}/gone")
+            assert (excinfo.value.code, excinfo.value.read()) == (404, b"nope")
+            kept = await client.get(f"{base}/gone", raise_for_status=False)
+            assert kept.status == 404
+            client.follow_redirects = False
+            redirect = await client.get(f"{base}/a")
+            assert (redirect.status, redirect.headers["location"]) == (302, "/b")
+
+    asyncio.run(scenario())
+
+
+def test_async_http_client_caps_connections_per_host() -> None:
+    async def scenario() -> None:
+        ok = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+        server, base, connections = await _serve([ok, ok, ok], delay=0.02)
+        limits = HttpPoolLimits(max_connections_per_host=1)
+        async with server, AsyncHttpClient(limits=limits) as client:
+            results = await asyncio.gather(*(client.get(base) for _ in range(3)))
+        assert [result.status for result in results] == [200, 200, 200]
+        assert len(connections) == 1
+
+    asyncio.run(scenario())
+
+
+def test_async_http_client_enforces_budget_deadline_on_read() -> None:
+    async def scenario() -> None:
+        server, base, _ = await _serve([b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"], delay=1.0)
+        async with server, AsyncHttpClient() as client:
+            with pytest.raises(TimeoutError, match="timeout budget expired"):
+                await client.get(base, timeout_sec=10.0, budget=TimeoutBudget(timeout_sec=0.05))
+
+    asyncio.run(scenario())
 
 
 def test_async_http_client_fails_when_budget_expired() -> None:
@@ -48,3 +124,13 @@ def test_async_http_client_fails_when_budget_expired() -> None:
     now[0] = 11.5
     with pytest.raises(TimeoutError, match="timeout budget expired"):
         asyncio.run(client.get("https://example.com/health", budget=budget))
+
+
+@pytest.mark.parametrize("name", ["X: a\r\nInjected", "X-Bad\n", "Bad Name", "X:", ""])
+def test_async_http_client_rejects_invalid_header_names(name: str) -> None:
+    async def scenario() -> None:
+        async with AsyncHttpClient() as client:
+            with pytest.raises(ValueError, match="invalid header name"):
+                await client.get("http://127.0.0.1:9/", headers={name: "v"})
+
+    asyncio.run(scenario())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from vyro.runtime.edge.multipart_upload import MultipartUploadStream
@@ -25,3 +27,14 @@ def test_multipart_upload_stream_rejects_feed_after_close() -> None:
     stream.close()
     with pytest.raises(RuntimeError, match="already closed"):
         stream.feed(b"a")
+
+
+def test_multipart_upload_stream_consumes_async_chunks() -> None:
+    async def chunks():  # type: ignore[no-untyped-def]
+        yield b"--x\r\npart\r\n"
+        yield b"--x--\r\n"
+
+    stream = MultipartUploadStream(boundary=b"x")
+    asyncio.run(stream.consume(chunks()))
+    assert stream.closed is True
+    assert stream.has_complete_payload() is True
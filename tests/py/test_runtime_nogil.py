@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from vyro.runtime.platform.nogil import NoGILWorkerTuner
+import sys
+
+from vyro.runtime.platform.nogil import NoGILWorkerTuner, is_free_threaded
 
 
 def test_nogil_tuner_balanced_profile() -> None:
@@ -24,3 +26,27 @@ def test_nogil_tuner_io_profile() -> None:
     profile = tuner.recommend(cpu_count=4, workload="io")
     assert profile.workers == 8
     assert profile.tokio_worker_threads == 8
+
+
+def test_nogil_plan_applies_profile_on_free_threaded_build() -> None:
+    tuner = NoGILWorkerTuner()
+    plan = tuner.plan(workers=1, workload="cpu", cpu_count=8, free_threaded=True)
+    assert plan.free_threaded is True
+    assert plan.tokio_worker_threads == 8
+    assert plan.event_loops == 4
+
+    explicit = tuner.plan(workers=2, event_loops=3, cpu_count=8, free_threaded=True)
+    assert explicit.event_loops == 3
+
+
+def test_nogil_plan_keeps_single_loop_with_gil() -> None:
+    plan = NoGILWorkerTuner().plan(workers=4, cpu_count=8, free_threaded=False)
+    assert plan.free_threaded is False
+    assert plan.tokio_worker_threads == 4
+    assert plan.event_loops == 1
+
+
+def test_is_free_threaded_matches_interpreter() -> None:
+    gil_check = getattr(sys, "_is_gil_enabled", None)
+    expected = gil_check is not None and not gil_check()
+    assert is_free_threaded() is expected
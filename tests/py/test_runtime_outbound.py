@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vyro.runtime.edge.http_client import HttpResponse
+from vyro.runtime.edge.outbound import BulkheadFullError, CircuitOpenError, OutboundPipeline
+from vyro.runtime.platform.discovery import (
+    ServiceDiscoveryRegistry,
+    ServiceEndpoint,
+    StaticDiscoveryAdapter,
+)
+from vyro.runtime.resilience.bulkhead import OutboundBulkhead
+from vyro.runtime.resilience.circuit_breaker import OutboundCircuitBreaker
+from vyro.runtime.resilience.retry import RetryPolicy
+from vyro.runtime.resilience.timeout_budget import TimeoutBudget
+
+
+class _ScriptedClient:
+    def __init__(self, script: dict[str, list[object]], delays: dict[str, float] | None = None) -> None:
+        self.script = script
+        self.delays = delays or {}
+        self.calls: list[tuple[str, str]] = []
+
+    async def request(self, method, url, *, headers=None, body=None, budget=None, raise_for_status=True):  # type: ignore[no-untyped-def]
+        self.calls.append((method, url))
+        host = url.split("//", 1)[1].split(":", 1)[0]
+        await asyncio.sleep(self.delays.get(host, 0.0))
+        outcome = self.script[host].pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return HttpResponse(status=int(outcome), headers={}, body=b"")  # type: ignore[call-overload]
+
+
+def _discovery(*hosts: str) -> ServiceDiscoveryRegistry:
+    adapter = StaticDiscoveryAdapter()
+    for host in hosts:
+        adapter.register("users", ServiceEndpoint(service="users", host=host, port=80))
+    registry = ServiceDiscoveryRegistry()
+    registry.register_adapter(adapter)
+    return registry
+
+
+def _pipeline(client: _ScriptedClient, *hosts: str, **kwargs) -> OutboundPipeline:  # type: ignore[no-untyped-def]
+    kwargs.setdefault("retry", RetryPolicy(max_attempts=3, base_delay_sec=0.001, jitter_ratio=0.0))
+    return OutboundPipeline(client=client, discovery=_discovery(*hosts), **kwargs)  # type: ignore[arg-type]
+
+
+def test_outbound_pipeline_retries_idempotent_calls_across_endpoints() -> None:
+    client = _ScriptedClient({"a": [503], "b": [200]})
+    pipeline = _pipeline(client, "a", "b")
+    response = asyncio.run(pipeline.get("users", "/u/1"))
+    assert response.status == 200
+    assert client.calls == [("GET", "http://a:80/u/1"), ("GET", "http://b:80/u/1")]
+
+
+def test_outbound_pipeline_does_not_retry_non_idempotent_calls() -> None:
+    client = _ScriptedClient({"a": [ConnectionError("reset")]})
+    pipeline = _pipeline(client, "a")
+    with pytest.raises(ConnectionError):
+        asyncio.run(pipeline.post("users", "/u", body=b"{}"))
+    assert len(client.calls) == 1
+
+
+def test_outbound_pipeline_stops_retrying_when_budget_cannot_cover_backoff() -> None:
+    client = _ScriptedClient({"a": [503, 200]})
+    retry = RetryPolicy(max_attempts=3, base_delay_sec=5.0, max_delay_sec=5.0, jitter_ratio=0.0)
+    pipeline = _pipeline(client, "a", retry=retry)
+    response = asyncio.run(pipeline.get("users", "/u", budget=TimeoutBudget(timeout_sec=1.0)))
+    assert response.status == 503
+    assert len(client.calls) == 1
+
+
+def test_outbound_pipeline_rejects_fast_when_breaker_open_or_bulkhead_full() -> None:
+    client = _ScriptedClient({"a": [ConnectionError("down")]})
+    pipeline = _pipeline(
+        client,
+        "a",
+        retry=RetryPolicy(max_attempts=1),
+        breaker=OutboundCircuitBreaker(failure_threshold=1, recovery_timeout_sec=60.0),
+    )
+    with pytest.raises(ConnectionError):
+        asyncio.run(pipeline.get("users", "/u"))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(pipeline.get("users", "/u"))
+    assert len(client.calls) == 1
+    assert pipeline.breaker.state == "closed"
+
+    bulkhead = OutboundBulkhead()
+    bulkhead.set_limit("users", 1)
+    assert bulkhead.acquire("users") is True
+    blocked = _pipeline(client, "a", bulkhead=bulkhead)
+    with pytest.raises(BulkheadFullError):
+        asyncio.run(blocked.get("users", "/u"))
+
+
+def test_outbound_pipeline_hedges_slow_get_to_second_endpoint() -> None:
+    client = _ScriptedClient({"slow": [200], "fast": [204]}, delays={"slow": 1.0})
+    pipeline = _pipeline(client, "slow", "fast", hedge_after_sec=0.01)
+    response = asyncio.run(pipeline.get("users", "/u"))
+    assert response.status == 204
+    assert [url for _, url in client.calls] == ["http://slow:80/u", "http://fast:80/u"]
@@ -33,3 +33,11 @@ def test_multi_key_rate_limiter_requires_at_least_one_key() -> None:
     limiter = MultiKeyRateLimiter(rate_per_sec=1.0, burst=1)
     with pytest.raises(ValueError, match="at least one key is required"):
         limiter.allow()
+
+
+def test_multi_key_rate_limiter_exports_native_spec() -> None:
+    limiter = MultiKeyRateLimiter(rate_per_sec=5.0, burst=10)
+    assert limiter.as_native() == {"rate_per_sec": 5.0, "burst": 10, "key": "client_ip"}
+    assert limiter.as_native("header:x-api-key")["key"] == "header:x-api-key"
+    with pytest.raises(ValueError, match="rate limit key"):
+        limiter.as_native("user")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vyro.runtime.platform.cache_invalidation import CacheInvalidationHooks
+from vyro.runtime.platform.redis_cache import AsyncRedisCacheBackend, RedisInvalidationBus, RespError
+from vyro.runtime.platform.tiered_cache import TieredCacheService
+
+
+class _RespStandIn:
+    """Minimal RESP server understanding the commands the backend issues."""
+
+    def __init__(self) -> None:
+        self.store: dict[bytes, bytes] = {}
+        self.ttls: dict[bytes, int] = {}
+        self.connections = 0
+        self.reads = 0
+        self.commands: list[bytes] = []
+        self.subscribers: dict[bytes, list[asyncio.StreamWriter]] = {}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        buffer = b""
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                self.reads += 1
+                buffer += data
+                while True:
+                    parsed = _parse_command(buffer)
+                    if parsed is None:
+                        break
+                    args, buffer = parsed
+                    if args[0].upper() == b"SUBSCRIBE":
+                        self.subscribers.setdefault(args[1], []).append(writer)
+                        writer.write(b"*3\r\n" + _bulk(b"subscribe") + _bulk(args[1]) + b":1\r\n")
+                        continue
+                    writer.write(self._reply(args))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def _reply(self, args: list[bytes]) -> bytes:
+        name = args[0].upper()
+        self.commands.append(name)
+        if name == b"GET":
+            return _bulk(self.store.get(args[1]))
+        if name == b"SET":
+            self.store[args[1]] = args[2]
+            if len(args) == 5:
+                self.ttls[args[1]] = int(args[4])
+            return b"+OK\r\n"
+        if name == b"MGET":
+            return b"*%d\r\n" % (len(args) - 1) + b"".join(_bulk(self.store.get(key)) for key in args[1:])
+        if name == b"MSET":
+            for idx in range(1, len(args), 2):
+                self.store[args[idx]] = args[idx + 1]
+            return b"+OK\r\n"
+        if name == b"PUBLISH":
+            listeners = self.subscribers.get(args[1], [])
+            for listener in listeners:
+                listener.write(b"*3\r\n" + _bulk(b"message") + _bulk(args[1]) + _bulk(args[2]))
+            return b":%d\r\n" % len(listeners)
+        if name == b"DEL":
+            removed = sum(1 for key in args[1:] if self.store.pop(key, None) is not None)
+            return b":%d\r\n" % removed
+        return b"-ERR unknown command\r\n"
+
+
+def _bulk(value: bytes | None) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _parse_command(buffer: bytes) -> tuple[list[bytes], bytes] | None:
+    end = buffer.find(b"\r\n")
+    if end < 0:
+        return None
+    count = int(buffer[1:end])
+    pos = end + 2
+    args: list[bytes] = []
+    for _ in range(count):
+        end = buffer.find(b"\r\n", pos)
+        if end < 0:
+            return None
+        size = int(buffer[pos + 1 : end])
+        start = end + 2
+        if len(buffer) < start + size + 2:
+            return None
+        args.append(buffer[start : start + size])
+        pos = start + size + 2
+    return args, buffer[pos:]
+
+
+def _run(scenario):  # type: ignore[no-untyped-def]
+    async def main():  # type: ignore[no-untyped-def]
+        stand_in = _RespStandIn()
+        server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        backend = AsyncRedisCacheBackend(port=port, prefix="app:", pool_size=2)
+        async with server:
+            try:
+                await scenario(backend, stand_in)
+            finally:
+                await backend.aclose()
+
+    asyncio.run(main())
+
+
+def test_async_redis_backend_round_trips_single_and_batch_operations() -> None:
+    async def scenario(backend, stand_in):  # type: ignore[no-untyped-def]
+        await backend.aset("user:1", "alice", ttl_sec=1.5)
+        assert stand_in.ttls[b"app:user:1"] == 1500
+        assert await backend.aget("user:1") == "alice"
+        await backend.amset({"a": 1, "b": b"two"})
+        assert await backend.amget(["a", "b", "missing"]) == ["1", "two", None]
+        await backend.amset({"c": "3"}, ttl_sec=10)
+        await backend.adelete_many(["a", "c"])
+        assert await backend.amget(["a", "b", "c"]) == [None, "two", None]
+        assert await backend.amget([]) == []
+
+    _run(scenario)
+
+
+def test_async_redis_backend_pipelines_concurrent_commands() -> None:
+    async def scenario(backend, stand_in):  # type: ignore[no-untyped-def]
+        await backend.amset({f"k{idx}": idx for idx in range(30)})
+        reads_before = stand_in.reads
+        values = await asyncio.gather(*(backend.aget(f"k{idx}") for idx in range(30)))
+        assert values == [str(idx) for idx in range(30)]
+        assert stand_in.connections <= 2
+        assert stand_in.reads - reads_before <= 4
+
+    _run(scenario)
+
+
+def test_async_redis_backend_surfaces_error_replies() -> None:
+    async def scenario(backend, stand_in):  # type: ignore[no-untyped-def]
+        with pytest.raises(RespError, match="unknown command"):
+            await backend.execute("PING")
+        assert await backend.aget("still-usable") is None
+
+    _run(scenario)
+
+
+def test_async_redis_backend_fails_pending_commands_when_unreachable() -> None:
+    async def scenario() -> None:
+        probe = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = probe.sockets[0].getsockname()[1]
+        probe.close()
+        await probe.wait_closed()
+        backend = AsyncRedisCacheBackend(port=port, connect_timeout_sec=1.0)
+        with pytest.raises(ConnectionError, match="redis connect failed"):
+            await backend.aget("k")
+
+    asyncio.run(scenario())
+
+
+def test_tiered_cache_stores_json_records_in_redis_l2() -> None:
+    async def scenario(backend, stand_in):  # type: ignore[no-untyped-def]
+        service = TieredCacheService(l2=backend)
+        await service.set("user:1", {"name": "alice"}, ttl_sec=10)
+        assert b'"v":{"name":"alice"}' in stand_in.store[b"app:user:1"]
+        fresh = TieredCacheService(l2=backend)
+
+        async def unused() -> dict[str, str]:
+            raise AssertionError("L2 hit expected")
+
+        assert await fresh.get_or_load("user:1", unused, ttl_sec=10) == {"name": "alice"}
+
+    _run(scenario)
+
+
+def test_redis_invalidation_bus_drops_l1_copies_in_other_processes() -> None:
+    async def scenario(backend, stand_in):  # type: ignore[no-untyped-def]
+        workers = []
+        for _ in range(2):
+            hooks = CacheInvalidationHooks()
+            bus = RedisInvalidationBus(backend)
+            bus.attach(hooks)
+            assert await bus.start()
+            workers.append((TieredCacheService(l2=backend, hooks=hooks), bus))
+        (service_a, bus_a), (service_b, bus_b) = workers
+        try:
+            await service_a.set("k", "v1", ttl_sec=10)
+            assert await service_b.get_or_load("k", _never, ttl_sec=10) == "v1"
+            assert service_b.l1.get("k") is not None
+            await service_a.invalidate("k")
+            for _ in range(50):
+                if bus_b.received:
+                    break
+                await asyncio.sleep(0.01)
+            assert bus_b.received == 1
+            assert bus_a.received == 0
+            assert service_b.l1.get("k") is None
+        finally:
+            await bus_a.aclose()
+            await bus_b.aclose()
+
+    _run(scenario)
+
+
+async def _never() -> str:
+    raise AssertionError("cached value expected")
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import time
+import warnings
 
+import pytest
+
+from vyro import Context, Vyro
 from vyro.runtime.platform.response_cache import ResponseCachePolicy, ResponseCacheService
 
 
@@ -25,3 +29,89 @@ def test_response_cache_service_respects_ttl_expiry() -> None:
     service.set(method="GET", path="/temp", response={"ok": True})
     time.sleep(0.02)
     assert service.get(method="GET", path="/temp") is None
+
+
+def test_response_cache_policy_exports_native_route_options() -> None:
+    async def _dispatch(native_ctx: object) -> object:
+        return native_ctx
+
+    policy = ResponseCachePolicy()
+    assert policy.native_cache_bytes() == 0
+    policy.set_ttl(method="GET", route="/users/{id}", ttl_sec=5.0, vary=("Accept",))
+    policy.set_ttl(method="POST", route="/users", ttl_sec=5.0)
+
+    routes = policy.apply_native(
+        [
+            ("GET", "/users/{id}", _dispatch, {"max_body_bytes": 10}),
+            ("POST", "/users", _dispatch, {}),
+        ]
+    )
+    assert routes[0][3] == {
+        "max_body_bytes": 10,
+        "cache_ttl_sec": 5.0,
+        "cache_vary": ["accept"],
+    }
+    assert routes[1][3] == {}
+    assert policy.native_cache_bytes() == policy.native_max_bytes
+
+
+def test_response_cache_service_tags_entries_for_bulk_invalidation() -> None:
+    service = ResponseCacheService()
+    service.set(method="GET", path="/v1/orders/1", route="/v1/orders/{id}", tenant="acme", response=1)
+    service.set(method="GET", path="/v1/orders/2", route="/v1/orders/{id}", tenant="globex", response=2)
+    service.set(method="GET", path="/v1/users/9", route="/v1/users/{id}", tenant="acme", response=3)
+
+    assert service.invalidate_tenant("acme") == 2
+    assert service.get(method="GET", path="/v1/orders/1") is None
+    assert service.get(method="GET", path="/v1/orders/2") == 2
+    assert service.invalidate_route("/v1/orders/{id}") == 1
+    service.set(method="GET", path="/v1/users/9", route="/v1/users/{id}", response=3)
+    assert service.invalidate_prefix("/v1/users") == 1
+    assert service.get(method="GET", path="/v1/users/9") is None
+
+
+def test_response_cache_service_derives_route_and_tenant_from_app_routes() -> None:
+    app = Vyro()
+
+    @app.get("/orders/:id", tenant="acme")
+    async def get_order(ctx: Context, id: int):  # type: ignore[no-untyped-def]
+        return {"id": id}
+
+    @app.get("/orders/export", tenant="acme")
+    async def export_orders(ctx: Context):  # type: ignore[no-untyped-def]
+        return {"ok": True}
+
+    service = app._response_cache  # noqa: SLF001
+    assert service.resolve_route(method="GET", path="/tenants/acme/orders/export").handler is export_orders
+    service.set(method="GET", path="/tenants/acme/orders/1", response=1)
+    service.set(method="GET", path="/tenants/acme/orders/export", response=2)
+    service.set(method="GET", path="/unrouted", response=3)
+
+    assert service.invalidate_route("/tenants/acme/orders/{id}") == 1
+    assert service.get(method="GET", path="/tenants/acme/orders/export") == 2
+    assert service.invalidate_tenant("acme") == 1
+    assert service.invalidate_route("/unrouted") == 1
+
+
+def test_response_cache_service_warns_when_invalidating_native_routes() -> None:
+    app = Vyro()
+
+    @app.get("/users/:id")
+    async def get_user(ctx: Context, id: int):  # type: ignore[no-untyped-def]
+        return {"id": id}
+
+    @app.get("/health")
+    async def health(ctx: Context):  # type: ignore[no-untyped-def]
+        return {"ok": True}
+
+    service = app._response_cache  # noqa: SLF001
+    service.policy.set_ttl(method="GET", route="/users/{id}", ttl_sec=5.0)
+
+    with pytest.warns(RuntimeWarning, match="/users/{id}"):
+        service.invalidate_route("/users/{id}")
+    with pytest.warns(RuntimeWarning):
+        service.invalidate_prefix("/users")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        service.invalidate_route("/health")
+        service.invalidate_prefix("/health")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from vyro.runtime.supervisor import WorkerSupervisor
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+
+
+def test_supervisor_restarts_crashed_workers_until_clean_exit(tmp_path: Path) -> None:
+    marker = tmp_path / "starts.log"
+
+    def target() -> None:
+        with marker.open("a", encoding="utf-8") as fh:
+            fh.write("start\n")
+        if len(marker.read_text(encoding="utf-8").splitlines()) < 3:
+            raise RuntimeError("boom")
+
+    supervisor = WorkerSupervisor(target=target, processes=1, poll_interval_sec=0.01)
+    assert supervisor.run() == 0
+    assert marker.read_text(encoding="utf-8").splitlines() == ["start"] * 3
+    assert supervisor.children == {}
+
+
+def test_supervisor_gives_up_after_restart_budget(tmp_path: Path) -> None:
+    marker = tmp_path / "starts.log"
+
+    def target() -> None:
+        with marker.open("a", encoding="utf-8") as fh:
+            fh.write("start\n")
+        os._exit(3)
+
+    supervisor = WorkerSupervisor(
+        target=target,
+        processes=2,
+        max_restarts=2,
+        poll_interval_sec=0.01,
+    )
+    assert supervisor.run() == 1
+    assert len(marker.read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_supervisor_rejects_invalid_process_count() -> None:
+    with pytest.raises(ValueError, match="processes"):
+        WorkerSupervisor(target=lambda: None, processes=0)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+
+from vyro.runtime.platform.cache import AsyncCacheAdapter, MemoryCacheBackend
+from vyro.runtime.platform.cache_invalidation import CacheInvalidationHooks
+from vyro.runtime.platform.tiered_cache import TieredCacheService
+
+
+def _counting_loader(values: list[str], calls: list[int], delay: float = 0.0):  # type: ignore[no-untyped-def]
+    async def load() -> str:
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return values[len(calls) - 1]
+
+    return load
+
+
+def test_tiered_cache_coalesces_concurrent_misses_into_one_load() -> None:
+    service = TieredCacheService(l2=AsyncCacheAdapter(MemoryCacheBackend()))
+    calls: list[int] = []
+    loader = _counting_loader(["v1"], calls, delay=0.01)
+
+    async def scenario() -> list[str]:
+        return await asyncio.gather(*(service.get_or_load("k", loader, ttl_sec=10) for _ in range(20)))
+
+    assert asyncio.run(scenario()) == ["v1"] * 20
+    assert len(calls) == 1
+
+
+def test_tiered_cache_serves_stale_while_one_refresh_runs() -> None:
+    now = [1000.0]
+    service = TieredCacheService(
+        l2=AsyncCacheAdapter(MemoryCacheBackend()),
+        stale_ttl_sec=30.0,
+        early_expiry_beta=0.0,
+        _clock=lambda: now[0],
+    )
+    calls: list[int] = []
+    loader = _counting_loader(["old", "new"], calls)
+
+    async def scenario() -> tuple[list[str], str]:
+        await service.get_or_load("k", loader, ttl_sec=10)
+        now[0] += 15.0
+        stale = await asyncio.gather(*(service.get_or_load("k", loader, ttl_sec=10) for _ in range(5)))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return stale, await service.get_or_load("k", loader, ttl_sec=10)
+
+    stale, fresh = asyncio.run(scenario())
+    assert stale == ["old"] * 5
+    assert fresh == "new"
+    assert len(calls) == 2
+
+
+def test_tiered_cache_refreshes_early_for_slow_loaders() -> None:
+    now = [0.0]
+    service = TieredCacheService(
+        l2=AsyncCacheAdapter(MemoryCacheBackend()),
+        _clock=lambda: now[0],
+        _rand=lambda: 0.01,
+    )
+    calls: list[int] = []
+
+    async def scenario() -> None:
+        await service.set("k", "v", ttl_sec=10, compute_sec=1.0)
+        now[0] = 2.0
+        await service.get_or_load("k", _counting_loader(["v2"], calls), ttl_sec=10)
+        assert calls == []
+        now[0] = 6.0
+        await service.get_or_load("k", _counting_loader(["v2"], calls), ttl_sec=10)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert calls == [1]
+
+
+def test_tiered_cache_shares_l2_and_invalidates_l1_through_hooks() -> None:
+    shared = AsyncCacheAdapter(MemoryCacheBackend())
+    bus = CacheInvalidationHooks()
+    worker_a = TieredCacheService(l2=shared, hooks=bus)
+    worker_b = TieredCacheService(l2=shared, hooks=bus)
+    calls: list[int] = []
+
+    async def scenario() -> tuple[str, str]:
+        await worker_a.get_or_load("k", _counting_loader(["v1", "v2"], calls), ttl_sec=10)
+        first = await worker_b.get_or_load("k", _counting_loader(["unused"], []), ttl_sec=10)
+        await worker_a.invalidate("k")
+        second = await worker_b.get_or_load("k", _counting_loader(["v2"], []), ttl_sec=10)
+        return first, second
+
+    assert asyncio.run(scenario()) == ("v1", "v2")
+    assert len(calls) == 1
@@ -1,6 +1,5 @@
-use std::collections::HashMap;
-
 use bytes::Bytes;
+use http::HeaderMap;
 
 use vyro_native::http::request::IncomingRequest;
 
@@ -8,10 +7,11 @@ use vyro_native::http::request::IncomingRequest;
 fn incoming_request_body_uses_ref_counted_bytes() {
     let shared = Bytes::from_static(b"payload");
     let request = IncomingRequest {
-        headers: HashMap::new(),
-        query: HashMap::new(),
-        path_params: HashMap::new(),
+        headers: HeaderMap::new(),
+        query: None,
+        path_params: Vec::new(),
         body: shared.clone(),
+        stream: None,
     };
 
     assert_eq!(request.body, shared);
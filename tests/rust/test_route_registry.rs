@@ -1,7 +1,7 @@
 use pyo3::prelude::*;
 
 use vyro_native::routing::method_table::RouteRegistry;
-use vyro_native::routing::radix::RouteDefinition;
+use vyro_native::routing::radix::{RouteDefinition, RouteOptions};
 
 #[test]
 fn route_registry_lookup_normalizes_http_method() {
@@ -10,6 +10,7 @@ fn route_registry_lookup_normalizes_http_method() {
             method: "GET".to_string(),
             path: "/users/{id}".to_string(),
             handler: py.None(),
+            options: RouteOptions::default(),
         }];
 
         let registry = RouteRegistry::from_routes(routes).expect("registry should build");